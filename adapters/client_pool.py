@@ -0,0 +1,181 @@
+# adapters/client_pool.py
+"""연결된 텔레그램 클라이언트를 재사용하기 위한 풀"""
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from core.constants import CLIENT_POOL_MAX_SIZE, CLIENT_POOL_TTL
+
+logger = logging.getLogger(__name__)
+
+# (라이브러리, api_id, 세션 이름)
+PoolKey = Tuple[str, int, str]
+
+
+@dataclass
+class PooledClient:
+    """풀에 보관된 연결된 클라이언트"""
+
+    key: PoolKey
+    client: Any
+    # 클라이언트가 연결된 이벤트 루프 (다른 루프에서는 사용할 수 없음)
+    loop: asyncio.AbstractEventLoop
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def is_client_connected(client: Any) -> bool:
+    """Telethon(메서드)과 Pyrogram(속성)의 연결 상태를 같은 방식으로 확인합니다."""
+    connected = client.is_connected
+    return bool(connected() if callable(connected) else connected)
+
+
+async def disconnect_client(client: Any, key: Any = None):
+    """Telethon/Pyrogram 클라이언트의 연결을 해제합니다 (오류는 기록만 합니다)."""
+    try:
+        result = client.disconnect()
+        if inspect.isawaitable(result):
+            await result
+    except (OSError, ConnectionError, RuntimeError) as e:
+        logger.warning(f"클라이언트 연결 해제 중 오류: {key}: {e}")
+
+
+class ClientPool:
+    """
+    (라이브러리, api_id, 세션 이름)을 키로 연결된 클라이언트를 보관하는 풀.
+    연결은 각 어댑터가 담당하고, 풀은 보관과 유휴 시간(TTL) 관리, 연결 해제를 합니다.
+    보관하는 클라이언트가 max_size개를 넘으면 가장 오래 사용하지 않은 클라이언트부터 연결을 해제합니다.
+    """
+
+    def __init__(self, ttl: float = CLIENT_POOL_TTL, max_size: int = CLIENT_POOL_MAX_SIZE):
+        """
+        Args:
+            ttl: 유휴 클라이언트를 보관할 최대 시간 (초)
+            max_size: 보관할 최대 클라이언트 수 (동시에 처리하는 세션 수보다 작으면 사용 중인 연결을 끊을 수 있습니다)
+        """
+        self.ttl = ttl
+        self.max_size = max(1, int(max_size))
+        # 최근에 사용한 항목이 뒤에 오도록 유지합니다 (LRU)
+        self._entries: "OrderedDict[PoolKey, PooledClient]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def configure(self, ttl: float, max_size: Optional[int] = None):
+        """유휴 TTL과 최대 크기를 변경합니다 (줄인 크기는 다음 등록 때 적용됩니다)."""
+        self.ttl = float(ttl)
+        if max_size is not None:
+            self.max_size = max(1, int(max_size))
+
+    def get(self, key: PoolKey, loop: asyncio.AbstractEventLoop) -> Optional[Any]:
+        """
+        같은 이벤트 루프에 연결된 클라이언트가 있으면 반환합니다.
+        다른 루프에 묶인 항목은 재사용할 수 없으므로 풀에서 제거합니다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.loop is not loop or entry.loop.is_closed():
+                logger.warning(f"다른 이벤트 루프의 클라이언트를 풀에서 제거: {key}")
+                del self._entries[key]
+                return None
+            entry.last_used = time.monotonic()
+            self._entries.move_to_end(key)
+            return entry.client
+
+    async def put(self, key: PoolKey, client: Any, loop: asyncio.AbstractEventLoop) -> Any:
+        """
+        연결된 클라이언트를 풀에 등록하고 유휴 정리 작업을 예약합니다.
+        같은 키로 동시에 연결해 이미 연결된 클라이언트가 있으면 새 클라이언트의 연결을 해제하고 기존 클라이언트를 씁니다.
+        풀이 max_size를 넘으면 가장 오래 사용하지 않은 클라이언트의 연결을 해제합니다.
+
+        Returns:
+            사용할 클라이언트 (client 또는 이미 등록된 클라이언트)
+        """
+        evicted: List[PooledClient] = []
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing.loop is loop and is_client_connected(existing.client):
+                existing.last_used = time.monotonic()
+                self._entries.move_to_end(key)
+                duplicate, client = client, existing.client
+            else:
+                duplicate = None
+                if existing is not None:
+                    evicted.append(existing)
+                self._entries[key] = PooledClient(key=key, client=client, loop=loop)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    evicted.append(self._entries.popitem(last=False)[1])
+        if duplicate is not None and duplicate is not client:
+            logger.debug(f"같은 세션이 이미 연결되어 있어 새 연결 해제: {key}")
+            await disconnect_client(duplicate, key)
+        for entry in evicted:
+            if entry.loop is not loop:
+                # 다른 루프에 묶인 클라이언트는 이 루프에서 해제할 수 없습니다 (get()과 같이 제거만 합니다)
+                logger.warning(f"다른 이벤트 루프의 클라이언트를 풀에서 제거: {entry.key}")
+                continue
+            logger.debug(f"클라이언트 풀에서 제거: {entry.key}")
+            await disconnect_client(entry.client, entry.key)
+        logger.debug(f"클라이언트 풀 등록: {key}")
+        self._ensure_sweeper(loop)
+        return client
+
+    def pop(self, key: PoolKey) -> Optional[PooledClient]:
+        """키에 해당하는 항목을 풀에서 꺼냅니다."""
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def pop_expired(self, loop: asyncio.AbstractEventLoop) -> List[PooledClient]:
+        """주어진 루프에 속한 항목 중 TTL이 지난 항목을 꺼냅니다."""
+        deadline = time.monotonic() - self.ttl
+        with self._lock:
+            expired = [e for e in self._entries.values() if e.loop is loop and e.last_used < deadline]
+            for entry in expired:
+                del self._entries[entry.key]
+        return expired
+
+    async def release(self, key: PoolKey):
+        """풀에서 클라이언트를 꺼내 연결을 해제합니다."""
+        entry = self.pop(key)
+        if entry is not None:
+            await disconnect_client(entry.client, key)
+
+    async def evict_idle(self):
+        """현재 루프에 속한 유휴 클라이언트 중 TTL이 지난 항목의 연결을 해제합니다."""
+        for entry in self.pop_expired(asyncio.get_running_loop()):
+            logger.debug(f"유휴 클라이언트 정리: {entry.key}")
+            await disconnect_client(entry.client, entry.key)
+
+    async def close_all(self):
+        """현재 루프에 속한 모든 클라이언트의 연결을 해제합니다."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = [e for e in self._entries.values() if e.loop is loop]
+            for entry in entries:
+                del self._entries[entry.key]
+        for entry in entries:
+            await disconnect_client(entry.client, entry.key)
+
+    def _ensure_sweeper(self, loop: asyncio.AbstractEventLoop):
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = loop.create_task(self._sweep())
+
+    async def _sweep(self):
+        """풀이 빌 때까지 주기적으로 유휴 클라이언트를 정리합니다."""
+        while len(self):
+            await asyncio.sleep(max(1.0, min(self.ttl, 60.0)))
+            await self.evict_idle()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+# 어댑터들이 공유하는 기본 풀
+client_pool = ClientPool()
@@ -0,0 +1,48 @@
+# adapters/deadlines.py
+"""어댑터 작업 단계별 제한 시간"""
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from core.constants import OPERATION_TIMEOUTS
+
+# 작업 단계
+PHASE_CONNECT = "connect"
+PHASE_AUTH_CHECK = "auth_check"
+PHASE_GET_ME = "get_me"
+PHASE_EXPORT = "export"
+# 인증 코드 요청, 로그인 등 그 밖의 요청
+PHASE_REQUEST = "request"
+
+PHASE_LABELS = {
+    PHASE_CONNECT: "연결",
+    PHASE_AUTH_CHECK: "인증 확인",
+    PHASE_GET_ME: "사용자 정보 조회",
+    PHASE_EXPORT: "세션 내보내기",
+    PHASE_REQUEST: "요청",
+}
+
+
+class OperationTimeoutError(TimeoutError):
+    """작업 단계가 제한 시간 안에 끝나지 않은 경우"""
+
+    def __init__(self, phase: str, timeout: float):
+        super().__init__(f"{PHASE_LABELS.get(phase, phase)} 시간 초과 ({timeout:g}초)")
+        self.phase = phase
+        self.timeout = timeout
+
+
+def phase_timeout(phase: str) -> Optional[float]:
+    """단계의 제한 시간 (초, 없으면 None)"""
+    return OPERATION_TIMEOUTS.get(phase)
+
+
+async def with_deadline(phase: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """
+    func(*args, **kwargs)를 단계의 제한 시간 안에 실행합니다.
+    시간이 지나면 진행 중인 요청을 취소하고 OperationTimeoutError을 발생시킵니다.
+    """
+    timeout = phase_timeout(phase)
+    try:
+        return await asyncio.wait_for(func(*args, **kwargs), timeout)
+    except asyncio.TimeoutError:
+        raise OperationTimeoutError(phase, timeout) from None
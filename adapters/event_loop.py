@@ -0,0 +1,97 @@
+# adapters/event_loop.py
+"""어댑터들이 공유하는 백그라운드 이벤트 루프"""
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundLoop:
+    """
+    전용 스레드에서 계속 실행되는 asyncio 이벤트 루프.
+    모든 어댑터 작업이 이 루프 하나에서 실행되므로 연결을 재사용하고 작업을 겹쳐 실행할 수 있습니다.
+    """
+
+    def __init__(self, name: str = "adapter-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 루프 (필요하면 시작합니다)"""
+        self.start()
+        assert self._loop is not None
+        return self._loop
+
+    def start(self):
+        """루프 스레드를 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            ready = threading.Event()
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run_forever, args=(ready,), name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            logger.info(f"백그라운드 이벤트 루프 시작: {self.name}")
+
+    def _run_forever(self, ready: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(ready.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def in_loop_thread(self) -> bool:
+        """현재 스레드가 루프 스레드인지 확인합니다."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """코루틴을 루프에 예약하고 스레드 안전한 Future를 반환합니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """
+        코루틴을 루프에서 실행하고 결과를 기다립니다 (동기 호출용).
+
+        Raises:
+            RuntimeError: 루프 스레드 안에서 호출한 경우 (교착 상태 방지)
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("백그라운드 루프 안에서는 동기 호출을 사용할 수 없습니다")
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        """루프를 멈추고 스레드가 끝날 때까지 기다립니다."""
+        with self._lock:
+            if not self._thread or not self._loop:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._thread = None
+            logger.info(f"백그라운드 이벤트 루프 종료: {self.name}")
+
+
+_background_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """어댑터들이 공유하는 백그라운드 루프를 반환합니다."""
+    return _background_loop
+
+
+async def call_blocking_callback(callback, *args):
+    """
+    콜백을 루프를 막지 않고 호출합니다.
+    코루틴 함수는 그대로 await하고, 일반 함수(GUI 입력 대기 등)는 스레드 풀에서 실행합니다.
+    """
+    if asyncio.iscoroutinefunction(callback):
+        return await callback(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, callback, *args)
@@ -0,0 +1,390 @@
+# adapters/fake_backend.py
+"""
+실제 텔레그램 서버 없이 어댑터를 실행하기 위한 로컬 모의 백엔드 (부하 측정, 회귀 테스트용).
+
+install()로 켜면 TelethonAdapter/PyrogramAdapter가 실제 클라이언트 대신 모의 클라이언트를 만듭니다.
+속도 제한기, DC 브레이커, 단계별 제한 시간, 연결 풀은 그대로 동작하므로 동시성 기능을 오프라인에서 측정할 수 있습니다.
+설정은 환경 변수로도 전달되므로 spawn으로 시작한 워커 프로세스와 CLI에서도 사용됩니다.
+
+    TGCC_FAKE_BACKEND='{"auth_success_ratio": 0.9, "flood_wait_ratio": 0.01}' python -m tgcc check
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from types import SimpleNamespace
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.session_converter import (
+    SessionData,
+    parse_session_string,
+    read_session_file,
+    to_pyrogram_string,
+    write_pyrogram_session,
+    write_telethon_session,
+)
+
+logger = logging.getLogger(__name__)
+
+# 설정을 JSON으로 담는 환경 변수 ("1"이면 기본 설정)
+ENV_VAR = "TGCC_FAKE_BACKEND"
+# 새 세션이 로그인하는 DC
+DEFAULT_DC = 2
+
+
+class FloodWaitError(Exception):
+    """Telethon FloodWaitError와 같은 이름과 속성 (속도 제한기는 예외 이름으로 구분합니다)"""
+
+    def __init__(self, seconds: int):
+        super().__init__(f"A wait of {seconds} seconds is required (fake)")
+        self.seconds = seconds
+
+
+class FloodWait(Exception):  # noqa: N818 - Pyrogram 예외 이름을 그대로 흉내 냅니다
+    """Pyrogram FloodWait와 같은 이름과 속성"""
+
+    def __init__(self, value: int):
+        super().__init__(f"A wait of {value} seconds is required (fake)")
+        self.value = value
+
+
+@dataclass
+class FakeBackendSettings:
+    """모의 백엔드 동작 설정"""
+
+    # 연결 지연 (초): 평균과 ± 범위
+    connect_latency: float = 0.05
+    connect_jitter: float = 0.02
+    # RPC 한 번의 지연 (초): 평균과 ± 범위
+    rpc_latency: float = 0.01
+    rpc_jitter: float = 0.005
+    # 기존 세션 중 인증된 것으로 볼 비율 (인증 키 해시로 정하므로 같은 세션은 항상 같은 결과)
+    auth_success_ratio: float = 1.0
+    # RPC마다 FloodWait를 돌려줄 확률과 대기 시간 (초)
+    flood_wait_ratio: float = 0.0
+    flood_wait_seconds: int = 5
+    # (api_id, DC)마다 서버가 허용하는 초당 요청 수 (넘으면 FloodWait, 0이면 제한 없음)
+    server_rate_limit: float = 0.0
+    # 장애 중인 DC (연결과 요청이 ConnectionError로 실패)
+    dc_outages: List[int] = field(default_factory=list)
+    # 장애 DC에서 실패를 알리기까지 걸리는 시간 (초, 단계 제한 시간보다 길면 시간 초과로 끝남)
+    outage_latency: float = 0.0
+    # 난수 시드 (None이면 실행마다 다름)
+    seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "FakeBackendSettings":
+        """알 수 없는 항목은 무시하고 설정을 만듭니다."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in values.items() if key in names})
+
+    @classmethod
+    def from_env(cls, value: str) -> "FakeBackendSettings":
+        try:
+            values = json.loads(value)
+        except json.JSONDecodeError:
+            values = None
+        return cls.from_dict(values) if isinstance(values, dict) else cls()
+
+
+class FakeTelegramBackend:
+    """
+    모의 텔레그램 서버.
+    지연, 인증 성공 비율, FloodWait, DC 장애를 설정대로 흉내 내고 요청 수를 집계합니다.
+    여러 루프(스레드)의 클라이언트가 함께 쓸 수 있도록 상태는 잠금으로 보호합니다.
+    """
+
+    def __init__(self, settings: Optional[FakeBackendSettings] = None):
+        self.settings = settings or FakeBackendSettings()
+        self._random = random.Random(self.settings.seed)
+        self._lock = threading.Lock()
+        self._outages = set(self.settings.dc_outages)
+        # 모의 로그인으로 만든 인증 키 (항상 인증됨)
+        self._registered: set = set()
+        # (api_id, DC)별 최근 1초 요청 시각
+        self._windows: Dict[Tuple[int, int], Deque[float]] = {}
+        self._stats = {"connects": 0, "rpcs": 0, "flood_waits": 0, "outage_errors": 0, "sign_ins": 0}
+
+    # --- 설정 ---
+
+    def set_outage(self, dc_id: int, down: bool = True):
+        """DC 장애를 시작하거나 끝냅니다 (실행 중에도 바꿀 수 있습니다)."""
+        with self._lock:
+            if down:
+                self._outages.add(dc_id)
+            else:
+                self._outages.discard(dc_id)
+        logger.info(f"모의 백엔드 DC {dc_id} {'장애 시작' if down else '복구'}")
+
+    def stats(self) -> Dict[str, int]:
+        """지금까지의 요청 집계"""
+        with self._lock:
+            return dict(self._stats)
+
+    # --- 인증 ---
+
+    def is_authorized(self, auth_key: Optional[bytes]) -> bool:
+        if not auth_key:
+            return False
+        with self._lock:
+            if auth_key in self._registered:
+                return True
+        digest = hashlib.sha256(auth_key).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64 < self.settings.auth_success_ratio
+
+    def register(self, dc_id: int, user_id: int) -> SessionData:
+        """모의 로그인: 새 인증 키를 만들어 등록합니다."""
+        with self._lock:
+            auth_key = self._random.randbytes(256)
+            self._registered.add(auth_key)
+            self._stats["sign_ins"] += 1
+        return SessionData(dc_id=dc_id, auth_key=auth_key, user_id=user_id)
+
+    def user_for(self, data: SessionData) -> SimpleNamespace:
+        """세션에 해당하는 사용자 정보 (사용자 ID가 없으면 인증 키로 만듭니다)"""
+        user_id = data.user_id or int.from_bytes(hashlib.sha256(data.auth_key).digest()[:4], "big") + 1
+        return SimpleNamespace(id=user_id, username=f"fake{user_id}", first_name="Fake", is_bot=data.is_bot)
+
+    # --- 네트워크 ---
+
+    def _delay(self, latency: float, jitter: float) -> float:
+        with self._lock:
+            return max(0.0, latency + self._random.uniform(-jitter, jitter))
+
+    async def _check_outage(self, dc_id: int):
+        with self._lock:
+            down = dc_id in self._outages
+            if down:
+                self._stats["outage_errors"] += 1
+        if down:
+            await asyncio.sleep(self.settings.outage_latency)
+            raise ConnectionError(f"DC {dc_id} 연결 실패 (모의 장애)")
+
+    async def connect(self, api_id: int, dc_id: int):
+        """연결 지연 후 연결합니다. 장애 중인 DC면 ConnectionError."""
+        await self._check_outage(dc_id)
+        await asyncio.sleep(self._delay(self.settings.connect_latency, self.settings.connect_jitter))
+        with self._lock:
+            self._stats["connects"] += 1
+
+    async def rpc(self, api_id: int, dc_id: int, flood_error: type):
+        """
+        요청 하나를 흉내 냅니다.
+
+        Raises:
+            ConnectionError: 장애 중인 DC
+            flood_error: 무작위 FloodWait 또는 서버 속도 제한 초과
+        """
+        await self._check_outage(dc_id)
+        settings = self.settings
+        with self._lock:
+            self._stats["rpcs"] += 1
+            flooded = settings.flood_wait_ratio > 0 and self._random.random() < settings.flood_wait_ratio
+            if settings.server_rate_limit > 0:
+                now = time.monotonic()
+                window = self._windows.setdefault((api_id, dc_id), deque())
+                while window and window[0] <= now - 1.0:
+                    window.popleft()
+                if len(window) >= settings.server_rate_limit:
+                    flooded = True
+                else:
+                    window.append(now)
+            if flooded:
+                self._stats["flood_waits"] += 1
+        if flooded:
+            raise flood_error(settings.flood_wait_seconds)
+        await asyncio.sleep(self._delay(settings.rpc_latency, settings.rpc_jitter))
+
+    # --- 클라이언트 ---
+
+    def telethon_client(self, session: Any, api_id: int, api_hash: str) -> "FakeTelethonClient":
+        return FakeTelethonClient(self, session, api_id)
+
+    def pyrogram_client(
+        self, name: str, api_id: int, api_hash: str, workdir: str, session_string: Optional[str] = None
+    ) -> "FakePyrogramClient":
+        return FakePyrogramClient(self, name, api_id, workdir, session_string)
+
+
+def _load_session(path: str) -> Optional[SessionData]:
+    """세션 파일을 읽습니다 (없거나 인증 키가 없으면 새 세션으로 봅니다)."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return read_session_file(path)[1]
+    except ValueError:
+        return None
+
+
+class FakeTelethonClient:
+    """어댑터가 사용하는 TelegramClient 메서드만 흉내 내는 모의 클라이언트"""
+
+    def __init__(self, backend: FakeTelegramBackend, session: Any, api_id: int):
+        self._backend = backend
+        self.api_id = int(api_id)
+        self._connected = False
+        self._path: Optional[str] = None
+        if isinstance(session, str):
+            self._path = session if session.endswith(".session") else f"{session}.session"
+            self._data = _load_session(self._path)
+        elif getattr(session, "auth_key", None):
+            # StringSession
+            self._data = SessionData(
+                dc_id=session.dc_id, auth_key=session.auth_key.key, server_address=session.server_address, port=session.port
+            )
+        else:
+            self._data = None
+        self._phone: Optional[str] = None
+
+    @property
+    def dc_id(self) -> int:
+        return self._data.dc_id if self._data else DEFAULT_DC
+
+    @property
+    def session(self) -> Any:
+        """StringSession.save()가 읽는 속성만 가진 세션"""
+        data = self._data
+        if data is None:
+            return SimpleNamespace(auth_key=None)
+        return SimpleNamespace(
+            dc_id=data.dc_id, server_address=data.server_address, port=data.port, auth_key=SimpleNamespace(key=data.auth_key)
+        )
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def connect(self):
+        await self._backend.connect(self.api_id, self.dc_id)
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+
+    async def is_user_authorized(self) -> bool:
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWaitError)
+        return self._data is not None and self._backend.is_authorized(self._data.auth_key)
+
+    async def get_me(self):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWaitError)
+        if self._data is None or not self._backend.is_authorized(self._data.auth_key):
+            return None
+        return self._backend.user_for(self._data)
+
+    async def send_code_request(self, phone: str):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWaitError)
+        self._phone = phone
+        return SimpleNamespace(phone_code_hash="fake")
+
+    async def sign_in(self, phone: Optional[str] = None, code: Optional[str] = None, password: Optional[str] = None):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWaitError)
+        phone = phone or self._phone or "0"
+        self._data = self._backend.register(self.dc_id, int("".join(filter(str.isdigit, phone)) or 1))
+        if self._path:
+            write_telethon_session(self._path, self._data)
+        return self._backend.user_for(self._data)
+
+
+class FakePyrogramClient:
+    """어댑터가 사용하는 pyrogram Client 메서드만 흉내 내는 모의 클라이언트"""
+
+    def __init__(
+        self, backend: FakeTelegramBackend, name: str, api_id: int, workdir: str, session_string: Optional[str] = None
+    ):
+        self._backend = backend
+        self.name = name
+        self.api_id = int(api_id)
+        self.is_connected = False
+        self._path: Optional[str] = None
+        if session_string:
+            self._data: Optional[SessionData] = parse_session_string(session_string)[1]
+        else:
+            self._path = os.path.join(workdir, f"{name}.session")
+            self._data = _load_session(self._path)
+        self.storage = SimpleNamespace(user_id=self._stored_user_id)
+
+    @property
+    def dc_id(self) -> int:
+        return self._data.dc_id if self._data else DEFAULT_DC
+
+    async def _stored_user_id(self) -> Optional[int]:
+        return self._data.user_id if self._data else None
+
+    async def connect(self) -> bool:
+        """Client.connect()처럼 저장된 사용자 ID가 있으면 인증된 것으로 봅니다."""
+        await self._backend.connect(self.api_id, self.dc_id)
+        self.is_connected = True
+        return bool(self._data and self._data.user_id)
+
+    async def disconnect(self):
+        self.is_connected = False
+
+    async def get_me(self):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWait)
+        if self._data is None or not self._backend.is_authorized(self._data.auth_key):
+            # 서버에서 폐기된 인증 키 (실제 서버와 같은 오류)
+            from pyrogram.errors import AuthKeyUnregistered
+
+            raise AuthKeyUnregistered()
+        return self._backend.user_for(self._data)
+
+    async def export_session_string(self) -> str:
+        return to_pyrogram_string(self._data)
+
+    async def send_code(self, phone: str):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWait)
+        return SimpleNamespace(phone_code_hash="fake")
+
+    async def sign_in(self, phone: str, phone_code_hash: str, code: str):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWait)
+        self._data = self._backend.register(self.dc_id, int("".join(filter(str.isdigit, phone)) or 1))
+        if self._path:
+            write_pyrogram_session(self._path, self._data)
+        return self._backend.user_for(self._data)
+
+    async def check_password(self, password: str):
+        await self._backend.rpc(self.api_id, self.dc_id, FloodWait)
+        return self._backend.user_for(self._data)
+
+
+_installed: Optional[FakeTelegramBackend] = None
+_install_lock = threading.Lock()
+
+
+def install(settings: Optional[FakeBackendSettings] = None) -> FakeTelegramBackend:
+    """모의 백엔드를 켭니다. 이후 만들어지는 클라이언트와 새 워커 프로세스가 이를 사용합니다."""
+    global _installed  # pylint: disable=global-statement
+    backend = FakeTelegramBackend(settings)
+    with _install_lock:
+        _installed = backend
+    os.environ[ENV_VAR] = json.dumps(asdict(backend.settings))
+    logger.warning("모의 텔레그램 백엔드 사용 중 (실제 서버에 연결하지 않습니다)")
+    return backend
+
+
+def uninstall():
+    """모의 백엔드를 끄고 실제 클라이언트로 돌아갑니다."""
+    global _installed  # pylint: disable=global-statement
+    with _install_lock:
+        _installed = None
+    os.environ.pop(ENV_VAR, None)
+
+
+def active_backend() -> Optional[FakeTelegramBackend]:
+    """켜져 있는 모의 백엔드 (환경 변수로 켠 경우 이 프로세스에서 처음 호출할 때 만듭니다)."""
+    global _installed  # pylint: disable=global-statement
+    if _installed is not None:
+        return _installed
+    value = os.environ.get(ENV_VAR)
+    if not value:
+        return None
+    with _install_lock:
+        if _installed is None:
+            _installed = FakeTelegramBackend(FakeBackendSettings.from_env(value))
+            logger.warning("모의 텔레그램 백엔드 사용 중 (실제 서버에 연결하지 않습니다)")
+        return _installed
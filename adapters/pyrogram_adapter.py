@@ -1,13 +1,27 @@
 # adapters/pyrogram_adapter.py
 import os
+import asyncio
 import logging
 import sentry_sdk
+from dataclasses import replace
+from pathlib import Path
 
 from pyrogram.client import Client
+from pyrogram.storage import FileStorage
 from pyrogram.errors import SessionPasswordNeeded, AuthKeyInvalid, RPCError
 from pyrogram.errors.exceptions.bad_request_400 import PhoneCodeInvalid, PasswordHashInvalid
 
-from ui.constants import SESSIONS_DIR
+from adapters import fake_backend
+from adapters.client_pool import client_pool, disconnect_client
+from adapters.event_loop import call_blocking_callback, get_background_loop
+from adapters.deadlines import PHASE_AUTH_CHECK, PHASE_CONNECT, PHASE_EXPORT, PHASE_GET_ME, PHASE_REQUEST, with_deadline
+from adapters.rate_limiter import rate_limiter
+from adapters.resilience import dc_breakers
+from core.metrics import phase_metrics
+from core.session_converter import parse_session_string, to_pyrogram_string, write_pyrogram_session
+from core.session_inspector import inspect_session_file
+from core.session_vault import vault_for
+from core.constants import SESSIONS_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +34,78 @@ if not sentry_sdk.Hub.current.client:
     )
 
 
+class VaultFileStorage(FileStorage):
+    """
+    세션 볼트의 암호화된 세션 파일을 메모리 SQLite로 열고, 저장할 때 다시 암호화하는 Pyrogram 저장소.
+    풀에 보관된 클라이언트는 연결을 끊을 때까지 save()/close()가 불리지 않으므로,
+    인증 정보(DC, 인증 키, 사용자 ID 등)가 바뀌면 바로 암호화해 기록합니다 (Telethon VaultSQLiteSession과 같이).
+    """
+
+    def __init__(self, name, workdir, vault):
+        super().__init__(name, Path(workdir))
+        self._vault = vault
+
+    def _persist(self, value):
+        # 값을 읽기만 한 경우(value가 object)는 기록하지 않습니다
+        if value is not object:
+            self._vault.save_connection(str(self.database), self.conn)
+
+    # SQLiteStorage의 접근자는 호출한 메서드 이름으로 열을 고르므로, 같은 이름으로 감싸 부모 메서드를 그대로 호출합니다
+    async def dc_id(self, value: int = object):
+        result = await super().dc_id(value)
+        self._persist(value)
+        return result
+
+    async def api_id(self, value: int = object):
+        result = await super().api_id(value)
+        self._persist(value)
+        return result
+
+    async def test_mode(self, value: bool = object):
+        result = await super().test_mode(value)
+        self._persist(value)
+        return result
+
+    async def auth_key(self, value: bytes = object):
+        result = await super().auth_key(value)
+        self._persist(value)
+        return result
+
+    async def user_id(self, value: int = object):
+        result = await super().user_id(value)
+        self._persist(value)
+        return result
+
+    async def is_bot(self, value: bool = object):
+        result = await super().is_bot(value)
+        self._persist(value)
+        return result
+
+    async def open(self):
+        file_exists = self.database.is_file()
+        self.conn = self._vault.open_connection(str(self.database))
+        if not file_exists:
+            self.create()
+        else:
+            self.update()
+
+    async def save(self):
+        await super().save()
+        self._vault.save_connection(str(self.database), self.conn)
+
+    async def close(self):
+        self._vault.save_connection(str(self.database), self.conn)
+        self.conn.close()
+
+
 class PyrogramAdapter:
-    """Pyrogram 라이브러리를 위한 동기 방식 어댑터"""
+    """
+    Pyrogram 라이브러리를 위한 어댑터.
+    비동기 메서드(create/check/export/import_string)가 기본이며,
+    동기 메서드는 공유 백그라운드 루프에서 이를 실행하는 얇은 래퍼입니다.
+    """
+
+    LIBRARY = "Pyrogram"
 
     def __init__(self, api_id, api_hash):
         self.api_id = int(api_id)
@@ -38,6 +122,10 @@ class PyrogramAdapter:
             })
 
     def _get_client(self, session_name, session_string=None):
+        backend = fake_backend.active_backend()
+        if backend is not None:
+            return backend.pyrogram_client(session_name, self.api_id, self.api_hash, self.workdir, session_string)
+        # FloodWait는 라이브러리가 혼자 기다리지 않고 공유 속도 제한기가 레인 단위로 처리합니다
         if session_string:
             return Client(
                 session_name,
@@ -45,24 +133,109 @@ class PyrogramAdapter:
                 api_id=self.api_id,
                 api_hash=self.api_hash,
                 workdir=self.workdir,
+                sleep_threshold=0,
             )
-        return Client(session_name, api_id=self.api_id, api_hash=self.api_hash, workdir=self.workdir)
+        client = Client(session_name, api_id=self.api_id, api_hash=self.api_hash, workdir=self.workdir, sleep_threshold=0)
+        vault = vault_for(os.path.join(self.workdir, f"{session_name}.session"))
+        if vault is not None:
+            client.storage = VaultFileStorage(session_name, self.workdir, vault)
+        return client
 
-    def create_session(self, session_name, phone_number, code_callback):
+    def _run_async(self, coro):
+        """비동기 코루틴을 공유 백그라운드 루프에서 실행하고 결과를 기다림"""
+        try:
+            return get_background_loop().run(coro)
+        except (OSError, ValueError, TypeError) as e:
+            sentry_sdk.capture_exception(e)
+            raise
+
+    def _pool_key(self, session_name):
+        return ("pyrogram", self.api_id, session_name)
+
+    def _session_dc(self, session_name):
+        """속도 제한 레인을 고르기 위해 세션 파일의 DC 번호를 읽습니다 (새 세션이면 None)."""
+        return inspect_session_file(os.path.join(self.workdir, f"{session_name}.session")).dc_id
+
+    async def _limited(self, phase, dc_id, func, *args, **kwargs):
+        """
+        API ID와 DC 레인의 속도 제한 안에서 요청을 보내고, FloodWait가 나면 기다렸다가 다시 보냅니다.
+        요청마다 단계(phase)의 제한 시간이 적용되고, 네트워크 오류는 백오프로 재시도하며
+        DC가 장애로 차단되어 있으면 복구될 때까지 기다립니다.
+        인증 코드 요청과 로그인(PHASE_REQUEST)은 두 번 보내면 안 되므로 네트워크 오류가 나도 재시도하지 않습니다.
+        걸린 시간(대기와 재시도 포함)은 라이브러리, DC, 단계별로 기록됩니다.
+        """
+        call = dc_breakers.call_once if phase == PHASE_REQUEST else dc_breakers.call
+        with phase_metrics.timer(self.LIBRARY, dc_id, phase):
+            return await call(dc_id, rate_limiter.call, self.api_id, dc_id, with_deadline, phase, func, *args, **kwargs)
+
+    async def _acquire_client(self, session_name, dc_id=None):
+        """
+        풀에서 연결된 클라이언트를 가져오고, 없으면 새로 연결해 풀에 등록합니다.
+        Client는 백그라운드 루프 안에서 만들어야 그 루프에 묶입니다.
+
+        Returns:
+            (client, 인증 여부)
+        """
+        loop = asyncio.get_running_loop()
+        key = self._pool_key(session_name)
+        client = client_pool.get(key, loop)
+        if client is not None and client.is_connected:
+            logger.debug(f"풀의 연결 재사용: {session_name}")
+            # 저장소에 사용자 ID가 있으면 인증된 세션입니다 (Client.connect()와 같은 기준)
+            with phase_metrics.timer(self.LIBRARY, dc_id, PHASE_AUTH_CHECK):
+                return client, bool(await with_deadline(PHASE_AUTH_CHECK, client.storage.user_id))
+
+        client = self._get_client(session_name)
+        try:
+            is_authorized = await self._limited(PHASE_CONNECT, dc_id, client.connect)
+        except BaseException:
+            # 시간 초과나 취소로 중단된 연결이 반쯤 열린 채 남지 않도록 정리
+            await disconnect_client(client, key)
+            raise
+        # 같은 세션을 동시에 연결했으면 먼저 등록된 클라이언트를 씁니다
+        client = await client_pool.put(key, client, loop)
+        return client, is_authorized
+
+    async def close(self, session_name):
+        """풀에 보관된 세션의 연결을 해제합니다."""
+        await client_pool.release(self._pool_key(session_name))
+
+    def close_session(self, session_name):
+        """동기 방식으로 풀에 보관된 세션의 연결 해제"""
+        try:
+            self._run_async(self.close(session_name))
+        except (OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+
+    async def create(self, session_name, phone_number, code_callback):
+        """
+        비동기 방식으로 세션 생성.
+        code_callback(prompt, is_password)는 일반 함수 또는 코루틴 함수이며, is_password는
+        인증 코드가 아니라 2단계 인증 비밀번호를 묻는 경우 True입니다.
+        """
         logger.info(f"세션 생성 시작: {session_name}, 전화번호: {phone_number}")
         with sentry_sdk.start_transaction(name="create_session", op="pyrogram_operation") as transaction:
             transaction.set_data("session_name", session_name)
             transaction.set_data("phone_number", phone_number)
             
             try:
-                with self._get_client(session_name) as client:
-                    sent_code_info = client.send_code(phone_number)
-                    code = code_callback("Telegram 인증 코드를 입력하세요:")
+                dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client, is_authorized = await self._acquire_client(session_name, dc_id)
+                if not is_authorized:
+                    sent_code_info = await self._limited(PHASE_REQUEST, dc_id, client.send_code, phone_number)
+                    code = await call_blocking_callback(code_callback, "Telegram 인증 코드를 입력하세요:", False)
+                    if not code:
+                        # 사용자가 입력을 취소했거나 작업이 중지됨
+                        await self.close(session_name)
+                        return False, "인증 코드 입력이 취소되었습니다."
                     try:
-                        client.sign_in(phone_number, sent_code_info.phone_code_hash, code)
+                        await self._limited(PHASE_REQUEST, dc_id, client.sign_in, phone_number, sent_code_info.phone_code_hash, code)
                     except SessionPasswordNeeded:
-                        password = code_callback("2단계 인증 비밀번호를 입력하세요:")
-                        client.check_password(password)
+                        password = await call_blocking_callback(code_callback, "2단계 인증 비밀번호를 입력하세요:", True)
+                        if not password:
+                            await self.close(session_name)
+                            return False, "2단계 인증 비밀번호 입력이 취소되었습니다."
+                        await self._limited(PHASE_REQUEST, dc_id, client.check_password, password)
                 save_path = os.path.join(self.workdir, f"{session_name}.session")
                 
                 # 성공 이벤트 기록
@@ -72,6 +245,10 @@ class PyrogramAdapter:
                 )
                 
                 return True, f"Pyrogram 세션 저장 완료: {save_path}"
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (SessionPasswordNeeded, AuthKeyInvalid, PhoneCodeInvalid, PasswordHashInvalid) as e:
                 # Pyrogram 관련 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -82,6 +259,7 @@ class PyrogramAdapter:
                     })
                 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"Pyrogram 인증 오류: {e}"
             except (OSError, ConnectionError, TimeoutError) as e:
                 # 네트워크 관련 에러 처리
@@ -93,9 +271,14 @@ class PyrogramAdapter:
                     })
                 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"네트워크 연결 오류: {e}"
 
-    def check_session(self, session_name):
+    async def check(self, session_name, dc_id=None):
+        """
+        비동기 방식으로 세션 확인.
+        dc_id는 호출한 쪽이 이미 읽은 세션 파일의 DC 번호이며, 없으면 세션 파일에서 읽습니다.
+        """
         logger.info(f"세션 검사 시작: {session_name}")
         session_path = os.path.join(self.workdir, f"{session_name}.session")
         logger.debug(f"세션 파일 경로: {session_path}")
@@ -113,18 +296,33 @@ class PyrogramAdapter:
             
             try:
                 logger.debug("Pyrogram 클라이언트 연결 시도...")
-                with self._get_client(session_name) as client:
-                    logger.debug("클라이언트 생성 성공, get_me() 호출...")
-                    me = client.get_me()
-                    logger.info(f"세션 인증 성공: @{me.username if me.username else '없음'}")
-                    
-                    # 성공 이벤트 기록
+                if dc_id is None:
+                    dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client, is_authorized = await self._acquire_client(session_name, dc_id)
+                if not is_authorized:
+                    logger.warning("세션 인증 실패 - 유효하지 않은 세션")
+                    await self.close(session_name)
                     sentry_sdk.add_breadcrumb(
-                        message=f"Pyrogram session check successful: {session_name}",
-                        level="info"
+                        message=f"Invalid Pyrogram session: {session_name}",
+                        level="warning"
                     )
-                    
-                    return True, f"세션 유효. 사용자: @{me.username if me.username else '없음'}"
+                    return False, "세션이 유효하지 않습니다."
+
+                logger.debug("클라이언트 연결 성공, get_me() 호출...")
+                me = await self._limited(PHASE_GET_ME, dc_id, client.get_me)
+                logger.info(f"세션 인증 성공: @{me.username if me.username else '없음'}")
+
+                # 성공 이벤트 기록
+                sentry_sdk.add_breadcrumb(
+                    message=f"Pyrogram session check successful: {session_name}",
+                    level="info"
+                )
+
+                return True, f"세션 유효. 사용자: @{me.username if me.username else '없음'}"
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (AuthKeyInvalid, RPCError) as e:
                 logger.error(f"Pyrogram 인증 오류: {type(e).__name__}: {e}", exc_info=True)
                 # Pyrogram 관련 구체적 에러 처리
@@ -135,6 +333,7 @@ class PyrogramAdapter:
                     })
                 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"세션 인증 오류: {e}"
             except (OSError, ConnectionError, TimeoutError) as e:
                 logger.error(f"네트워크 오류: {type(e).__name__}: {e}", exc_info=True)
@@ -146,27 +345,39 @@ class PyrogramAdapter:
                     })
                 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"네트워크 연결 오류: {e}"
             except Exception as e:
                 logger.error(f"예상치 못한 오류: {type(e).__name__}: {e}", exc_info=True)
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"세션 확인 중 오류: {type(e).__name__}: {e}"
 
-    def export_session_string(self, session_name):
+    async def export(self, session_name):
+        """비동기 방식으로 세션 문자열 내보내기"""
         with sentry_sdk.start_transaction(name="export_session_string", op="pyrogram_operation") as transaction:
             transaction.set_data("session_name", session_name)
             
             try:
-                with self._get_client(session_name) as client:
-                    session_string = client.export_session_string()
-                    
-                    # 성공 이벤트 기록
-                    sentry_sdk.add_breadcrumb(
-                        message=f"Pyrogram session string exported: {session_name}",
-                        level="info"
-                    )
-                    
-                    return session_string
+                dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client, is_authorized = await self._acquire_client(session_name, dc_id)
+                if not is_authorized:
+                    await self.close(session_name)
+                    return ""
+                with phase_metrics.timer(self.LIBRARY, dc_id, PHASE_EXPORT):
+                    session_string = await with_deadline(PHASE_EXPORT, client.export_session_string)
+
+                # 성공 이벤트 기록
+                sentry_sdk.add_breadcrumb(
+                    message=f"Pyrogram session string exported: {session_name}",
+                    level="info"
+                )
+
+                return session_string
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (AuthKeyInvalid, RPCError, OSError, ConnectionError) as e:
                 # 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -176,16 +387,41 @@ class PyrogramAdapter:
                     })
                 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return ""
 
-    def import_session_from_string(self, session_name, session_string):
+    async def import_string(self, session_name, session_string, verify=True):
+        """
+        비동기 방식으로 세션 문자열 가져오기
+        Telethon/Pyrogram 문자열 모두 받으며, 세션 파일은 로컬에서 직접 기록합니다.
+        verify가 False이면 텔레그램에 연결하지 않습니다.
+        """
         with sentry_sdk.start_transaction(name="import_session_from_string", op="pyrogram_operation") as transaction:
             transaction.set_data("session_name", session_name)
             
+            # 덮어쓸 세션 파일에 대한 기존 연결은 먼저 정리
+            await self.close(session_name)
             try:
-                with self._get_client(session_name, session_string=session_string) as client:
-                    me = client.get_me()
+                _, data = parse_session_string(session_string)
+                data.api_id = data.api_id or self.api_id
                 save_path = os.path.join(self.workdir, f"{session_name}.session")
+                username = None
+
+                if verify:
+                    # Telethon 문자열에는 사용자 ID가 없으므로 임시 값으로 연결한 뒤 get_me()로 채웁니다
+                    probe = replace(data, user_id=data.user_id or 1)
+                    client = self._get_client(session_name, session_string=to_pyrogram_string(probe))
+                    try:
+                        # start()는 미인증 세션에서 콘솔 로그인을 시도하므로 connect()만 사용
+                        await self._limited(PHASE_CONNECT, data.dc_id, client.connect)
+                        me = await self._limited(PHASE_GET_ME, data.dc_id, client.get_me)
+                    finally:
+                        await disconnect_client(client, session_name)
+                    data.user_id = me.id
+                    data.is_bot = bool(me.is_bot)
+                    username = me.username
+
+                write_pyrogram_session(save_path, data)
                 
                 # 성공 이벤트 기록
                 sentry_sdk.add_breadcrumb(
@@ -193,7 +429,7 @@ class PyrogramAdapter:
                     level="info"
                 )
                 
-                return True, f"문자열에서 세션을 '{save_path}'에 저장했습니다. (@{me.username if me.username else '없음'})"
+                return True, f"문자열에서 세션을 '{save_path}'에 저장했습니다. (@{username if username else '없음'})"
             except (AuthKeyInvalid, RPCError) as e:
                 # Pyrogram 관련 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -214,3 +450,44 @@ class PyrogramAdapter:
                 
                 sentry_sdk.capture_exception(e)
                 return False, f"세션 가져오기 오류: {e}"
+
+    def create_session(self, session_name, phone_number, code_callback):
+        """동기 방식으로 세션 생성"""
+        try:
+            return self._run_async(self.create(session_name, phone_number, code_callback))
+        except (ValueError, TypeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"입력 값 오류: {e}"
+        except (OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"시스템 오류: {e}"
+
+    def check_session(self, session_name):
+        """동기 방식으로 세션 확인"""
+        try:
+            return self._run_async(self.check(session_name))
+        except (ValueError, TypeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"입력 값 오류: {e}"
+        except (OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"시스템 오류: {e}"
+
+    def export_session_string(self, session_name):
+        """동기 방식으로 세션 문자열 내보내기"""
+        try:
+            return self._run_async(self.export(session_name))
+        except (ValueError, TypeError, OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+            return ""
+
+    def import_session_from_string(self, session_name, session_string, verify=True):
+        """동기 방식으로 세션 문자열 가져오기"""
+        try:
+            return self._run_async(self.import_string(session_name, session_string, verify))
+        except (ValueError, TypeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"입력 값 오류: {e}"
+        except (OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+            return False, f"시스템 오류: {e}"
@@ -0,0 +1,256 @@
+# adapters/rate_limiter.py
+"""API 자격 증명과 DC별로 요청 속도를 제한하고 FloodWait를 처리하는 토큰 버킷"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.constants import (
+    FLOOD_WAIT_MAX_RETRIES,
+    FLOOD_WAIT_MAX_SECONDS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+)
+from core.logging_config import LogMessages
+
+logger = logging.getLogger(__name__)
+
+# (api_id, dc_id) - 새 세션처럼 DC를 모르면 dc_id는 None
+LaneKey = Tuple[int, Optional[int]]
+
+# Telethon은 FloodWaitError.seconds, Pyrogram은 FloodWait.value에 대기 시간을 담습니다
+FLOOD_WAIT_ERRORS = ("FloodWaitError", "FloodPremiumWaitError", "FloodWait", "FloodPremiumWait")
+
+
+class FloodWaitExceededError(TimeoutError):
+    """FloodWait 대기가 너무 길거나 재시도 횟수를 넘겨 요청을 포기한 경우"""
+
+    def __init__(self, key: LaneKey, seconds: float):
+        super().__init__(f"요청 제한으로 {int(seconds)}초 대기가 필요합니다 (API {key[0]}, DC {key[1] or '?'})")
+        self.key = key
+        self.seconds = seconds
+
+
+def flood_wait_seconds(error: BaseException) -> Optional[int]:
+    """
+    FloodWait 계열 오류에서 대기 시간(초)을 읽습니다.
+    라이브러리를 가져오지 않도록 예외 이름으로 구분합니다.
+
+    Returns:
+        대기 시간 (FloodWait 오류가 아니면 None)
+    """
+    if type(error).__name__ not in FLOOD_WAIT_ERRORS:
+        return None
+    seconds = getattr(error, "seconds", None)
+    if seconds is None:
+        seconds = getattr(error, "value", None)
+    try:
+        return max(0, int(seconds))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class LaneState:
+    """모니터링용 버킷 상태 스냅샷"""
+
+    api_id: int
+    dc_id: Optional[int]
+    tokens: float
+    rate: float
+    burst: int
+    # 남은 FloodWait 대기 시간 (초, 대기 중이 아니면 0)
+    paused_for: float
+    waiting: int
+    flood_waits: int
+    requests: int
+
+
+class TokenBucket:
+    """
+    레인 하나(api_id + DC)의 토큰 버킷.
+    여러 스레드의 이벤트 루프에서 함께 쓸 수 있도록 상태는 잠금으로 보호하고, 대기는 각 루프에서 합니다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.flood_waits = 0
+        self.requests = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # FloodWait로 멈춘 동안에는 토큰이 차지 않습니다
+        if now <= self._updated:
+            return
+        if self.rate > 0:
+            self.tokens = min(float(self.burst), self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """토큰을 하나 가져가고, 기다려야 하면 대기 시간을 반환합니다 (가져가지 못하면 0보다 큼)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.requests += 1
+                return 0.0
+            if self.rate <= 0:
+                return 1.0
+            return (1 - self.tokens) / self.rate
+
+    async def acquire(self):
+        """토큰을 얻을 때까지 기다립니다. FloodWait로 멈춘 레인은 풀릴 때까지 기다립니다."""
+        with self._lock:
+            self.waiting += 1
+        try:
+            while True:
+                delay = self._reserve()
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+    def pause(self, seconds: float):
+        """레인을 주어진 시간 동안 멈추고, 풀린 뒤 한꺼번에 몰리지 않도록 토큰을 비웁니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self._updated = self.paused_until
+            self.flood_waits += 1
+
+    def configure(self, rate: float, burst: int):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.burst = max(1, int(burst))
+            self.tokens = min(self.tokens, float(self.burst))
+
+    def state(self, key: LaneKey) -> LaneState:
+        with self._lock:
+            now = time.monotonic()
+            paused_for = max(0.0, self.paused_until - now)
+            if not paused_for:
+                self._refill(now)
+            return LaneState(
+                api_id=key[0],
+                dc_id=key[1],
+                tokens=round(self.tokens, 2),
+                rate=self.rate,
+                burst=self.burst,
+                paused_for=round(paused_for, 1),
+                waiting=self.waiting,
+                flood_waits=self.flood_waits,
+                requests=self.requests,
+            )
+
+
+class RateLimiter:
+    """
+    모든 작업이 공유하는 레인별 속도 제한기.
+    FloodWait가 오면 해당 레인만 멈추고 같은 요청을 자동으로 다시 보냅니다.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        max_retries: int = FLOOD_WAIT_MAX_RETRIES,
+        max_wait: float = FLOOD_WAIT_MAX_SECONDS,
+    ):
+        """
+        Args:
+            rate: 레인별 초당 요청 수
+            burst: 한 번에 몰아서 보낼 수 있는 요청 수
+            max_retries: FloodWait 후 같은 요청을 다시 보낼 최대 횟수
+            max_wait: 자동으로 기다려 줄 최대 FloodWait 시간 (초, 넘으면 바로 실패)
+        """
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self.max_retries = int(max_retries)
+        self.max_wait = float(max_wait)
+        self._lanes: Dict[LaneKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """속도를 변경합니다. 이미 만들어진 레인에도 적용됩니다."""
+        with self._lock:
+            if rate is not None:
+                self.rate = float(rate)
+            if burst is not None:
+                self.burst = int(burst)
+            lanes = list(self._lanes.values())
+        for bucket in lanes:
+            bucket.configure(self.rate, self.burst)
+
+    def lane(self, api_id: int, dc_id: Optional[int] = None) -> TokenBucket:
+        key = (int(api_id), dc_id)
+        with self._lock:
+            bucket = self._lanes.get(key)
+            if bucket is None:
+                bucket = self._lanes[key] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    async def acquire(self, api_id: int, dc_id: Optional[int] = None):
+        """레인에서 요청 하나를 보낼 차례가 될 때까지 기다립니다."""
+        await self.lane(api_id, dc_id).acquire()
+
+    def pause(self, api_id: int, dc_id: Optional[int], seconds: float):
+        """FloodWait를 받은 레인만 멈춥니다."""
+        logger.warning(f"{LogMessages.RATE_LIMIT_HIT.format(seconds=int(seconds))} (API {api_id}, DC {dc_id or '?'})")
+        self.lane(api_id, dc_id).pause(seconds)
+
+    async def call(self, api_id: int, dc_id: Optional[int], func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        토큰을 얻은 뒤 func(*args, **kwargs)를 await합니다.
+        FloodWait가 나면 레인을 멈추고 기다렸다가 같은 요청을 다시 보냅니다.
+        대기 시간이 max_wait를 넘으면 레인을 멈추지 않고 바로 포기하므로, 한 계정의 긴 제한이 다른 세션을 막지 않습니다.
+
+        Raises:
+            FloodWaitExceededError: 대기 시간이 max_wait를 넘거나 재시도 횟수를 다 쓴 경우
+        """
+        key = (int(api_id), dc_id)
+        attempt = 0
+        while True:
+            await self.acquire(*key)
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                seconds = flood_wait_seconds(e)
+                if seconds is None:
+                    raise
+                attempt += 1
+                if seconds > self.max_wait:
+                    # 기다려 주지 않을 만큼 긴 대기(대개 계정 단위 제한)로 공유 레인 전체를 멈추지 않습니다
+                    raise FloodWaitExceededError(key, seconds) from e
+                self.pause(key[0], key[1], seconds)
+                if attempt > self.max_retries:
+                    raise FloodWaitExceededError(key, seconds) from e
+                logger.info(f"FloodWait 후 재시도 예정: API {key[0]}, DC {key[1] or '?'} ({attempt}/{self.max_retries})")
+
+    def snapshot(self) -> List[LaneState]:
+        """모든 레인의 현재 상태 (모니터링용)"""
+        with self._lock:
+            lanes = list(self._lanes.items())
+        return [bucket.state(key) for key, bucket in sorted(lanes, key=lambda item: (item[0][0], item[0][1] or 0))]
+
+    def paused_lanes(self) -> List[LaneState]:
+        """FloodWait로 멈춰 있는 레인 목록"""
+        return [state for state in self.snapshot() if state.paused_for > 0]
+
+
+# 어댑터들이 공유하는 기본 속도 제한기
+rate_limiter = RateLimiter()
@@ -0,0 +1,346 @@
+# adapters/resilience.py
+"""네트워크 오류 재시도(지수 백오프 + 지터)와 DC별 서킷 브레이커"""
+import asyncio
+import errno
+import logging
+import random
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from adapters.deadlines import OperationTimeoutError
+from adapters.rate_limiter import FloodWaitExceededError
+from core.constants import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_PARK_SECONDS,
+    BREAKER_RECOVERY_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRY_MULTIPLIER,
+)
+
+logger = logging.getLogger(__name__)
+
+# 서킷 브레이커 상태
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# 재시도하고 DC 장애로 집계하는 연결/전송 오류 (연결 거부·끊김, 이름 풀이 실패, 라이브러리의 응답 시간 초과).
+# 세션 파일이나 SQLite 같은 로컬 OSError는 포함하지 않습니다
+NETWORK_ERRORS = (ConnectionError, socket.gaierror, TimeoutError)
+# 네트워크 문제를 뜻하는 그 밖의 OSError errno
+_NETWORK_ERRNOS = frozenset({errno.ENETDOWN, errno.ENETUNREACH, errno.EHOSTDOWN, errno.EHOSTUNREACH, errno.ETIMEDOUT})
+# 서버 응답과 관계없는 로컬 오류 (세션 파일/SQLite). 재시도하지 않고 DC 상태에도 반영하지 않습니다
+LOCAL_ERRORS = (OSError, sqlite3.Error)
+
+# 대기 중인 세션이 브레이커 상태를 다시 확인하는 간격 (초)
+_PARK_POLL_INTERVAL = 0.5
+
+
+def is_network_error(exc: BaseException) -> bool:
+    """재시도할 연결/전송 오류인지 여부 (단계 제한 시간 초과와 FloodWait는 제외)"""
+    if isinstance(exc, (OperationTimeoutError, FloodWaitExceededError)):
+        return False
+    if isinstance(exc, NETWORK_ERRORS):
+        return True
+    return isinstance(exc, OSError) and exc.errno in _NETWORK_ERRNOS
+
+
+class CircuitOpenError(ConnectionError):
+    """DC가 장애로 차단된 상태에서 최대 대기 시간을 넘긴 경우"""
+
+    def __init__(self, dc_id: Optional[int], waited: float):
+        super().__init__(f"DC {dc_id or '?'} 장애로 {int(waited)}초 동안 대기했지만 복구되지 않았습니다")
+        self.dc_id = dc_id
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 설정"""
+
+    max_attempts: int = RETRY_MAX_ATTEMPTS
+    base_delay: float = RETRY_BASE_DELAY
+    max_delay: float = RETRY_MAX_DELAY
+    multiplier: float = RETRY_MULTIPLIER
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패 뒤 기다릴 시간. 여러 세션이 동시에 재시도하지 않도록 0~상한 사이에서 고릅니다 (full jitter)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** max(0, attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+@dataclass
+class BreakerState:
+    """모니터링용 브레이커 상태 스냅샷"""
+
+    dc_id: Optional[int]
+    state: str
+    failures: int
+    # 다음 복구 확인까지 남은 시간 (초, 차단 중이 아니면 0)
+    retry_in: float
+    parked: int
+
+
+class CircuitBreaker:
+    """
+    DC 하나의 서킷 브레이커.
+    연속 네트워크 실패가 failure_threshold번이면 차단(open)하고, recovery_timeout 뒤 요청 하나만 보내 복구를 확인합니다.
+    차단된 동안 이 DC의 요청은 실패하지 않고 복구될 때까지 대기(park)합니다.
+    """
+
+    def __init__(self, dc_id: Optional[int], failure_threshold: int, recovery_timeout: float):
+        self.dc_id = dc_id
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = float(recovery_timeout)
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.parked = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _try_enter(self) -> bool:
+        """요청을 보내도 되면 True (복구 확인 요청이면 그 차례를 가져갑니다)."""
+        with self._lock:
+            if self.state == BREAKER_CLOSED:
+                return True
+            if self.state == BREAKER_OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = BREAKER_HALF_OPEN
+            if self.state == BREAKER_HALF_OPEN and not self._probing:
+                self._probing = True
+                logger.info(f"DC {self.dc_id or '?'} 복구 확인 요청")
+                return True
+            return False
+
+    def is_open(self) -> bool:
+        """지금 요청을 보내면 대기하게 되는지 여부 (상태를 바꾸지 않습니다)."""
+        with self._lock:
+            if self.state == BREAKER_CLOSED:
+                return False
+            if self.state == BREAKER_OPEN:
+                return time.monotonic() - self.opened_at < self.recovery_timeout
+            return self._probing
+
+    async def enter(self, max_park: float):
+        """
+        요청을 보낼 수 있을 때까지 기다립니다.
+
+        Raises:
+            CircuitOpenError: max_park초 안에 DC가 복구되지 않은 경우
+        """
+        if self._try_enter():
+            return
+        started = time.monotonic()
+        with self._lock:
+            self.parked += 1
+        try:
+            while not self._try_enter():
+                waited = time.monotonic() - started
+                if waited >= max_park:
+                    raise CircuitOpenError(self.dc_id, waited)
+                await asyncio.sleep(_PARK_POLL_INTERVAL)
+        finally:
+            with self._lock:
+                self.parked -= 1
+
+    def record_success(self):
+        """서버가 응답했습니다 (RPC 오류 포함). 차단 중이었으면 해제합니다."""
+        with self._lock:
+            recovered = self.state != BREAKER_CLOSED
+            self.state = BREAKER_CLOSED
+            self.failures = 0
+            self._probing = False
+        if recovered:
+            logger.info(f"DC {self.dc_id or '?'} 복구됨, 대기 중인 세션을 다시 진행합니다")
+
+    def record_failure(self):
+        """네트워크 실패를 집계하고, 기준을 넘거나 복구 확인이 실패하면 차단합니다."""
+        with self._lock:
+            self.failures += 1
+            if self.state == BREAKER_HALF_OPEN or (
+                self.state == BREAKER_CLOSED and self.failures >= self.failure_threshold
+            ):
+                self.state = BREAKER_OPEN
+                self.opened_at = time.monotonic()
+                self._probing = False
+                opened = True
+            else:
+                opened = False
+        if opened:
+            logger.warning(
+                f"DC {self.dc_id or '?'} 장애 감지 (연속 실패 {self.failures}회), "
+                f"{self.recovery_timeout:g}초 동안 이 DC의 세션을 대기시킵니다"
+            )
+
+    def release(self):
+        """결과 없이 끝난 요청(취소 등)이 복구 확인 차례를 가지고 있었으면 돌려놓습니다."""
+        with self._lock:
+            if self.state == BREAKER_HALF_OPEN:
+                self._probing = False
+
+    def snapshot(self) -> BreakerState:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == BREAKER_OPEN:
+                retry_in = max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+            return BreakerState(self.dc_id, self.state, self.failures, round(retry_in, 1), self.parked)
+
+
+class DcCircuitBreakers:
+    """
+    DC별 서킷 브레이커와 재시도 정책을 묶은 실행기.
+    DC 장애는 API ID와 관계없으므로 DC 번호만으로 구분합니다.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = BREAKER_RECOVERY_TIMEOUT,
+        max_park: float = BREAKER_MAX_PARK_SECONDS,
+    ):
+        """
+        Args:
+            policy: 네트워크 오류 재시도 정책
+            failure_threshold: DC를 차단할 연속 네트워크 실패 횟수
+            recovery_timeout: 차단 후 복구를 확인하기까지의 시간 (초)
+            max_park: 차단된 DC의 세션이 복구를 기다릴 최대 시간 (초)
+        """
+        self.policy = policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_park = max_park
+        self._breakers: Dict[Optional[int], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        multiplier: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+        max_park: Optional[float] = None,
+    ):
+        """재시도/차단 설정을 변경합니다 (None인 항목은 그대로 둡니다)."""
+        if max_attempts is not None:
+            self.policy.max_attempts = max(1, int(max_attempts))
+        if base_delay is not None:
+            self.policy.base_delay = float(base_delay)
+        if max_delay is not None:
+            self.policy.max_delay = float(max_delay)
+        if multiplier is not None:
+            self.policy.multiplier = float(multiplier)
+        if max_park is not None:
+            self.max_park = float(max_park)
+        with self._lock:
+            if failure_threshold is not None:
+                self.failure_threshold = int(failure_threshold)
+            if recovery_timeout is not None:
+                self.recovery_timeout = float(recovery_timeout)
+            for breaker in self._breakers.values():
+                breaker.failure_threshold = max(1, int(self.failure_threshold))
+                breaker.recovery_timeout = float(self.recovery_timeout)
+
+    def settings(self) -> Dict[str, float]:
+        """현재 설정 (configure()에 그대로 넘길 수 있는 형태)"""
+        return {
+            "max_attempts": self.policy.max_attempts,
+            "base_delay": self.policy.base_delay,
+            "max_delay": self.policy.max_delay,
+            "multiplier": self.policy.multiplier,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "max_park": self.max_park,
+        }
+
+    def breaker(self, dc_id: Optional[int]) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(dc_id)
+            if breaker is None:
+                breaker = self._breakers[dc_id] = CircuitBreaker(dc_id, self.failure_threshold, self.recovery_timeout)
+            return breaker
+
+    def is_open(self, dc_id: Optional[int]) -> bool:
+        """DC가 차단되어 지금 요청하면 대기하게 되는지 여부"""
+        with self._lock:
+            breaker = self._breakers.get(dc_id)
+        return breaker is not None and breaker.is_open()
+
+    async def call(self, dc_id: Optional[int], func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        DC가 차단되어 있으면 복구될 때까지 기다린 뒤 func(*args, **kwargs)를 await합니다.
+        연결/전송 오류는 지수 백오프로 재시도하고, 결과는 DC 브레이커에 기록합니다.
+
+        Raises:
+            CircuitOpenError: DC가 max_park초 안에 복구되지 않은 경우
+            OperationTimeoutError: 단계 제한 시간을 넘긴 경우 (재시도하지 않음)
+            그 밖의 오류: 재시도 횟수를 다 쓴 네트워크 오류, 또는 서버가 응답한 오류
+        """
+        return await self._call(dc_id, self.policy.max_attempts, func, args, kwargs)
+
+    async def call_once(self, dc_id: Optional[int], func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        call()과 같지만 네트워크 오류가 나도 다시 보내지 않습니다.
+        인증 코드 요청이나 로그인처럼 두 번 보내면 안 되는 요청에 사용합니다.
+        """
+        return await self._call(dc_id, 1, func, args, kwargs)
+
+    async def _call(self, dc_id, max_attempts, func, args, kwargs) -> Any:
+        breaker = self.breaker(dc_id)
+        attempt = 0
+        while True:
+            attempt += 1
+            await breaker.enter(self.max_park)
+            try:
+                result = await func(*args, **kwargs)
+            except FloodWaitExceededError:
+                # 요청 제한은 서버가 응답했다는 뜻이므로 장애로 보지 않습니다
+                breaker.record_success()
+                raise
+            except OperationTimeoutError:
+                # 응답하지 않는 DC로 집계하지만, 이미 단계 제한 시간을 다 썼으므로 재시도하지 않습니다
+                breaker.record_failure()
+                raise
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                if not is_network_error(e):
+                    if isinstance(e, LOCAL_ERRORS):
+                        breaker.release()
+                    else:
+                        breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if attempt >= max_attempts:
+                    raise
+                delay = self.policy.delay(attempt)
+                logger.info(
+                    f"네트워크 오류 재시도 {attempt}/{max_attempts - 1}: DC {dc_id or '?'}, "
+                    f"{delay:.1f}초 후 ({type(e).__name__}: {e})"
+                )
+                await asyncio.sleep(delay)
+                continue
+            breaker.record_success()
+            return result
+
+    def snapshot(self) -> List[BreakerState]:
+        """모든 DC 브레이커의 현재 상태 (모니터링용)"""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [breaker.snapshot() for breaker in sorted(breakers, key=lambda b: b.dc_id or 0)]
+
+    def open_breakers(self) -> List[BreakerState]:
+        """차단 중이거나 복구를 확인 중인 DC 목록"""
+        return [state for state in self.snapshot() if state.state != BREAKER_CLOSED]
+
+
+# 어댑터들이 공유하는 기본 DC 브레이커
+dc_breakers = DcCircuitBreakers()
@@ -5,8 +5,19 @@ import logging
 import sentry_sdk
 from telethon import TelegramClient
 from telethon.errors import SessionPasswordNeededError, AuthKeyError, RPCError
-from telethon.sessions import StringSession
-from ui.constants import SESSIONS_DIR
+from telethon.sessions import SQLiteSession, StringSession
+
+from adapters import fake_backend
+from adapters.client_pool import client_pool, disconnect_client
+from adapters.event_loop import call_blocking_callback, get_background_loop
+from adapters.deadlines import PHASE_AUTH_CHECK, PHASE_CONNECT, PHASE_GET_ME, PHASE_REQUEST, with_deadline
+from adapters.rate_limiter import rate_limiter
+from adapters.resilience import dc_breakers
+from core.metrics import phase_metrics
+from core.session_converter import parse_session_string, to_telethon_string, write_telethon_session
+from core.session_inspector import inspect_session_file
+from core.session_vault import vault_for
+from core.constants import SESSIONS_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +31,37 @@ sentry_sdk.init(
 )
 
 
+class VaultSQLiteSession(SQLiteSession):
+    """세션 볼트의 암호화된 세션 파일을 메모리 SQLite로 열고, 저장할 때 다시 암호화하는 Telethon 세션"""
+
+    def __init__(self, session_path, vault):
+        self._vault = vault
+        super().__init__(session_path)
+
+    def _cursor(self):
+        if self._conn is None:
+            self._conn = self._vault.open_connection(self.filename)
+        return self._conn.cursor()
+
+    def save(self):
+        if self._conn is not None:
+            self._vault.save_connection(self.filename, self._conn)
+
+    def close(self):
+        if self._conn is not None:
+            self.save()
+            self._conn.close()
+            self._conn = None
+
+
 class TelethonAdapter:
-    """Telethon 라이브러리를 위한 동기 방식 어댑터"""
+    """
+    Telethon 라이브러리를 위한 어댑터.
+    비동기 메서드(create/check/export/import_string)가 기본이며,
+    동기 메서드는 공유 백그라운드 루프에서 이를 실행하는 얇은 래퍼입니다.
+    """
+
+    LIBRARY = "Telethon"
 
     def __init__(self, api_id, api_hash):
         self.api_id = int(api_id)
@@ -36,58 +76,107 @@ class TelethonAdapter:
                 "adapter_version": "1.0"
             })
 
-    def _get_client(self, session_name):
-        session_path = os.path.join(SESSIONS_DIR, f"{session_name}.session")
-        return TelegramClient(session_path, self.api_id, self.api_hash)
+    def _get_client(self, session):
+        if isinstance(session, str):
+            session = os.path.join(SESSIONS_DIR, f"{session}.session")
+        backend = fake_backend.active_backend()
+        if backend is not None:
+            return backend.telethon_client(session, self.api_id, self.api_hash)
+        if isinstance(session, str):
+            vault = vault_for(session)
+            if vault is not None:
+                session = VaultSQLiteSession(session, vault)
+        # FloodWait와 연결 재시도는 라이브러리가 혼자 처리하지 않고 공유 속도 제한기와 DC 브레이커가 처리합니다
+        return TelegramClient(session, self.api_id, self.api_hash, flood_sleep_threshold=0, connection_retries=0)
 
     def _run_async(self, coro):
-        """비동기 코루틴을 동기적으로 실행"""
+        """비동기 코루틴을 공유 백그라운드 루프에서 실행하고 결과를 기다림"""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # 이미 실행 중인 루프가 있으면 새 루프 생성
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(coro)
-                finally:
-                    new_loop.close()
-            else:
-                return loop.run_until_complete(coro)
-        except RuntimeError as e:
-            # 이벤트 루프 관련 에러를 Sentry에 전송
-            sentry_sdk.capture_exception(e)
-            # 이벤트 루프가 없으면 새로 생성
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            try:
-                return new_loop.run_until_complete(coro)
-            finally:
-                new_loop.close()
+            return get_background_loop().run(coro)
         except (OSError, ValueError, TypeError) as e:
             # 예상 가능한 에러들을 구체적으로 처리
             sentry_sdk.capture_exception(e)
             raise
 
-    async def _create_session_async(self, session_name, phone_number, code_callback):
+    def _pool_key(self, session_name):
+        return ("telethon", self.api_id, session_name)
+
+    def _session_dc(self, session_name):
+        """속도 제한 레인을 고르기 위해 세션 파일의 DC 번호를 읽습니다 (새 세션이면 None)."""
+        return inspect_session_file(os.path.join(SESSIONS_DIR, f"{session_name}.session")).dc_id
+
+    async def _limited(self, phase, dc_id, func, *args, **kwargs):
+        """
+        API ID와 DC 레인의 속도 제한 안에서 요청을 보내고, FloodWait가 나면 기다렸다가 다시 보냅니다.
+        요청마다 단계(phase)의 제한 시간이 적용되고, 네트워크 오류는 백오프로 재시도하며
+        DC가 장애로 차단되어 있으면 복구될 때까지 기다립니다.
+        인증 코드 요청과 로그인(PHASE_REQUEST)은 두 번 보내면 안 되므로 네트워크 오류가 나도 재시도하지 않습니다.
+        걸린 시간(대기와 재시도 포함)은 라이브러리, DC, 단계별로 기록됩니다.
+        """
+        call = dc_breakers.call_once if phase == PHASE_REQUEST else dc_breakers.call
+        with phase_metrics.timer(self.LIBRARY, dc_id, phase):
+            return await call(dc_id, rate_limiter.call, self.api_id, dc_id, with_deadline, phase, func, *args, **kwargs)
+
+    async def _acquire_client(self, session_name, dc_id=None):
+        """풀에서 연결된 클라이언트를 가져오고, 없으면 새로 연결해 풀에 등록합니다."""
+        loop = asyncio.get_running_loop()
+        key = self._pool_key(session_name)
+        client = client_pool.get(key, loop)
+        if client is not None and client.is_connected():
+            logger.debug(f"풀의 연결 재사용: {session_name}")
+            return client
+
+        client = self._get_client(session_name)
+        try:
+            await self._limited(PHASE_CONNECT, dc_id, client.connect)
+        except BaseException:
+            # 시간 초과나 취소로 중단된 연결이 반쯤 열린 채 남지 않도록 정리
+            await disconnect_client(client, key)
+            raise
+        # 같은 세션을 동시에 연결했으면 먼저 등록된 클라이언트를 씁니다
+        return await client_pool.put(key, client, loop)
+
+    async def close(self, session_name):
+        """풀에 보관된 세션의 연결을 해제합니다."""
+        await client_pool.release(self._pool_key(session_name))
+
+    def close_session(self, session_name):
+        """동기 방식으로 풀에 보관된 세션의 연결 해제"""
+        try:
+            self._run_async(self.close(session_name))
+        except (OSError, RuntimeError) as e:
+            sentry_sdk.capture_exception(e)
+
+    async def create(self, session_name, phone_number, code_callback):
+        """
+        비동기 방식으로 세션 생성.
+        code_callback(prompt, is_password)는 일반 함수 또는 코루틴 함수이며, is_password는
+        인증 코드가 아니라 2단계 인증 비밀번호를 묻는 경우 True입니다.
+        """
         logger.info(f"세션 생성 시작: {session_name}, 전화번호: {phone_number}")
         # Sentry 트랜잭션 시작
         with sentry_sdk.start_transaction(name="create_session", op="telethon_operation") as transaction:
             transaction.set_data("session_name", session_name)
             transaction.set_data("phone_number", phone_number)
 
-            client = self._get_client(session_name)
             try:
-                await client.connect()
-                if not await client.is_user_authorized():
-                    await client.send_code_request(phone_number)
-                    code = code_callback("Telegram 인증 코드를 입력하세요:")
+                dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client = await self._acquire_client(session_name, dc_id)
+                if not await self._limited(PHASE_AUTH_CHECK, dc_id, client.is_user_authorized):
+                    await self._limited(PHASE_REQUEST, dc_id, client.send_code_request, phone_number)
+                    code = await call_blocking_callback(code_callback, "Telegram 인증 코드를 입력하세요:", False)
+                    if not code:
+                        # 사용자가 입력을 취소했거나 작업이 중지됨
+                        await self.close(session_name)
+                        return False, "인증 코드 입력이 취소되었습니다."
                     try:
-                        await client.sign_in(phone_number, code)
+                        await self._limited(PHASE_REQUEST, dc_id, client.sign_in, phone_number, code)
                     except SessionPasswordNeededError:
-                        password = code_callback("2단계 인증 비밀번호를 입력하세요:")
-                        await client.sign_in(password=password)
-                await client.disconnect()
+                        password = await call_blocking_callback(code_callback, "2단계 인증 비밀번호를 입력하세요:", True)
+                        if not password:
+                            await self.close(session_name)
+                            return False, "2단계 인증 비밀번호 입력이 취소되었습니다."
+                        await self._limited(PHASE_REQUEST, dc_id, client.sign_in, password=password)
                 save_path = os.path.join(SESSIONS_DIR, f"{session_name}.session")
 
                 # 성공 이벤트 기록
@@ -97,6 +186,10 @@ class TelethonAdapter:
                 )
 
                 return True, f"Telethon 세션 저장 완료: {save_path}"
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (SessionPasswordNeededError, AuthKeyError, RPCError) as e:
                 # Telethon 관련 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -107,6 +200,7 @@ class TelethonAdapter:
                     })
 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"Telethon 인증 오류: {e}"
             except (OSError, ConnectionError, TimeoutError) as e:
                 # 네트워크 관련 에러 처리
@@ -118,12 +212,13 @@ class TelethonAdapter:
                     })
 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"네트워크 연결 오류: {e}"
 
     def create_session(self, session_name, phone_number, code_callback):
         """동기 방식으로 세션 생성"""
         try:
-            return self._run_async(self._create_session_async(session_name, phone_number, code_callback))
+            return self._run_async(self.create(session_name, phone_number, code_callback))
         except (ValueError, TypeError) as e:
             sentry_sdk.capture_exception(e)
             return False, f"입력 값 오류: {e}"
@@ -131,7 +226,11 @@ class TelethonAdapter:
             sentry_sdk.capture_exception(e)
             return False, f"시스템 오류: {e}"
 
-    async def _check_session_async(self, session_name):
+    async def check(self, session_name, dc_id=None):
+        """
+        비동기 방식으로 세션 확인.
+        dc_id는 호출한 쪽이 이미 읽은 세션 파일의 DC 번호이며, 없으면 세션 파일에서 읽습니다.
+        """
         logger.info(f"세션 검사 시작: {session_name}")
         session_path = os.path.join(SESSIONS_DIR, f"{session_name}.session")
         logger.debug(f"세션 파일 경로: {session_path}")
@@ -148,16 +247,16 @@ class TelethonAdapter:
         with sentry_sdk.start_transaction(name="check_session", op="telethon_operation") as transaction:
             transaction.set_data("session_name", session_name)
 
-            client = self._get_client(session_name)
             try:
                 logger.debug("텔레그램 클라이언트 연결 시도...")
-                await client.connect()
+                if dc_id is None:
+                    dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client = await self._acquire_client(session_name, dc_id)
                 logger.debug("연결 성공")
                 
-                if await client.is_user_authorized():
+                if await self._limited(PHASE_AUTH_CHECK, dc_id, client.is_user_authorized):
                     logger.info("세션 인증 성공")
-                    me = await client.get_me()
-                    await client.disconnect()
+                    me = await self._limited(PHASE_GET_ME, dc_id, client.get_me)
 
                     # 성공 이벤트 기록
                     sentry_sdk.add_breadcrumb(
@@ -168,13 +267,17 @@ class TelethonAdapter:
                     return True, f"세션 유효. 사용자: @{me.username if me.username else '없음'}"
                 else:
                     logger.warning("세션 인증 실패 - 유효하지 않은 세션")
-                    await client.disconnect()
+                    await self.close(session_name)
                     # 경고 이벤트 기록
                     sentry_sdk.add_breadcrumb(
                         message=f"Invalid session: {session_name}",
                         level="warning"
                     )
                     return False, "세션이 유효하지 않습니다."
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (AuthKeyError, RPCError) as e:
                 logger.error(f"Telethon 인증 오류: {type(e).__name__}: {e}", exc_info=True)
                 # Telethon 관련 구체적 에러 처리
@@ -185,6 +288,7 @@ class TelethonAdapter:
                     })
 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"세션 인증 오류: {e}"
             except (OSError, ConnectionError, TimeoutError) as e:
                 logger.error(f"네트워크 오류: {type(e).__name__}: {e}", exc_info=True)
@@ -196,16 +300,18 @@ class TelethonAdapter:
                     })
 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"네트워크 연결 오류: {e}"
             except Exception as e:
                 logger.error(f"예상치 못한 오류: {type(e).__name__}: {e}", exc_info=True)
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return False, f"세션 확인 중 오류: {type(e).__name__}: {e}"
 
     def check_session(self, session_name):
         """동기 방식으로 세션 확인"""
         try:
-            return self._run_async(self._check_session_async(session_name))
+            return self._run_async(self.check(session_name))
         except (ValueError, TypeError) as e:
             sentry_sdk.capture_exception(e)
             return False, f"입력 값 오류: {e}"
@@ -213,16 +319,16 @@ class TelethonAdapter:
             sentry_sdk.capture_exception(e)
             return False, f"시스템 오류: {e}"
 
-    async def _export_session_string_async(self, session_name):
+    async def export(self, session_name):
+        """비동기 방식으로 세션 문자열 내보내기"""
         with sentry_sdk.start_transaction(name="export_session_string", op="telethon_operation") as transaction:
             transaction.set_data("session_name", session_name)
 
-            client = self._get_client(session_name)
             try:
-                await client.connect()
-                if await client.is_user_authorized():
+                dc_id = await asyncio.to_thread(self._session_dc, session_name)
+                client = await self._acquire_client(session_name, dc_id)
+                if await self._limited(PHASE_AUTH_CHECK, dc_id, client.is_user_authorized):
                     session_string = StringSession.save(client.session)
-                    await client.disconnect()
 
                     # 성공 이벤트 기록
                     sentry_sdk.add_breadcrumb(
@@ -231,8 +337,12 @@ class TelethonAdapter:
                     )
 
                     return session_string
-                await client.disconnect()
+                await self.close(session_name)
                 return ""
+            except asyncio.CancelledError:
+                # 작업이 중지되면 연결을 끊고 취소를 그대로 전달
+                await self.close(session_name)
+                raise
             except (AuthKeyError, RPCError, OSError, ConnectionError) as e:
                 # 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -242,52 +352,59 @@ class TelethonAdapter:
                     })
 
                 sentry_sdk.capture_exception(e)
+                await self.close(session_name)
                 return ""
 
     def export_session_string(self, session_name):
         """동기 방식으로 세션 문자열 내보내기"""
         try:
-            return self._run_async(self._export_session_string_async(session_name))
+            return self._run_async(self.export(session_name))
         except (ValueError, TypeError, OSError, RuntimeError) as e:
             sentry_sdk.capture_exception(e)
             return ""
 
-    async def _import_session_from_string_async(self, session_name, session_string):
+    async def import_string(self, session_name, session_string, verify=True):
+        """
+        비동기 방식으로 세션 문자열 가져오기
+        Telethon/Pyrogram 문자열 모두 받으며, 세션 파일은 로컬에서 직접 기록합니다.
+        verify가 False이면 텔레그램에 연결하지 않습니다.
+        """
         with sentry_sdk.start_transaction(name="import_session_from_string", op="telethon_operation") as transaction:
             transaction.set_data("session_name", session_name)
 
             session_path = os.path.join(SESSIONS_DIR, f"{session_name}.session")
+            # 덮어쓸 세션 파일에 대한 기존 연결은 먼저 정리
+            await self.close(session_name)
             try:
-                string_client = TelegramClient(StringSession(session_string), self.api_id, self.api_hash)
-                await string_client.connect()
-
-                if await string_client.is_user_authorized():
-                    # 세션 정보를 파일로 저장
-                    new_client = TelegramClient(session_path, self.api_id, self.api_hash)
-                    new_client.session.set_dc(string_client.session.dc_id,
-                                            string_client.session.server_address,
-                                            string_client.session.port)
-                    new_client.session.auth_key = string_client.session.auth_key
-                    new_client.session.save()
-                    await string_client.disconnect()
+                _, data = parse_session_string(session_string)
 
-                    # 성공 이벤트 기록
-                    sentry_sdk.add_breadcrumb(
-                        message=f"Session imported from string: {session_name}",
-                        level="info"
-                    )
+                if verify:
+                    string_client = self._get_client(StringSession(to_telethon_string(data)))
+                    try:
+                        await self._limited(PHASE_CONNECT, data.dc_id, string_client.connect)
+                        is_authorized = await self._limited(PHASE_AUTH_CHECK, data.dc_id, string_client.is_user_authorized)
+                    finally:
+                        await string_client.disconnect()
 
-                    return True, f"문자열에서 세션을 '{session_path}'에 저장했습니다."
-                else:
-                    await string_client.disconnect()
+                    if not is_authorized:
+                        # 경고 이벤트 기록
+                        sentry_sdk.add_breadcrumb(
+                            message=f"Invalid session string for: {session_name}",
+                            level="warning"
+                        )
 
-                    # 경고 이벤트 기록
-                    sentry_sdk.add_breadcrumb(
-                        message=f"Invalid session string for: {session_name}",
-                        level="warning"
-                    )
+                        return False, "세션 문자열이 유효하지 않습니다."
+
+                # 세션 정보(DC, 인증 키)를 파일로 직접 저장
+                write_telethon_session(session_path, data)
+
+                # 성공 이벤트 기록
+                sentry_sdk.add_breadcrumb(
+                    message=f"Session imported from string: {session_name}",
+                    level="info"
+                )
 
-                    return False, "세션 문자열이 유효하지 않습니다."
+                return True, f"문자열에서 세션을 '{session_path}'에 저장했습니다."
             except (AuthKeyError, RPCError) as e:
                 # Telethon 관련 구체적 에러 처리
                 with sentry_sdk.configure_scope() as scope:
@@ -309,10 +426,10 @@ class TelethonAdapter:
                 sentry_sdk.capture_exception(e)
                 return False, f"세션 가져오기 오류: {e}"
 
-    def import_session_from_string(self, session_name, session_string):
+    def import_session_from_string(self, session_name, session_string, verify=True):
         """동기 방식으로 세션 문자열 가져오기"""
         try:
-            return self._run_async(self._import_session_from_string_async(session_name, session_string))
+            return self._run_async(self.import_string(session_name, session_string, verify))
         except (ValueError, TypeError) as e:
             sentry_sdk.capture_exception(e)
             return False, f"입력 값 오류: {e}"
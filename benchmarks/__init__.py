@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+"""
+세션 작업과 UI 갱신 성능 측정 모음.
+
+    python -m benchmarks [--only sessions,config] [--output results.json] [--repeat 3]
+
+결과는 버전 간 비교를 위해 같은 형식의 JSON으로 저장됩니다. 네트워크 작업은 모의 백엔드(adapters/fake_backend.py)로 측정합니다.
+"""
@@ -0,0 +1,90 @@
+# benchmarks/__main__.py
+"""python -m benchmarks 진입점: 측정을 실행하고 결과를 JSON으로 저장합니다."""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks import bench_config, bench_phone, bench_session_list, bench_sessions
+
+SUITES = {
+    "sessions": bench_sessions,
+    "session_list": bench_session_list,
+    "config": bench_config,
+    "phone": bench_phone,
+}
+
+
+def _int_list(value):
+    return [int(item) for item in value.split(",") if item]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="benchmarks", description="세션 작업과 UI 갱신 성능 측정")
+    parser.add_argument("--only", help=f"실행할 측정 (쉼표로 구분: {', '.join(SUITES)})")
+    parser.add_argument("--output", help="결과 JSON 파일 (없으면 stdout)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정마다 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--sessions", type=int, default=1000, help="검사/가져오기/내보내기 세션 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="검사/가져오기 동시성")
+    parser.add_argument("--latency", type=float, default=0.005, help="모의 백엔드 연결 지연 (초)")
+    parser.add_argument("--list-sizes", type=_int_list, default=[1000, 10000, 100000], help="세션 목록 크기")
+    parser.add_argument("--config-sizes", type=_int_list, default=[100, 1000], help="API 자격 증명 수")
+    parser.add_argument("--lookups", type=int, default=10000, help="API 조회 횟수")
+    parser.add_argument("--phones", type=int, default=100000, help="전화번호 수")
+    return parser
+
+
+def _git_revision():
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None) -> int:
+    options = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.ERROR, stream=sys.stderr)
+    names = options.only.split(",") if options.only else list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        print(f"알 수 없는 측정: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = []
+    for name in names:
+        print(f"[{name}] 측정 중...", file=sys.stderr)
+        for result in SUITES[name].run(options):
+            results.append(result.to_dict())
+            rate = results[-1]["per_second"]
+            status = result.skipped or f"{result.seconds:.4f}s" + (f", {rate:,.0f}/s" if rate else "")
+            print(f"  {result.name}: {status}", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "options": {key: value for key, value in vars(options).items() if key not in ("output", "only")},
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
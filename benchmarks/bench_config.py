@@ -0,0 +1,59 @@
+# benchmarks/bench_config.py
+"""Config의 API 자격 증명 추가/조회/삭제 시간"""
+import random
+from typing import List
+
+from benchmarks.common import BenchmarkResult, measure, workspace
+from core.config import Config
+
+
+def _find(config: Config, nickname: str):
+    # MainWindow.get_selected_api()와 같은 방식
+    cred = config.get_api_credential(nickname)
+    if cred is None:
+        return None, None
+    return cred["api_id"], cred["api_hash"]
+
+
+def run(options) -> List[BenchmarkResult]:
+    results = []
+    for size in options.config_sizes:
+        names = [f"api{i:06d}" for i in range(size)]
+        lookups = random.Random(size).choices(names, k=options.lookups)
+        with workspace():
+            state = {}
+
+            def fresh():
+                state["config"] = Config()
+                for cred in list(state["config"].get_api_credentials()):
+                    state["config"].remove_api_credential(cred["name"])
+
+            def add_all():
+                config = state["config"]
+                for i, name in enumerate(names):
+                    config.add_api_credential(name, str(10000 + i), f"{i:032x}")
+                config.flush()
+
+            results.append(measure(f"config.add.{size}", size, add_all, options.repeat, setup=fresh))
+
+            config = state["config"]
+
+            def lookup_all():
+                for name in lookups:
+                    if _find(config, name)[0] is None:
+                        raise RuntimeError(f"API를 찾지 못했습니다: {name}")
+
+            results.append(measure(f"config.lookup.{size}", len(lookups), lookup_all, options.repeat))
+
+            def fill():
+                fresh()
+                add_all()
+
+            def remove_all():
+                config = state["config"]
+                for name in names:
+                    config.remove_api_credential(name)
+                config.flush()
+
+            results.append(measure(f"config.remove.{size}", size, remove_all, options.repeat, setup=fill))
+    return results
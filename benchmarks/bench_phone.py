@@ -0,0 +1,49 @@
+# benchmarks/bench_phone.py
+"""전화번호 유틸리티 처리량 (번호/초)"""
+import random
+from typing import List
+
+from benchmarks.common import BenchmarkResult, measure
+from utils.phone import (
+    extract_country_code,
+    format_phone_display,
+    guess_country_from_number,
+    normalize_phone_number,
+    validate_phone_number,
+)
+
+FORMATS = ("+{cc} {a} {b} {c}", "+{cc}-{a}-{b}-{c}", "({a}) {b} {c}", "{cc}{a}{b}{c}", "+{cc} ({a}) {b}-{c}")
+COUNTRY_CODES = ("1", "7", "44", "49", "82", "86", "380", "888", "971", "998")
+
+
+def make_numbers(count: int, seed: int = 0) -> List[str]:
+    """여러 표기 형식이 섞인 재현 가능한 전화번호 목록"""
+    rng = random.Random(seed)
+    return [
+        rng.choice(FORMATS).format(
+            cc=rng.choice(COUNTRY_CODES),
+            a=rng.randint(10, 999),
+            b=rng.randint(100, 9999),
+            c=rng.randint(1000, 9999),
+        )
+        for _ in range(count)
+    ]
+
+
+def run(options) -> List[BenchmarkResult]:
+    numbers = make_numbers(options.phones)
+    results = []
+    for func in (
+        normalize_phone_number,
+        validate_phone_number,
+        extract_country_code,
+        format_phone_display,
+        guess_country_from_number,
+    ):
+
+        def call_all(func=func):
+            for number in numbers:
+                func(number)
+
+        results.append(measure(f"phone.{func.__name__}", len(numbers), call_all, options.repeat))
+    return results
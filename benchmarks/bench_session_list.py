@@ -0,0 +1,72 @@
+# benchmarks/bench_session_list.py
+"""세션 목록 갱신(MainWindow.update_session_list) 시간: 카탈로그 + 표 모델 + 폴더 감시기"""
+import itertools
+import os
+from typing import List
+
+from benchmarks.common import BenchmarkResult, link_sessions, measure, skipped, workspace
+from core.constants import SESSIONS_DIR
+from core.session_catalog import SessionCatalog, default_catalog_path
+
+# 폴더 변경 측정에서 한 번에 추가하는 파일 비율
+CHANGE_RATIO = 0.01
+
+
+def run(options) -> List[BenchmarkResult]:
+    try:
+        from PyQt5.QtCore import QCoreApplication
+
+        from ui.session_model import SessionTableModel
+        from ui.session_watcher import SessionFolderWatcher
+    except ImportError as e:
+        return [skipped(f"session_list.{size}", f"PyQt5를 사용할 수 없습니다: {e}") for size in options.list_sizes]
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    results = []
+    for size in options.list_sizes:
+        with workspace():
+            names = link_sessions(SESSIONS_DIR, size)
+            state = {}
+
+            def reset_catalog():
+                for key in ("watcher", "catalog"):
+                    if key in state:
+                        getattr(state[key], "stop" if key == "watcher" else "close")()
+                path = default_catalog_path(SESSIONS_DIR)
+                if os.path.exists(path):
+                    os.remove(path)
+                state["catalog"] = SessionCatalog(SESSIONS_DIR)
+                state["model"] = SessionTableModel(state["catalog"])
+
+            def populate():
+                # MainWindow.populate_session_list()
+                state["catalog"].refresh()
+                state["model"].reload()
+
+            results.append(measure(f"session_list.initial.{size}", size, populate, options.repeat, setup=reset_catalog))
+
+            # MainWindow와 같은 연결
+            watcher = state["watcher"] = SessionFolderWatcher(state["catalog"])
+            watcher.changed.connect(state["model"].apply_delta)
+
+            def update():
+                # MainWindow.update_session_list()
+                watcher.refresh()
+                app.processEvents()
+
+            results.append(measure(f"session_list.update_unchanged.{size}", size, update, options.repeat))
+
+            added = max(1, int(size * CHANGE_RATIO))
+            counter = itertools.count()
+
+            def add_files():
+                batch = next(counter)
+                for i in range(added):
+                    os.link(os.path.join(SESSIONS_DIR, names[0]), os.path.join(SESSIONS_DIR, f"n{batch}_{i:06d}.session"))
+
+            results.append(
+                measure(f"session_list.update_added.{size}", size, update, options.repeat, setup=add_files, added=added)
+            )
+            watcher.stop()
+            state["catalog"].close()
+    return results
@@ -0,0 +1,114 @@
+# benchmarks/bench_sessions.py
+"""모의 백엔드에 대한 일괄 검사/가져오기/내보내기 처리량 (세션/초)"""
+import json
+import os
+import shutil
+from typing import List
+
+from benchmarks.common import BenchmarkResult, disable_sentry, make_auth_key, measure, workspace, write_sessions
+from core.bulk_check import STATUS_VALID, BulkSessionChecker
+from core.bulk_export import EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP, BulkSessionExporter
+from core.bulk_import import STATUS_IMPORTED, BulkSessionImporter
+from core.constants import RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND, SESSIONS_DIR
+from core.session_converter import SessionData, to_telethon_string
+
+API_ID = 1
+LIBRARIES = ("Telethon", "Pyrogram")
+
+
+def _adapter(library: str):
+    if library == "Telethon":
+        from adapters.telethon_adapter import TelethonAdapter
+
+        return TelethonAdapter(API_ID, "bench")
+    from adapters.pyrogram_adapter import PyrogramAdapter
+
+    return PyrogramAdapter(API_ID, "bench")
+
+
+def _write_import_file(path: str, count: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            data = SessionData(dc_id=2, auth_key=make_auth_key(i + 1))
+            f.write(json.dumps({"name": f"i{i:06d}", "session_string": to_telethon_string(data)}) + "\n")
+
+
+def _reset_sessions_dir():
+    shutil.rmtree(SESSIONS_DIR, ignore_errors=True)
+    os.makedirs(SESSIONS_DIR)
+
+
+def run(options) -> List[BenchmarkResult]:
+    from adapters import fake_backend
+    from adapters.client_pool import client_pool
+    from adapters.event_loop import get_background_loop
+    from adapters.rate_limiter import rate_limiter
+
+    # 어댑터 모듈을 가져온 뒤에 꺼야 합니다
+    for library in LIBRARIES:
+        _adapter(library)
+    disable_sentry()
+
+    count = options.sessions
+    concurrency = options.concurrency
+    settings = fake_backend.FakeBackendSettings(
+        connect_latency=options.latency, connect_jitter=0, rpc_latency=options.latency / 5, rpc_jitter=0, seed=1
+    )
+    params = {"concurrency": concurrency, "latency": options.latency}
+
+    def close_pool():
+        get_background_loop().run(client_pool.close_all())
+
+    results = []
+    # 어댑터와 파이프라인의 처리량을 재기 위해 클라이언트 쪽 속도 제한은 풉니다
+    rate_limiter.configure(rate=1e9, burst=10**9)
+    fake_backend.install(settings)
+    try:
+        for library in LIBRARIES:
+            with workspace():
+                files = write_sessions(SESSIONS_DIR, count, library)
+                adapter = _adapter(library)
+
+                def check(adapter=adapter, files=files):
+                    checked = BulkSessionChecker(adapter, concurrency).run(files)
+                    valid = sum(1 for result in checked if result.status == STATUS_VALID)
+                    if valid != len(files):
+                        raise RuntimeError(f"검사 결과가 올바르지 않습니다: {valid}/{len(files)}")
+
+                results.append(
+                    measure(f"check.{library.lower()}", count, check, options.repeat, setup=close_pool, **params)
+                )
+                close_pool()
+
+            with workspace():
+                _write_import_file("import.jsonl", count)
+                adapter = _adapter(library)
+
+                def import_file(adapter=adapter):
+                    counts = BulkSessionImporter(adapter, concurrency, verify=True).run("import.jsonl")
+                    if counts[STATUS_IMPORTED] != count:
+                        raise RuntimeError(f"가져오기 결과가 올바르지 않습니다: {counts}")
+
+                results.append(
+                    measure(
+                        f"import.{library.lower()}", count, import_file, options.repeat, setup=_reset_sessions_dir, **params
+                    )
+                )
+                close_pool()
+    finally:
+        fake_backend.uninstall()
+        rate_limiter.configure(rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST)
+
+    with workspace():
+        files = write_sessions(SESSIONS_DIR, count)
+        exporter = BulkSessionExporter(SESSIONS_DIR)
+        for export_format in (EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP):
+
+            def export(export_format=export_format):
+                counts = exporter.run(files, f"out.{export_format}", export_format)
+                if counts["exported"] != count:
+                    raise RuntimeError(f"내보내기 결과가 올바르지 않습니다: {counts}")
+
+            results.append(measure(f"export.{export_format}", count, export, options.repeat))
+
+    return results
@@ -0,0 +1,129 @@
+# benchmarks/common.py
+"""측정 결과 형식과 공통 도구"""
+import contextlib
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from core.session_converter import SessionData, write_pyrogram_session, write_telethon_session
+
+
+@dataclass
+class BenchmarkResult:
+    """측정 항목 하나의 결과 (여러 번 실행한 시간의 중앙값 기준)"""
+
+    name: str
+    # 한 번 실행에서 처리한 항목 수
+    items: int
+    # 실행마다 걸린 시간 (초)
+    runs: List[float]
+    params: Dict[str, Any] = field(default_factory=dict)
+    # 측정을 건너뛴 이유 (선택 의존성이 없는 경우 등)
+    skipped: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return statistics.median(self.runs) if self.runs else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["runs"] = [round(run, 6) for run in self.runs]
+        data["seconds"] = round(self.seconds, 6)
+        data["per_second"] = round(self.items / self.seconds, 2) if self.seconds > 0 else None
+        return data
+
+
+def skipped(name: str, reason: str, **params) -> BenchmarkResult:
+    return BenchmarkResult(name=name, items=0, runs=[], params=params, skipped=reason)
+
+
+def measure(
+    name: str,
+    items: int,
+    func: Callable[[], Any],
+    repeat: int = 3,
+    setup: Optional[Callable[[], Any]] = None,
+    **params,
+) -> BenchmarkResult:
+    """setup() 후 func()를 실행하는 시간을 repeat번 잽니다 (setup 시간은 제외)."""
+    runs = []
+    for _ in range(max(1, repeat)):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - started)
+    return BenchmarkResult(name=name, items=items, runs=runs, params=params)
+
+
+@contextlib.contextmanager
+def workspace(prefix: str = "tgcc-bench-") -> Iterator[str]:
+    """
+    임시 폴더를 현재 작업 폴더로 바꿨다가 되돌립니다.
+    어댑터와 Config는 작업 폴더 기준 경로(sessions/, config.json)를 쓰므로 실제 데이터와 섞이지 않게 합니다.
+    """
+    previous = os.getcwd()
+    path = tempfile.mkdtemp(prefix=prefix)
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def make_auth_key(index: int) -> bytes:
+    """재현 가능한 256바이트 인증 키"""
+    seed = index.to_bytes(8, "big")
+    return (seed * 32)[:256]
+
+
+def write_sessions(directory: str, count: int, library: str = "Telethon", prefix: str = "s", dc_ids=(2,)) -> List[str]:
+    """서로 다른 인증 키를 가진 세션 파일을 만듭니다."""
+    os.makedirs(directory, exist_ok=True)
+    names = []
+    for i in range(count):
+        data = SessionData(dc_id=dc_ids[i % len(dc_ids)], auth_key=make_auth_key(i + 1), user_id=100000 + i, api_id=1)
+        name = f"{prefix}{i:06d}.session"
+        if library == "Telethon":
+            write_telethon_session(os.path.join(directory, name), data)
+        else:
+            write_pyrogram_session(os.path.join(directory, name), data)
+        names.append(name)
+    return names
+
+
+def link_sessions(directory: str, count: int, prefix: str = "s") -> List[str]:
+    """
+    세션 파일 하나를 하드 링크로 count개 만듭니다 (10만 개 규모의 목록 측정용).
+    하드 링크를 지원하지 않는 파일 시스템에서는 복사합니다.
+    """
+    os.makedirs(directory, exist_ok=True)
+    template = os.path.join(directory, ".template")
+    write_telethon_session(template, SessionData(dc_id=2, auth_key=make_auth_key(1)))
+    names = []
+    for i in range(count):
+        name = f"{prefix}{i:06d}.session"
+        target = os.path.join(directory, name)
+        try:
+            os.link(template, target)
+        except OSError:
+            shutil.copyfile(template, target)
+        names.append(name)
+    os.remove(template)
+    return names
+
+
+def disable_sentry():
+    """
+    어댑터 모듈이 가져올 때 켜는 Sentry를 끕니다.
+    측정 중의 트랜잭션이 외부로 전송되지 않고, 전송 비용이 결과에 섞이지 않게 합니다.
+    """
+    import sentry_sdk
+
+    # 빈 DSN은 SENTRY_DSN 환경 변수보다 우선하며 전송을 끕니다
+    sentry_sdk.init(dsn="")
@@ -0,0 +1,123 @@
+# core/auth_code_broker.py
+"""로그인 중인 세션들의 인증 코드 요청을 Future로 주고받는 중개자"""
+import asyncio
+import itertools
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 리스너에 전달되는 이벤트
+EVENT_REQUESTED = "requested"
+EVENT_RESOLVED = "resolved"
+
+_request_ids = itertools.count(1)
+
+
+@dataclass(eq=False)
+class CodeRequest:
+    """입력을 기다리는 인증 코드(또는 2단계 인증 비밀번호) 요청 하나"""
+
+    phone: str
+    prompt: str
+    is_password: bool = False
+    # 요청한 쪽을 구분하는 값 (취소할 때 사용)
+    tag: Any = field(default=None, repr=False)
+    id: int = field(default_factory=lambda: next(_request_ids))
+    _future: Optional[asyncio.Future] = field(default=None, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+
+
+def _resolve(future: asyncio.Future, code: Optional[str]):
+    if not future.done():
+        future.set_result(code)
+
+
+class AuthCodeBroker:
+    """
+    어댑터가 await하는 인증 코드 요청과 UI 입력을 연결하는 중개자.
+    요청마다 이벤트 루프의 Future를 만들어 대기하므로 폴링 없이 여러 로그인을 동시에 처리할 수 있습니다.
+    리스너는 요청이 생기거나 끝날 때 (이벤트, CodeRequest)로 호출되며, 이벤트 루프 스레드에서 실행됩니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[int, CodeRequest] = {}
+        self._listeners: List[Callable[[str, CodeRequest], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[str, CodeRequest], None]):
+        """요청 생성/완료 알림을 받을 리스너를 등록합니다."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, CodeRequest], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, event: str, request: CodeRequest):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event, request)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"인증 코드 리스너 오류: {type(e).__name__}: {e}")
+
+    async def request(self, phone: str, prompt: str, is_password: bool = False, tag: Any = None) -> Optional[str]:
+        """
+        인증 코드를 요청하고 입력될 때까지 기다립니다.
+
+        Returns:
+            입력된 코드 (취소되면 None)
+        """
+        loop = asyncio.get_running_loop()
+        request = CodeRequest(phone=phone, prompt=prompt, is_password=is_password, tag=tag)
+        request._future = loop.create_future()
+        request._loop = loop
+        with self._lock:
+            self._pending[request.id] = request
+        logger.info(f"인증 코드 요청 등록: #{request.id} {phone}")
+        self._notify(EVENT_REQUESTED, request)
+        try:
+            return await request._future
+        finally:
+            with self._lock:
+                self._pending.pop(request.id, None)
+            self._notify(EVENT_RESOLVED, request)
+
+    def submit(self, request_id: int, code: Optional[str]) -> bool:
+        """
+        요청에 코드를 전달합니다 (어느 스레드에서나 호출 가능).
+
+        Returns:
+            대기 중인 요청이 있었으면 True
+        """
+        with self._lock:
+            request = self._pending.get(request_id)
+        if request is None or request._loop.is_closed():
+            return False
+        request._loop.call_soon_threadsafe(_resolve, request._future, code)
+        return True
+
+    def cancel(self, request_id: int) -> bool:
+        """요청을 취소합니다 (기다리던 쪽은 None을 받습니다)."""
+        return self.submit(request_id, None)
+
+    def cancel_tag(self, tag: Any):
+        """tag로 등록된 모든 요청을 취소합니다."""
+        with self._lock:
+            request_ids = [r.id for r in self._pending.values() if r.tag is tag]
+        for request_id in request_ids:
+            self.cancel(request_id)
+
+    def pending(self) -> List[CodeRequest]:
+        """대기 중인 요청 목록 (등록 순서)"""
+        with self._lock:
+            return sorted(self._pending.values(), key=lambda r: r.id)
+
+
+# 어댑터와 UI가 공유하는 기본 중개자
+auth_code_broker = AuthCodeBroker()
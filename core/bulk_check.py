@@ -0,0 +1,262 @@
+# core/bulk_check.py
+"""세션 폴더 일괄 검사 모듈"""
+import asyncio
+import concurrent.futures
+import csv
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from adapters.event_loop import get_background_loop
+from adapters.resilience import dc_breakers
+from core.constants import DEFAULT_BULK_CHECK_CONCURRENCY, SESSIONS_DIR
+from core.session_inspector import SessionFileInfo, inspect_session_file
+
+logger = logging.getLogger(__name__)
+
+# 검사 결과 상태
+STATUS_VALID = "valid"
+STATUS_INVALID = "invalid"
+STATUS_NETWORK_ERROR = "network_error"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class SessionCheckResult:
+    """세션 하나에 대한 검사 결과"""
+
+    session_file: str
+    status: str
+    message: str
+    latency: float
+    checked_at: str
+
+
+def list_session_files(sessions_dir: str = SESSIONS_DIR) -> List[str]:
+    """세션 폴더에서 .session 파일 목록을 정렬하여 반환합니다."""
+    try:
+        with os.scandir(sessions_dir) as entries:
+            return sorted(e.name for e in entries if e.is_file() and e.name.endswith(".session"))
+    except FileNotFoundError:
+        return []
+
+
+def classify_result(ok: bool, message: str) -> str:
+    """어댑터의 (성공 여부, 메시지) 결과를 검사 상태로 분류합니다."""
+    if ok:
+        return STATUS_VALID
+    if "네트워크 연결 오류" in message:
+        return STATUS_NETWORK_ERROR
+    if "세션이 유효하지 않습니다" in message or "인증 오류" in message:
+        return STATUS_INVALID
+    return STATUS_ERROR
+
+
+class BulkSessionChecker:
+    """
+    세션 폴더의 모든 세션을 동시성 제한 하에 검사하는 클래스.
+    검사는 어댑터의 비동기 API로 공유 백그라운드 루프 하나에서 동시에 실행되며,
+    각 세션의 결과는 완료되는 즉시 콜백으로 전달됩니다.
+    """
+
+    def __init__(self, adapter, concurrency: int = DEFAULT_BULK_CHECK_CONCURRENCY, sessions_dir: str = SESSIONS_DIR):
+        """
+        Args:
+            adapter: 비동기 check(session_name, dc_id)/close(session_name)를 제공하는 어댑터
+            concurrency: 동시에 검사할 최대 세션 수
+            sessions_dir: 세션 파일 폴더
+        """
+        self.adapter = adapter
+        self.concurrency = max(1, int(concurrency))
+        self.sessions_dir = sessions_dir
+        self._stop_event = threading.Event()
+        self._future: Optional[concurrent.futures.Future] = None
+
+    def stop(self):
+        """진행 중인 검사를 취소하고 남은 검사를 건너뜁니다."""
+        self._stop_event.set()
+        if self._future and not self._future.done():
+            self._future.cancel()
+
+    async def check_one(self, session_file: str, info: Optional[SessionFileInfo] = None) -> SessionCheckResult:
+        """
+        세션 하나를 검사하고 지연 시간과 함께 결과를 반환합니다.
+        info는 이미 읽은 세션 파일 정보이며, 없으면 여기서 한 번 읽습니다.
+        """
+        session_name = session_file[: -len(".session")]
+        started = time.perf_counter()
+        if info is None:
+            info = await self._inspect(session_file)
+
+        # 인증 키가 없거나 구조가 깨진 세션은 네트워크 검사 없이 바로 거부
+        rejection = self._offline_rejection(info)
+        if rejection:
+            return self._make_result(session_file, STATUS_INVALID, f"오프라인 검사: {rejection}", started)
+
+        try:
+            ok, message = await self.adapter.check(session_name, dc_id=info.dc_id)
+            status = classify_result(ok, message)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"일괄 검사 중 예상치 못한 오류: {session_file}: {type(e).__name__}: {e}")
+            status, message = STATUS_ERROR, f"{type(e).__name__}: {e}"
+        finally:
+            # 같은 세션을 다시 쓰지 않으므로 풀에 남은 연결은 바로 정리
+            await self.adapter.close(session_name)
+        return self._make_result(session_file, status, message, started)
+
+    async def _inspect(self, session_file: str) -> SessionFileInfo:
+        """
+        세션 파일을 한 번 읽습니다. 파일 읽기(볼트 복호화 포함)가 공유 루프의 다른 작업을
+        막지 않도록 스레드에서 실행합니다.
+        """
+        return await asyncio.to_thread(inspect_session_file, os.path.join(self.sessions_dir, session_file))
+
+    @staticmethod
+    def _dc_unavailable(info: SessionFileInfo) -> bool:
+        """세션의 DC가 장애로 차단되어 지금 검사하면 대기하게 되는지 확인합니다."""
+        return dc_breakers.is_open(info.dc_id)
+
+    def _offline_rejection(self, info: SessionFileInfo) -> Optional[str]:
+        """세션 파일 정보로 네트워크 검사가 필요 없는 경우 그 이유를 반환합니다."""
+        reason = info.rejection_reason()
+        if reason:
+            return reason
+        library = getattr(self.adapter, "LIBRARY", None)
+        if library and info.library != library:
+            return f"{info.library} 세션 파일입니다 ({library}로 검사할 수 없음)"
+        return None
+
+    @staticmethod
+    def _make_result(session_file: str, status: str, message: str, started: float) -> SessionCheckResult:
+        return SessionCheckResult(
+            session_file=session_file,
+            status=status,
+            message=message,
+            latency=round(time.perf_counter() - started, 3),
+            checked_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    async def run_async(
+        self,
+        session_files: Iterable[str],
+        on_result: Callable[[SessionCheckResult], None],
+    ):
+        """
+        concurrency개의 작업 코루틴이 파일 목록을 나눠 가며 검사합니다.
+        세션 수와 관계없이 동시에 존재하는 태스크는 concurrency개뿐입니다.
+        장애로 차단된 DC의 세션은 뒤로 미뤄 다른 DC의 세션이 먼저 검사되게 하고,
+        남은 세션이 그것뿐이면 DC가 복구될 때까지 대기합니다.
+        """
+        files = iter(session_files)
+        deferred = deque()
+
+        async def worker():
+            while not self._stop_event.is_set():
+                session_file = next(files, None)
+                if session_file is None:
+                    if not deferred:
+                        return
+                    session_file, info = deferred.popleft()
+                else:
+                    info = await self._inspect(session_file)
+                    if self._dc_unavailable(info):
+                        deferred.append((session_file, info))
+                        continue
+                on_result(await self.check_one(session_file, info))
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def run(
+        self,
+        session_files: Optional[List[str]] = None,
+        on_result: Optional[Callable[[SessionCheckResult], None]] = None,
+    ) -> List[SessionCheckResult]:
+        """
+        세션들을 동시에 검사합니다 (동기 호출용).
+        결과 콜백은 호출한 스레드에서 실행됩니다.
+
+        Args:
+            session_files: 검사할 파일 목록 (없으면 세션 폴더 전체)
+            on_result: 세션 하나의 검사가 끝날 때마다 호출되는 콜백
+
+        Returns:
+            완료된 검사 결과 목록 (완료 순서)
+        """
+        if session_files is None:
+            session_files = list_session_files(self.sessions_dir)
+
+        logger.info(f"일괄 검사 시작: {len(session_files)}개 세션, 동시성={self.concurrency}")
+        results: List[SessionCheckResult] = []
+        result_queue: "queue.Queue[Optional[SessionCheckResult]]" = queue.Queue()
+
+        self._future = get_background_loop().submit(self.run_async(session_files, result_queue.put))
+        self._future.add_done_callback(lambda _: result_queue.put(None))
+
+        while True:
+            result = result_queue.get()
+            if result is None:
+                break
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        if not self._future.cancelled() and self._future.exception():
+            raise self._future.exception()
+
+        logger.info(f"일괄 검사 종료: {len(results)}/{len(session_files)}개 완료")
+        return results
+
+
+class CheckReportWriter:
+    """
+    검사 결과를 CSV/JSON 리포트로 기록하는 클래스.
+    CSV는 결과가 도착할 때마다 한 줄씩 기록하고, JSON은 종료 시 요약과 함께 저장합니다.
+    """
+
+    def __init__(self, report_dir: str, prefix: str = "bulk_check"):
+        os.makedirs(report_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.csv_path = os.path.join(report_dir, f"{prefix}_{timestamp}.csv")
+        self.json_path = os.path.join(report_dir, f"{prefix}_{timestamp}.json")
+        self._results: List[SessionCheckResult] = []
+        self._csv_file = open(self.csv_path, "w", encoding="utf-8", newline="")  # pylint: disable=consider-using-with
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=[field.name for field in fields(SessionCheckResult)])
+        self._csv_writer.writeheader()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, result: SessionCheckResult):
+        """결과 한 건을 기록합니다."""
+        self._results.append(result)
+        self._csv_writer.writerow(asdict(result))
+        self._csv_file.flush()
+
+    def close(self):
+        """CSV 파일을 닫고 JSON 리포트를 저장합니다."""
+        if self._csv_file.closed:
+            return
+        self._csv_file.close()
+
+        summary: Dict[str, int] = {}
+        for result in self._results:
+            summary[result.status] = summary.get(result.status, 0) + 1
+
+        report = {
+            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "total": len(self._results),
+            "summary": summary,
+            "results": [asdict(r) for r in self._results],
+        }
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
@@ -0,0 +1,133 @@
+# core/bulk_export.py
+"""세션 파일을 문자열(JSONL) 또는 압축 파일로 일괄 내보내는 모듈"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zipfile
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+from cryptography.fernet import InvalidToken
+
+from core.constants import SESSIONS_DIR
+from core.session_converter import read_session_file, to_session_string
+from core.session_vault import get_vault, is_sealed
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 형식
+EXPORT_FORMAT_JSONL = "jsonl"
+EXPORT_FORMAT_ZIP = "zip"
+
+
+@dataclass
+class ExportResult:
+    """세션 파일 하나의 내보내기 결과"""
+
+    session_file: str
+    ok: bool
+    message: str
+
+
+class BulkSessionExporter:
+    """
+    세션 파일들을 네트워크 연결 없이 한 파일로 내보내는 클래스.
+    결과 파일은 항목마다 바로 기록하고(스트리밍), 끝나면 임시 파일을 원자적으로 교체합니다.
+
+    - JSONL: 세션 파일을 직접 읽어 만든 세션 문자열을 한 줄에 하나씩 기록 (일괄 가져오기와 같은 필드)
+    - ZIP: 세션 파일 원본을 압축해 하나의 파일로 묶음
+    """
+
+    def __init__(self, sessions_dir: str = SESSIONS_DIR, string_library: Optional[str] = None):
+        """
+        Args:
+            sessions_dir: 세션 파일 폴더
+            string_library: JSONL에 기록할 문자열 형식 (없으면 각 세션 파일의 라이브러리 형식)
+        """
+        self.sessions_dir = sessions_dir
+        self.string_library = string_library
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """남은 세션을 건너뛰고 지금까지 내보낸 항목으로 파일을 마무리합니다."""
+        self._stop_event.set()
+
+    def _export_jsonl(self, session_file: str, out) -> ExportResult:
+        try:
+            library, data = read_session_file(os.path.join(self.sessions_dir, session_file))
+            string_library = self.string_library or library
+            record = {
+                "name": session_file[: -len(".session")],
+                "library": string_library,
+                "dc_id": data.dc_id,
+                "user_id": data.user_id,
+                "session_string": to_session_string(data, string_library),
+            }
+        except (ValueError, OSError, sqlite3.Error) as e:
+            return ExportResult(session_file, False, str(e))
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return ExportResult(session_file, True, f"{string_library} 세션 문자열로 내보냄")
+
+    def _export_zip(self, session_file: str, archive: zipfile.ZipFile) -> ExportResult:
+        path = os.path.join(self.sessions_dir, session_file)
+        try:
+            if is_sealed(path):
+                # 볼트로 암호화된 세션은 다른 곳에서 쓸 수 있도록 복호화한 SQLite로 넣습니다
+                archive.writestr(session_file, get_vault().read(path))
+            else:
+                # 파일 내용을 메모리에 올리지 않고 디스크에서 바로 압축
+                archive.write(path, arcname=session_file)
+        except (OSError, InvalidToken) as e:
+            return ExportResult(session_file, False, str(e))
+        return ExportResult(session_file, True, "압축 파일에 추가함")
+
+    def run(
+        self,
+        session_files: Iterable[str],
+        destination: str,
+        export_format: str = EXPORT_FORMAT_JSONL,
+        on_result: Optional[Callable[[ExportResult], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        세션 파일들을 내보냅니다.
+
+        Args:
+            session_files: 내보낼 세션 파일 이름 목록
+            destination: 결과 파일 경로 (.jsonl 또는 .zip)
+            export_format: EXPORT_FORMAT_JSONL 또는 EXPORT_FORMAT_ZIP
+            on_result: 세션 하나가 끝날 때마다 호출되는 콜백
+
+        Returns:
+            {"exported": 성공 수, "failed": 실패 수}
+        """
+        if export_format not in (EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP):
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
+
+        counts = {"exported": 0, "failed": 0}
+        tmp_path = f"{destination}.tmp"
+        try:
+            if export_format == EXPORT_FORMAT_JSONL:
+                with open(tmp_path, "w", encoding="utf-8") as out:
+                    self._export_all(session_files, lambda name: self._export_jsonl(name, out), counts, on_result)
+            else:
+                with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                    self._export_all(session_files, lambda name: self._export_zip(name, archive), counts, on_result)
+            os.replace(tmp_path, destination)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        logger.info(f"세션 일괄 내보내기 완료: {destination} ({export_format}), 성공 {counts['exported']}, 실패 {counts['failed']}")
+        return counts
+
+    def _export_all(self, session_files, export_one, counts, on_result):
+        for session_file in session_files:
+            if self._stop_event.is_set():
+                logger.info("세션 일괄 내보내기가 중지되었습니다")
+                break
+            result = export_one(session_file)
+            counts["exported" if result.ok else "failed"] += 1
+            if on_result:
+                on_result(result)
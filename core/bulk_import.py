@@ -0,0 +1,302 @@
+# core/bulk_import.py
+"""파일에 담긴 세션 문자열을 스트리밍 방식으로 일괄 가져오는 모듈"""
+import asyncio
+import codecs
+import concurrent.futures
+import csv
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Set, Union
+
+from adapters.event_loop import get_background_loop
+from core.constants import DEFAULT_BULK_CHECK_CONCURRENCY, SESSIONS_DIR
+from core.session_converter import parse_session_string
+
+logger = logging.getLogger(__name__)
+
+# 가져오기 결과 상태
+STATUS_IMPORTED = "imported"
+STATUS_DUPLICATE = "duplicate"
+STATUS_INVALID = "invalid"
+STATUS_FAILED = "failed"
+
+# CSV/JSONL에서 세션 문자열과 이름으로 인식하는 필드
+STRING_FIELDS = ("session_string", "string", "session")
+NAME_FIELDS = ("name", "phone", "session_name")
+# TXT 한 줄에서 "이름<구분자>문자열"을 나누는 구분자 (세션 문자열은 base64라 포함하지 않음)
+TXT_SEPARATORS = ("\t", ",", ";", ":", " ")
+
+
+@dataclass
+class ImportRecord:
+    """파일에서 읽은 세션 문자열 하나"""
+
+    line_no: int
+    session_string: str
+    name: Optional[str] = None
+
+
+@dataclass
+class ImportResult:
+    """세션 문자열 하나의 가져오기 결과"""
+
+    line_no: int
+    session_file: Optional[str]
+    status: str
+    message: str
+
+
+def sanitize_session_name(name: str) -> str:
+    """파일 이름으로 사용할 수 없는 문자를 제거합니다 (SessionManager와 같은 규칙)."""
+    return "".join(c for c in name if c.isalnum())
+
+
+def _pick(row: dict, candidates) -> Optional[str]:
+    lowered = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+    for key in candidates:
+        value = lowered.get(key)
+        if value:
+            return str(value).strip()
+    return None
+
+
+def _parse_txt_line(line: str) -> ImportRecord:
+    for separator in TXT_SEPARATORS:
+        if separator in line:
+            name, _, session_string = line.rpartition(separator)
+            return ImportRecord(0, session_string.strip(), name.strip() or None)
+    return ImportRecord(0, line)
+
+
+class ImportFileReader:
+    """
+    TXT/CSV/JSONL 파일을 한 줄씩 읽어 ImportRecord를 만드는 반복자.
+    파일 전체를 메모리에 올리지 않으며, 읽은 바이트 수로 진행률을 계산합니다.
+
+    - TXT: 한 줄에 세션 문자열 하나 (선택적으로 "이름<탭/쉼표/콜론>문자열")
+    - CSV: session_string/string/session 열과 선택적인 name/phone 열 (헤더가 없으면 마지막 열이 문자열)
+    - JSONL: {"session_string": ..., "name": ...} 객체 또는 문자열 한 줄에 하나
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.total_bytes = os.path.getsize(path)
+        self.bytes_read = 0
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".jsonl", ".ndjson"):
+            self.format = "jsonl"
+        elif extension == ".csv":
+            self.format = "csv"
+        else:
+            self.format = "txt"
+
+    @property
+    def progress(self) -> float:
+        """읽은 비율 (0.0 ~ 1.0)"""
+        return self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+
+    def _lines(self, f) -> Iterator[str]:
+        for index, raw in enumerate(f):
+            self.bytes_read += len(raw)
+            if index == 0:
+                raw = raw.removeprefix(codecs.BOM_UTF8)
+            yield raw.decode("utf-8", errors="replace")
+
+    def __iter__(self) -> Iterator[ImportRecord]:
+        with open(self.path, "rb") as f:
+            if self.format == "csv":
+                yield from self._iter_csv(f)
+                return
+            for line_no, line in enumerate(self._lines(f), start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                record = self._parse_jsonl(line) if self.format == "jsonl" else _parse_txt_line(line)
+                record.line_no = line_no
+                yield record
+
+    @staticmethod
+    def _parse_jsonl(line: str) -> ImportRecord:
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError:
+            return ImportRecord(0, line)
+        if isinstance(value, dict):
+            return ImportRecord(0, _pick(value, STRING_FIELDS) or "", _pick(value, NAME_FIELDS))
+        return ImportRecord(0, str(value))
+
+    def _iter_csv(self, f) -> Iterator[ImportRecord]:
+        reader = csv.reader(self._lines(f))
+        header = None
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            if header is None:
+                lowered = [cell.strip().lower() for cell in row]
+                if any(field in lowered for field in STRING_FIELDS):
+                    header = lowered
+                    continue
+                header = []
+            if header:
+                values = dict(zip(header, row))
+                record = ImportRecord(reader.line_num, _pick(values, STRING_FIELDS) or "", _pick(values, NAME_FIELDS))
+            else:
+                name = row[0].strip() if len(row) > 1 else None
+                record = ImportRecord(reader.line_num, row[-1].strip(), name or None)
+            yield record
+
+
+class BulkSessionImporter:
+    """
+    파일의 세션 문자열을 동시성 제한 하에 가져오는 클래스.
+    파일은 작업 코루틴들이 한 줄씩 나눠 읽으므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    같은 인증 키의 세션과 이미 존재하는 세션 파일은 중복으로 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        adapter,
+        concurrency: int = DEFAULT_BULK_CHECK_CONCURRENCY,
+        sessions_dir: str = SESSIONS_DIR,
+        verify: bool = True,
+        overwrite: bool = False,
+    ):
+        """
+        Args:
+            adapter: 비동기 import_string(session_name, session_string, verify)를 제공하는 어댑터
+            concurrency: 동시에 가져올 최대 세션 수
+            sessions_dir: 세션 파일 폴더
+            verify: 저장 전에 텔레그램에 연결해 유효성을 확인할지 여부
+            overwrite: 같은 이름의 세션 파일이 있을 때 덮어쓸지 여부
+        """
+        self.adapter = adapter
+        self.concurrency = max(1, int(concurrency))
+        self.sessions_dir = sessions_dir
+        self.verify = verify
+        self.overwrite = overwrite
+        # 인증 키 해시 앞 8바이트만 보관해 항목 수가 많아도 메모리를 적게 씁니다
+        self._seen_keys: Set[bytes] = set()
+        self._claimed_names: Set[str] = set()
+        self._stop_event = threading.Event()
+        self._future: Optional[concurrent.futures.Future] = None
+
+    def stop(self):
+        """진행 중인 가져오기를 취소하고 남은 줄을 건너뜁니다."""
+        self._stop_event.set()
+        if self._future and not self._future.done():
+            self._future.cancel()
+
+    def _derive_name(self, record: ImportRecord, data, key_hash: bytes) -> str:
+        """이름이 주어지지 않으면 사용자 ID, 그것도 없으면 인증 키 해시로 파일 이름을 만듭니다."""
+        if record.name:
+            name = sanitize_session_name(record.name)
+            if name:
+                return name
+        if data.user_id:
+            return str(data.user_id)
+        return f"import{key_hash.hex()[:12]}"
+
+    def prepare(self, record: ImportRecord) -> Union[ImportResult, str]:
+        """
+        네트워크 없이 할 수 있는 검사(형식, 중복)를 하고 저장할 세션 이름을 정합니다.
+
+        Returns:
+            가져올 항목이면 세션 이름, 여기서 끝나는 항목이면 그 결과 (ImportResult)
+        """
+        try:
+            _, data = parse_session_string(record.session_string)
+        except ValueError as e:
+            return ImportResult(record.line_no, None, STATUS_INVALID, str(e))
+
+        key_hash = hashlib.sha256(data.auth_key).digest()[:8]
+        if key_hash in self._seen_keys:
+            return ImportResult(record.line_no, None, STATUS_DUPLICATE, "같은 인증 키의 세션이 이미 가져오기 목록에 있습니다")
+        self._seen_keys.add(key_hash)
+
+        session_name = self._derive_name(record, data, key_hash)
+        session_file = f"{session_name}.session"
+        # 한 루프 안에서 실행되므로 확인과 등록 사이에 다른 작업이 끼어들지 않습니다
+        if session_name in self._claimed_names or (
+            not self.overwrite and os.path.exists(os.path.join(self.sessions_dir, session_file))
+        ):
+            return ImportResult(record.line_no, session_file, STATUS_DUPLICATE, "같은 이름의 세션 파일이 이미 있습니다")
+        self._claimed_names.add(session_name)
+        return session_name
+
+    async def import_prepared(self, record: ImportRecord, session_name: str) -> ImportResult:
+        """prepare()를 통과한 항목을 어댑터로 가져옵니다 (검증 연결과 파일 저장)."""
+        session_file = f"{session_name}.session"
+        try:
+            ok, message = await self.adapter.import_string(session_name, record.session_string, verify=self.verify)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"일괄 가져오기 중 예상치 못한 오류: {record.line_no}행: {type(e).__name__}: {e}")
+            ok, message = False, f"{type(e).__name__}: {e}"
+        return ImportResult(record.line_no, session_file, STATUS_IMPORTED if ok else STATUS_FAILED, message)
+
+    def release(self, result: ImportResult):
+        """가져오지 못한 항목이 차지한 세션 이름을 풀어, 뒤에 나오는 같은 이름의 줄을 가져올 수 있게 합니다."""
+        if result.status == STATUS_FAILED and result.session_file:
+            self._claimed_names.discard(result.session_file[: -len(".session")])
+
+    async def import_one(self, record: ImportRecord) -> ImportResult:
+        """세션 문자열 하나를 검사하고 가져옵니다."""
+        prepared = self.prepare(record)
+        if isinstance(prepared, ImportResult):
+            return prepared
+        result = await self.import_prepared(record, prepared)
+        self.release(result)
+        return result
+
+    async def run_async(self, reader: ImportFileReader, on_result: Callable[[ImportResult], None]):
+        """concurrency개의 작업 코루틴이 파일을 한 줄씩 나눠 읽으며 가져옵니다."""
+        records = iter(reader)
+
+        async def worker():
+            for record in records:
+                if self._stop_event.is_set():
+                    return
+                on_result(await self.import_one(record))
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def run(
+        self,
+        path: str,
+        on_result: Optional[Callable[[ImportResult, float], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        파일의 세션 문자열을 가져옵니다 (동기 호출용).
+        결과 콜백은 호출한 스레드에서 (결과, 파일 진행률)로 호출됩니다.
+
+        Returns:
+            상태별 항목 수 (결과 자체는 쌓지 않고 콜백으로만 전달합니다)
+        """
+        reader = ImportFileReader(path)
+        logger.info(f"일괄 가져오기 시작: {path} ({reader.format}, {reader.total_bytes} bytes), 동시성={self.concurrency}")
+        counts = {STATUS_IMPORTED: 0, STATUS_DUPLICATE: 0, STATUS_INVALID: 0, STATUS_FAILED: 0}
+        result_queue: "queue.Queue[Optional[ImportResult]]" = queue.Queue()
+
+        self._future = get_background_loop().submit(self.run_async(reader, result_queue.put))
+        self._future.add_done_callback(lambda _: result_queue.put(None))
+
+        while True:
+            result = result_queue.get()
+            if result is None:
+                break
+            counts[result.status] += 1
+            if on_result:
+                on_result(result, reader.progress)
+
+        if not self._future.cancelled() and self._future.exception():
+            raise self._future.exception()
+
+        logger.info(
+            f"일괄 가져오기 종료: 성공 {counts[STATUS_IMPORTED]}, 중복 {counts[STATUS_DUPLICATE]}, "
+            f"형식 오류 {counts[STATUS_INVALID]}, 실패 {counts[STATUS_FAILED]}"
+        )
+        return counts
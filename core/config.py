@@ -1,65 +1,177 @@
 # core/config.py
-import json
+import atexit
+import logging
 import os
+import sqlite3
+import threading
+import weakref
 
-from ui.constants import CONFIG_FILE, SESSIONS_DIR
+from core.constants import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_PARK_SECONDS,
+    BREAKER_RECOVERY_TIMEOUT,
+    CLIENT_POOL_MAX_SIZE,
+    CLIENT_POOL_TTL,
+    CONFIG_FILE,
+    CONFIG_SAVE_DELAY,
+    DEFAULT_BULK_CHECK_CONCURRENCY,
+    DEFAULT_JOB_CONCURRENCY,
+    DEFAULT_JOBS_PER_API,
+    DEFAULT_SHARD_PROCESSES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRY_MULTIPLIER,
+    SESSIONS_DIR,
+    VAULT_CACHE_BYTES,
+)
+from core.settings_store import SettingsStore
+
+logger = logging.getLogger(__name__)
+
+# 종료할 때 아직 저장하지 않은 변경을 기록할 Config 인스턴스
+_instances = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    for config in list(_instances):
+        config.flush()
 
 
 class Config:
     """
-    설정 파일을 관리하는 클래스.
-    API 정보, 마지막 사용 라이브러리 등을 JSON 파일로 관리합니다.
+    설정을 관리하는 클래스.
+    API 정보, 마지막 사용 라이브러리 등을 SQLite 설정 저장소(SettingsStore)에 보관합니다.
+    처음 실행할 때 한 번만 이전 형식(config.json, data/config.enc)의 내용을 가져옵니다.
+
+    API 자격 증명은 닉네임과 API ID로 색인해 메모리에 두고, 변경된 행은 save_delay초 동안 모았다가
+    한 번에 커밋합니다 (flush()로 즉시 커밋, 프로그램 종료 시 자동 커밋).
     """
 
-    def __init__(self):
-        self._config_path = CONFIG_FILE
-        self._config = self._load_config()
+    def __init__(self, save_delay=CONFIG_SAVE_DELAY):
+        self._save_delay = save_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer = None
+        self._store = SettingsStore(autocommit=False)
+        self._store.migrate_legacy(CONFIG_FILE)
+        self._config = self._store.settings()
+        self._build_index()
+        _instances.add(self)
 
         if not os.path.exists(SESSIONS_DIR):
             os.makedirs(SESSIONS_DIR)
 
-    def _load_config(self):
-        """설정 파일(config.json)을 불러옵니다. 없으면 기본 구조를 생성합니다."""
-        try:
-            with open(self._config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # 파일이 없거나 내용이 잘못된 경우 기본값으로 시작
-            return {"api_credentials": [], "last_used_api": None, "last_used_library": "Pyrogram"}
+    def _build_index(self):
+        """닉네임 → 자격 증명, API ID → 자격 증명 목록 색인을 만듭니다 (등록 순서는 유지)."""
+        self._by_name = {}
+        self._by_id = {}
+        for cred in self._store.list_credentials():
+            self._index(cred.to_dict())
+
+    def _index(self, cred):
+        self._by_name[cred.get("name")] = cred
+        self._by_id.setdefault(str(cred.get("api_id")), []).append(cred)
+
+    def _unindex(self, cred):
+        del self._by_name[cred.get("name")]
+        same_id = self._by_id.get(str(cred.get("api_id")), [])
+        same_id.remove(cred)
+        if not same_id:
+            del self._by_id[str(cred.get("api_id"))]
 
     def _save_config(self):
-        """현재 설정을 config.json 파일에 저장합니다."""
-        with open(self._config_path, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=4, ensure_ascii=False)
+        """변경 사항을 표시하고 잠시 뒤 한 번에 커밋하도록 예약합니다."""
+        with self._lock:
+            self._dirty = True
+            if self._save_delay <= 0:
+                self._write()
+                return
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self._save_delay, self._write)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _set(self, **values):
+        """설정 값을 바꿉니다 (키마다 저장소의 한 행만 기록)."""
+        with self._lock:
+            for key, value in values.items():
+                self._config[key] = value
+                self._store.set_setting(key, value)
+            self._save_config()
+
+    def _write(self):
+        """모아 둔 변경을 설정 저장소에 커밋합니다 (실패하면 다음 저장 때 다시 시도)."""
+        with self._lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+            try:
+                self._store.commit()
+            except sqlite3.Error as e:
+                logger.error(f"설정 저장 실패: {self._store.db_path} ({e})")
+                return
+            self._dirty = False
+
+    def flush(self):
+        """예약된 저장을 기다리지 않고 바로 저장합니다."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._write()
 
     def get_api_credentials(self):
         """저장된 모든 API 자격 증명 목록을 반환합니다."""
-        return self._config.get("api_credentials", [])
+        with self._lock:
+            return list(self._by_name.values())
+
+    def get_api_credential(self, nickname):
+        """닉네임으로 API 자격 증명을 찾습니다 (없으면 None)."""
+        return self._by_name.get(nickname)
+
+    def find_api_credentials_by_id(self, api_id):
+        """같은 API ID로 등록된 자격 증명 목록을 반환합니다."""
+        with self._lock:
+            return list(self._by_id.get(str(api_id), []))
 
     def add_api_credential(self, nickname, api_id, api_hash):
         """새로운 API 자격 증명을 추가합니다."""
-        credentials = self.get_api_credentials()
-        # 닉네임 중복 확인
-        if any(cred.get("name") == nickname for cred in credentials):
-            return False
-
-        new_cred = {"name": nickname, "api_id": api_id, "api_hash": api_hash}
-        self._config["api_credentials"].append(new_cred)
-        self._save_config()
+        with self._lock:
+            # 닉네임 중복 확인
+            if nickname in self._by_name or not self._store.add_credential(nickname, api_id, api_hash):
+                return False
+
+            self._index({"name": nickname, "api_id": str(api_id), "api_hash": api_hash})
+            self._save_config()
+        return True
+
+    def update_api_credential(self, nickname, api_id=None, api_hash=None):
+        """API 자격 증명의 API ID나 API Hash를 바꿉니다 (없는 닉네임이면 False)."""
+        with self._lock:
+            cred = self._by_name.get(nickname)
+            if cred is None or not self._store.update_credential(nickname, api_id, api_hash):
+                return False
+            self._unindex(cred)
+            cred = dict(cred)
+            if api_id is not None:
+                cred["api_id"] = str(api_id)
+            if api_hash is not None:
+                cred["api_hash"] = api_hash
+            self._index(cred)
+            self._save_config()
         return True
 
     def remove_api_credential(self, nickname):
         """닉네임으로 API 자격 증명을 삭제합니다."""
-        credentials = self.get_api_credentials()
-        original_count = len(credentials)
-
-        new_credentials = [cred for cred in credentials if cred.get("name") != nickname]
-
-        if len(new_credentials) < original_count:
-            self._config["api_credentials"] = new_credentials
+        with self._lock:
+            cred = self._by_name.get(nickname)
+            if cred is None:
+                return False
+            self._unindex(cred)
+            self._store.remove_credential(nickname)
             self._save_config()
-            return True
-        return False
+        return True
 
     def get_last_used_library(self):
         """마지막으로 사용한 라이브러리 이름을 반환합니다."""
@@ -71,6 +183,105 @@ class Config:
 
     def save_last_used(self, api_nickname, library_name):
         """마지막으로 사용한 API와 라이브러리 설정을 저장합니다."""
-        self._config["last_used_api"] = api_nickname
-        self._config["last_used_library"] = library_name
-        self._save_config()
+        with self._lock:
+            if self._config.get("last_used_api") == api_nickname and self._config.get("last_used_library") == library_name:
+                return
+            self._set(last_used_api=api_nickname, last_used_library=library_name)
+
+    def get_bulk_check_concurrency(self):
+        """일괄 세션 검사의 동시 실행 수를 반환합니다."""
+        return int(self._config.get("bulk_check_concurrency", DEFAULT_BULK_CHECK_CONCURRENCY))
+
+    def save_bulk_check_concurrency(self, concurrency):
+        """일괄 세션 검사의 동시 실행 수를 저장합니다."""
+        self._set(bulk_check_concurrency=int(concurrency))
+
+    def get_job_concurrency(self):
+        """(전체 동시 실행 작업 수, API별 동시 실행 작업 수)를 반환합니다."""
+        return (
+            int(self._config.get("job_concurrency", DEFAULT_JOB_CONCURRENCY)),
+            int(self._config.get("jobs_per_api", DEFAULT_JOBS_PER_API)),
+        )
+
+    def save_job_concurrency(self, concurrency, per_api):
+        """작업 스케줄러의 동시 실행 수를 저장합니다."""
+        self._set(job_concurrency=int(concurrency), jobs_per_api=int(per_api))
+
+    def get_shard_processes(self):
+        """대량 일괄 작업에 사용할 워커 프로세스 수를 반환합니다 (1이면 사용하지 않음)."""
+        return max(1, int(self._config.get("shard_processes", DEFAULT_SHARD_PROCESSES)))
+
+    def save_shard_processes(self, processes):
+        """대량 일괄 작업에 사용할 워커 프로세스 수를 저장합니다."""
+        self._set(shard_processes=int(processes))
+
+    def get_retry_settings(self):
+        """네트워크 오류 재시도와 DC 서킷 브레이커 설정을 반환합니다 (DcCircuitBreakers.configure 인자)."""
+        settings = {
+            "max_attempts": RETRY_MAX_ATTEMPTS,
+            "base_delay": RETRY_BASE_DELAY,
+            "max_delay": RETRY_MAX_DELAY,
+            "multiplier": RETRY_MULTIPLIER,
+            "failure_threshold": BREAKER_FAILURE_THRESHOLD,
+            "recovery_timeout": BREAKER_RECOVERY_TIMEOUT,
+            "max_park": BREAKER_MAX_PARK_SECONDS,
+        }
+        saved = self._config.get("retry", {})
+        settings.update({key: value for key, value in saved.items() if key in settings})
+        return settings
+
+    def save_retry_settings(self, **settings):
+        """
+        재시도/서킷 브레이커 설정 중 주어진 항목만 바꿔 저장합니다.
+
+        Raises:
+            KeyError: 알 수 없는 항목인 경우
+        """
+        defaults = self.get_retry_settings()
+        unknown = set(settings) - set(defaults)
+        if unknown:
+            raise KeyError(f"알 수 없는 재시도 설정: {', '.join(sorted(unknown))}")
+        with self._lock:
+            saved = dict(self._config.get("retry", {}))
+            saved.update({key: type(defaults[key])(value) for key, value in settings.items()})
+            self._set(retry=saved)
+
+    def get_client_pool_ttl(self):
+        """연결 풀에서 유휴 클라이언트를 유지할 시간(초)을 반환합니다."""
+        return float(self._config.get("client_pool_ttl", CLIENT_POOL_TTL))
+
+    def save_client_pool_ttl(self, ttl):
+        """연결 풀에서 유휴 클라이언트를 유지할 시간(초)을 저장합니다."""
+        self._set(client_pool_ttl=float(ttl))
+
+    def get_client_pool_max_size(self):
+        """연결 풀에 보관할 최대 클라이언트 수를 반환합니다."""
+        return max(1, int(self._config.get("client_pool_max_size", CLIENT_POOL_MAX_SIZE)))
+
+    def save_client_pool_max_size(self, max_size):
+        """연결 풀에 보관할 최대 클라이언트 수를 저장합니다."""
+        self._set(client_pool_max_size=max(1, int(max_size)))
+
+    def get_metrics_port(self):
+        """단계별 지연 시간 메트릭 엔드포인트 포트를 반환합니다 (0이면 사용하지 않음)."""
+        return int(self._config.get("metrics_port", 0))
+
+    def save_metrics_port(self, port):
+        """GUI의 메트릭 엔드포인트 포트를 저장합니다 (0이면 사용하지 않음)."""
+        self._set(metrics_port=int(port))
+
+    def get_session_vault(self):
+        """세션 파일을 암호화해 보관하는 볼트 모드 사용 여부를 반환합니다."""
+        return bool(self._config.get("session_vault", False))
+
+    def save_session_vault(self, enabled):
+        """세션 볼트 모드 사용 여부를 저장합니다."""
+        self._set(session_vault=bool(enabled))
+
+    def get_vault_cache_bytes(self):
+        """세션 볼트가 복호화해 메모리에 남겨 둘 최대 크기(바이트)를 반환합니다."""
+        return int(self._config.get("vault_cache_bytes", VAULT_CACHE_BYTES))
+
+    def save_vault_cache_bytes(self, cache_bytes):
+        """세션 볼트의 복호화 캐시 최대 크기(바이트)를 저장합니다."""
+        self._set(vault_cache_bytes=max(0, int(cache_bytes)))
@@ -0,0 +1,85 @@
+# core/constants.py
+# Qt 없이 사용하는 설정값 (UI와 CLI가 함께 사용합니다)
+
+# --- File Paths ---
+SESSIONS_DIR = "sessions"
+CONFIG_FILE = "config.json"
+# API 자격 증명과 설정을 보관하는 SQLite 저장소 (config.json, data/config.enc를 대신합니다)
+SETTINGS_DB_FILE = "data/settings.db"
+SECURE_CONFIG_FILE = "data/config.enc"
+# 세션 폴더 옆에 생성되는 세션 메타데이터 인덱스
+CATALOG_FILE = "sessions_catalog.db"
+# 설정 변경을 모아서 저장(커밋)하기까지 기다리는 시간 (초). 연달아 바뀐 설정은 한 번에 씁니다
+CONFIG_SAVE_DELAY = 0.5
+
+# --- Encryption ---
+# 스트림 암호화(ConfigEncryption.encrypt_stream)의 조각 크기 (바이트). 메모리 사용량과 임의 접근 단위입니다
+STREAM_CHUNK_SIZE = 64 * 1024
+# 세션 볼트가 복호화해 메모리에 남겨 둘 세션 DB의 최대 총 크기 (바이트)
+VAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# --- Bulk Operations ---
+REPORTS_DIR = "reports"
+DEFAULT_BULK_CHECK_CONCURRENCY = 10
+MAX_BULK_CHECK_CONCURRENCY = 200
+
+# --- Process Sharding ---
+# 대량 일괄 검사/가져오기에 사용할 워커 프로세스 수 (1이면 사용하지 않음)
+DEFAULT_SHARD_PROCESSES = 1
+# 이 정도 규모 이상일 때만 프로세스를 나눕니다 (세션 수, 가져올 파일 크기)
+SHARDING_MIN_SESSIONS = 10000
+SHARDING_MIN_IMPORT_BYTES = 4 * 1024 * 1024
+
+# --- Job Scheduler ---
+DEFAULT_JOB_CONCURRENCY = 4
+# 같은 API ID로 동시에 실행할 작업 수
+DEFAULT_JOBS_PER_API = 2
+# 작업 목록에 남겨 둘 완료된 작업 수
+JOB_HISTORY_LIMIT = 200
+MAX_JOB_CONCURRENCY = 50
+
+# --- Rate Limiting ---
+# API ID와 DC 조합(레인)마다 초당 보낼 요청 수와 한 번에 몰아 보낼 수 있는 요청 수
+RATE_LIMIT_PER_SECOND = 5.0
+RATE_LIMIT_BURST = 10
+# FloodWait 후 같은 요청을 다시 보낼 최대 횟수
+FLOOD_WAIT_MAX_RETRIES = 3
+# 자동으로 기다려 줄 최대 FloodWait 시간 (초, 넘으면 작업 실패)
+FLOOD_WAIT_MAX_SECONDS = 300
+
+# --- Retry / Circuit Breaker ---
+# 네트워크 오류 재시도 (지수 백오프 + 지터): 최대 시도 횟수, 첫 대기 시간, 최대 대기 시간 (초), 배수
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_MULTIPLIER = 2.0
+# DC를 장애로 차단할 연속 네트워크 실패 횟수와 복구를 확인하기까지의 시간 (초)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RECOVERY_TIMEOUT = 30.0
+# 차단된 DC의 세션이 복구를 기다릴 최대 시간 (초, 넘으면 네트워크 오류로 끝남)
+BREAKER_MAX_PARK_SECONDS = 600
+
+# --- Operation Deadlines ---
+# 어댑터 작업 단계별 제한 시간 (초). 멈춘 연결이 작업 슬롯을 붙잡고 있지 않도록 합니다
+OPERATION_TIMEOUTS = {
+    "connect": 20,
+    "auth_check": 15,
+    "get_me": 15,
+    "export": 15,
+    "request": 30,
+}
+
+# --- Client Pool ---
+# 유휴 상태로 연결을 유지할 최대 시간 (초)
+CLIENT_POOL_TTL = 300
+# 풀에 보관할 최대 연결 수. 넘으면 가장 오래 사용하지 않은 연결부터 해제합니다 (최대 동시 검사 수보다 작으면 안 됩니다)
+CLIENT_POOL_MAX_SIZE = MAX_BULK_CHECK_CONCURRENCY
+
+# --- Metrics ---
+# 작업 단계별 지연 시간 히스토그램의 구간 경계 (초)
+METRICS_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.02, 0.035, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.5, 0.75,
+    1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0, 15.0, 20.0, 30.0, 60.0,
+)
+# 메트릭 엔드포인트 주소 (기본은 이 컴퓨터에서만 접속)
+METRICS_HOST = "127.0.0.1"
@@ -0,0 +1,38 @@
+# core/file_utils.py
+"""파일 저장 유틸리티"""
+import os
+import tempfile
+
+
+def write_file_atomic(path, data):
+    """
+    같은 폴더의 임시 파일에 다 쓰고 디스크에 내린 뒤 교체합니다.
+    쓰는 도중 프로그램이 죽어도 기존 파일이나 새 파일 중 하나가 온전히 남습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    # 이름 바꾸기도 디스크에 남도록 폴더를 동기화합니다 (Windows에서는 지원하지 않음)
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,245 @@
+# core/job_scheduler.py
+"""우선순위와 동시 실행 수 제한을 지원하는 작업 스케줄러"""
+import heapq
+import itertools
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from core.constants import DEFAULT_JOB_CONCURRENCY, DEFAULT_JOBS_PER_API, JOB_HISTORY_LIMIT
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# 작업 우선순위 (작을수록 먼저 실행)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+_job_ids = itertools.count(1)
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+@dataclass(eq=False)
+class Job:
+    """스케줄러에 등록된 작업 하나와 그 상태"""
+
+    kind: str
+    label: str
+    api_id: Optional[int] = None
+    # 같은 resource(세션 이름 등)를 가진 작업은 동시에 실행하지 않습니다
+    resource: Optional[str] = None
+    priority: int = PRIORITY_NORMAL
+    # 작업 실행에 필요한 인자 (스케줄러는 해석하지 않음)
+    payload: Any = field(default=None, repr=False)
+    id: int = field(default_factory=lambda: next(_job_ids))
+    status: str = JOB_QUEUED
+    message: str = ""
+    created_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    cancel_requested: bool = False
+    # 실행 중인 작업 본체 (워커 등, 작업을 시작한 쪽에서 설정)
+    handle: Any = field(default=None, repr=False)
+
+    @property
+    def is_done(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+
+class JobScheduler:
+    """
+    우선순위 큐에 작업을 쌓아 두고 전체/API별 동시 실행 수 안에서 실행하는 스케줄러.
+    작업을 실제로 실행하는 방법은 start_job 콜백이 정하고, 작업이 끝나면 finish()로 알려야 합니다.
+    """
+
+    def __init__(
+        self,
+        start_job: Callable[[Job], None],
+        max_concurrency: int = DEFAULT_JOB_CONCURRENCY,
+        per_api_concurrency: int = DEFAULT_JOBS_PER_API,
+        on_change: Optional[Callable[[Job], None]] = None,
+        cancel_job: Optional[Callable[[Job], None]] = None,
+    ):
+        """
+        Args:
+            start_job: 작업을 시작하는 콜백 (실행 중 상태로 바뀐 뒤 호출됩니다)
+            max_concurrency: 전체 동시 실행 작업 수
+            per_api_concurrency: 같은 API ID로 동시에 실행할 작업 수
+            on_change: 작업 상태가 바뀔 때마다 호출되는 콜백
+            cancel_job: 실행 중인 작업에 중지를 요청하는 콜백
+        """
+        self._start_job = start_job
+        self._on_change = on_change
+        self._cancel_job = cancel_job
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.per_api_concurrency = max(1, int(per_api_concurrency))
+
+        self._lock = threading.RLock()
+        self._queue: List[Tuple[int, int, Job]] = []
+        self._sequence = itertools.count()
+        self._running: Dict[int, Job] = {}
+        self._running_per_api: Dict[Optional[int], int] = {}
+        self._running_resources = set()
+        self._history: Deque[Job] = deque(maxlen=JOB_HISTORY_LIMIT)
+
+    def configure(self, max_concurrency: int, per_api_concurrency: int):
+        """동시 실행 수를 변경하고, 늘어났으면 대기 중인 작업을 시작합니다."""
+        with self._lock:
+            self.max_concurrency = max(1, int(max_concurrency))
+            self.per_api_concurrency = max(1, int(per_api_concurrency))
+        self._dispatch()
+
+    # --- 조회 ---
+
+    def jobs(self) -> List[Job]:
+        """대기/실행 중인 작업과 최근에 끝난 작업 목록"""
+        with self._lock:
+            queued = [job for _, _, job in sorted(self._queue) if job.status == JOB_QUEUED]
+            return list(self._running.values()) + queued + list(self._history)
+
+    def running_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for _, _, job in self._queue if job.status == JOB_QUEUED)
+
+    def has_active_jobs(self) -> bool:
+        """대기 중이거나 실행 중인 작업이 있는지 확인합니다."""
+        return self.running_count() > 0 or self.pending_count() > 0
+
+    def find_active(self, resource: str) -> Optional[Job]:
+        """같은 resource로 대기/실행 중인 작업을 찾습니다."""
+        with self._lock:
+            for job in self._running.values():
+                if job.resource == resource:
+                    return job
+            for _, _, job in self._queue:
+                if job.status == JOB_QUEUED and job.resource == resource:
+                    return job
+        return None
+
+    # --- 작업 제어 ---
+
+    def submit(self, job: Job) -> Job:
+        """작업을 큐에 넣고 실행 가능하면 바로 시작합니다."""
+        with self._lock:
+            heapq.heappush(self._queue, (job.priority, next(self._sequence), job))
+        logger.info(f"작업 등록: #{job.id} {job.kind} {job.label} (우선순위 {job.priority})")
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def finish(self, job: Job, status: str, message: str = ""):
+        """작업 본체가 끝났음을 알리고 다음 작업을 시작합니다."""
+        with self._lock:
+            if self._running.pop(job.id, None) is None:
+                return
+            self._release_slot(job)
+            if job.cancel_requested and status != JOB_SUCCEEDED:
+                status = JOB_CANCELLED
+            job.status = status
+            job.message = message or job.message
+            job.finished_at = _now()
+            job.handle = None
+            self._history.appendleft(job)
+        logger.info(f"작업 종료: #{job.id} {job.kind} {job.label} -> {job.status}")
+        self._notify(job)
+        self._dispatch()
+
+    def cancel(self, job: Job) -> bool:
+        """
+        작업을 취소합니다. 대기 중이면 바로 취소되고, 실행 중이면 중지를 요청합니다.
+
+        Returns:
+            취소(또는 중지 요청)했으면 True, 이미 끝난 작업이면 False
+        """
+        with self._lock:
+            if job.is_done:
+                return False
+            job.cancel_requested = True
+            if job.status == JOB_QUEUED:
+                # 힙에서 바로 빼지 않고 꺼낼 때 건너뜁니다
+                job.status = JOB_CANCELLED
+                job.finished_at = _now()
+                self._history.appendleft(job)
+                queued = True
+            else:
+                queued = False
+        if queued:
+            self._notify(job)
+        elif self._cancel_job:
+            self._cancel_job(job)
+        return True
+
+    def cancel_all(self):
+        """대기 중인 작업을 모두 취소하고 실행 중인 작업에 중지를 요청합니다."""
+        with self._lock:
+            targets = list(self._running.values()) + [job for _, _, job in self._queue if job.status == JOB_QUEUED]
+        for job in targets:
+            self.cancel(job)
+
+    # --- 내부 ---
+
+    def _can_start(self, job: Job) -> bool:
+        if self._running_per_api.get(job.api_id, 0) >= self.per_api_concurrency:
+            return False
+        return job.resource is None or job.resource not in self._running_resources
+
+    def _release_slot(self, job: Job):
+        remaining = self._running_per_api.get(job.api_id, 1) - 1
+        if remaining:
+            self._running_per_api[job.api_id] = remaining
+        else:
+            self._running_per_api.pop(job.api_id, None)
+        self._running_resources.discard(job.resource)
+
+    def _dispatch(self):
+        """빈 슬롯만큼 실행 가능한 작업을 우선순위 순서로 시작합니다."""
+        to_start: List[Job] = []
+        with self._lock:
+            skipped = []
+            while self._queue and len(self._running) < self.max_concurrency:
+                entry = heapq.heappop(self._queue)
+                job = entry[2]
+                if job.status != JOB_QUEUED:
+                    continue
+                if not self._can_start(job):
+                    skipped.append(entry)
+                    continue
+                job.status = JOB_RUNNING
+                job.started_at = _now()
+                self._running[job.id] = job
+                self._running_per_api[job.api_id] = self._running_per_api.get(job.api_id, 0) + 1
+                if job.resource is not None:
+                    self._running_resources.add(job.resource)
+                to_start.append(job)
+            for entry in skipped:
+                heapq.heappush(self._queue, entry)
+
+        for job in to_start:
+            logger.info(f"작업 시작: #{job.id} {job.kind} {job.label}")
+            self._notify(job)
+            try:
+                self._start_job(job)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error(f"작업 시작 실패: #{job.id}: {type(e).__name__}: {e}", exc_info=True)
+                self.finish(job, JOB_FAILED, f"작업 시작 실패: {type(e).__name__}: {e}")
+
+    def _notify(self, job: Job):
+        if self._on_change:
+            self._on_change(job)
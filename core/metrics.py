@@ -0,0 +1,267 @@
+# core/metrics.py
+"""어댑터 작업 단계별 지연 시간 히스토그램과 OpenMetrics 텍스트 내보내기"""
+import bisect
+import contextlib
+import http.server
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core.constants import METRICS_BUCKETS, METRICS_HOST
+
+logger = logging.getLogger(__name__)
+
+# (라이브러리, DC, 단계)
+SeriesKey = Tuple[str, str, str]
+
+QUANTILES = (0.5, 0.95, 0.99)
+HISTOGRAM_NAME = "tgcc_phase_duration_seconds"
+SUMMARY_NAME = "tgcc_phase_latency_seconds"
+ERRORS_NAME = "tgcc_phase_errors"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+@dataclass
+class PhaseStats:
+    """단계 하나의 지연 시간 요약 (초)"""
+
+    library: str
+    dc: str
+    operation: str
+    count: int
+    errors: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """
+    고정 구간 히스토그램. 표본을 쌓지 않으므로 요청 수와 관계없이 메모리가 일정하고,
+    분위수는 해당 구간 안에서 선형 보간으로 추정합니다.
+    """
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        # 마지막 칸은 가장 큰 경계보다 긴 요청
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float, error: bool = False):
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if error:
+            self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * max(0.0, rank - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+    def state(self) -> Dict[str, Any]:
+        return {"counts": list(self.counts), "count": self.count, "errors": self.errors, "total": self.total, "max": self.max}
+
+    def merge(self, state: Dict[str, Any]):
+        """다른 프로세스에서 같은 경계로 모은 상태를 더합니다."""
+        for index, value in enumerate(state["counts"]):
+            self.counts[index] += value
+        self.count += state["count"]
+        self.errors += state["errors"]
+        self.total += state["total"]
+        self.max = max(self.max, state["max"])
+
+
+def _labels(key: SeriesKey, **extra: str) -> str:
+    values = {"library": key[0], "dc": key[1], "operation": key[2], **extra}
+    text = ",".join(f'{name}="{_escape(value)}"' for name, value in values.items())
+    return "{" + text + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(round(value, 6)) if isinstance(value, float) else str(value)
+
+
+class PhaseMetrics:
+    """
+    라이브러리, DC, 단계(연결/인증 확인/사용자 조회/내보내기/요청)별 지연 시간 기록기.
+    여러 스레드의 이벤트 루프에서 함께 기록할 수 있도록 잠금으로 보호합니다.
+    """
+
+    def __init__(self, bounds: Sequence[float] = METRICS_BUCKETS):
+        self.bounds = tuple(sorted(bounds))
+        self._series: Dict[SeriesKey, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(library: str, dc_id: Optional[int], operation: str) -> SeriesKey:
+        return (library, str(dc_id) if dc_id else "unknown", operation)
+
+    def observe(self, library: str, dc_id: Optional[int], operation: str, seconds: float, error: bool = False):
+        key = self._key(library, dc_id, operation)
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = LatencyHistogram(self.bounds)
+            histogram.observe(seconds, error)
+
+    @contextlib.contextmanager
+    def timer(self, library: str, dc_id: Optional[int], operation: str) -> Iterator[None]:
+        """
+        블록의 실행 시간을 기록합니다. 예외로 끝나면 오류로 함께 집계하고,
+        취소(CancelledError 등 Exception이 아닌 종료)는 완료되지 않은 요청이므로 기록하지 않습니다.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.observe(library, dc_id, operation, time.perf_counter() - started, error=True)
+            raise
+        self.observe(library, dc_id, operation, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> List[PhaseStats]:
+        """모든 단계의 분위수 요약"""
+        with self._lock:
+            series = sorted(self._series.items())
+            return [
+                PhaseStats(
+                    library=key[0],
+                    dc=key[1],
+                    operation=key[2],
+                    count=histogram.count,
+                    errors=histogram.errors,
+                    total=round(histogram.total, 6),
+                    p50=round(histogram.quantile(0.5), 6),
+                    p95=round(histogram.quantile(0.95), 6),
+                    p99=round(histogram.quantile(0.99), 6),
+                    max=round(histogram.max, 6),
+                )
+                for key, histogram in series
+            ]
+
+    def export_state(self) -> Dict[SeriesKey, Dict[str, Any]]:
+        """다른 프로세스로 보낼 수 있는 (pickle 가능한) 상태"""
+        with self._lock:
+            return {key: histogram.state() for key, histogram in self._series.items()}
+
+    def merge(self, state: Dict[SeriesKey, Dict[str, Any]]):
+        """워커 프로세스에서 모은 기록을 합칩니다."""
+        with self._lock:
+            for key, values in state.items():
+                histogram = self._series.get(key)
+                if histogram is None:
+                    histogram = self._series[key] = LatencyHistogram(self.bounds)
+                histogram.merge(values)
+
+    # --- OpenMetrics ---
+
+    def render_openmetrics(self) -> str:
+        """OpenMetrics 텍스트 형식 (히스토그램, 분위수 요약, 오류 수)"""
+        with self._lock:
+            series = sorted((key, histogram.state()) for key, histogram in self._series.items())
+            quantiles = {
+                key: [self._series[key].quantile(q) for q in QUANTILES] for key, _ in series
+            }
+
+        lines = [
+            f"# TYPE {HISTOGRAM_NAME} histogram",
+            f"# UNIT {HISTOGRAM_NAME} seconds",
+            f"# HELP {HISTOGRAM_NAME} 어댑터 작업 단계별 지연 시간",
+        ]
+        for key, state in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.bounds + (math.inf,), state["counts"]):
+                cumulative += bucket_count
+                lines.append(f"{HISTOGRAM_NAME}_bucket{_labels(key, le=_number(float(bound)))} {cumulative}")
+            lines.append(f"{HISTOGRAM_NAME}_count{_labels(key)} {state['count']}")
+            lines.append(f"{HISTOGRAM_NAME}_sum{_labels(key)} {_number(state['total'])}")
+
+        lines += [
+            f"# TYPE {SUMMARY_NAME} summary",
+            f"# UNIT {SUMMARY_NAME} seconds",
+            f"# HELP {SUMMARY_NAME} 어댑터 작업 단계별 지연 시간 분위수 (히스토그램 구간에서 추정)",
+        ]
+        for key, state in series:
+            for q, value in zip(QUANTILES, quantiles[key]):
+                lines.append(f"{SUMMARY_NAME}{_labels(key, quantile=str(q))} {_number(value)}")
+            lines.append(f"{SUMMARY_NAME}_count{_labels(key)} {state['count']}")
+            lines.append(f"{SUMMARY_NAME}_sum{_labels(key)} {_number(state['total'])}")
+
+        lines += [f"# TYPE {ERRORS_NAME} counter", f"# HELP {ERRORS_NAME} 오류로 끝난 단계 수"]
+        for key, state in series:
+            lines.append(f"{ERRORS_NAME}_total{_labels(key)} {state['errors']}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_openmetrics(self, path: str):
+        """OpenMetrics 텍스트를 파일로 저장합니다 (다 쓴 뒤 교체하므로 읽는 쪽이 반쯤 쓴 파일을 보지 않습니다)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render_openmetrics())
+        os.replace(tmp_path, path)
+
+
+# 어댑터들이 공유하는 기본 기록기
+phase_metrics = PhaseMetrics()
+
+
+def serve_openmetrics(
+    port: int, host: str = METRICS_HOST, metrics: PhaseMetrics = phase_metrics
+) -> http.server.ThreadingHTTPServer:
+    """
+    /metrics 경로로 OpenMetrics 텍스트를 제공하는 HTTP 서버를 백그라운드 스레드에서 시작합니다.
+    기본으로 로컬에서만 접속할 수 있습니다. 끝낼 때는 반환된 서버의 shutdown()을 호출합니다.
+    """
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler가 찾는 이름
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = metrics.render_openmetrics().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            logger.debug(f"메트릭 요청: {self.address_string()} {format % args}")
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"메트릭 엔드포인트 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
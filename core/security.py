@@ -1,17 +1,33 @@
 # core/security.py
 """보안 관련 유틸리티"""
 import base64
-import hashlib
+import contextlib
 import json
 import os
+import struct
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from core.constants import STREAM_CHUNK_SIZE
+
+# 스트림 암호화 형식: 헤더 (식별자, 버전, 조각 크기, 논스 접두사) + 조각들.
+# 조각 i는 AES-256-GCM(논스 = 접두사 8바이트 + i, AAD = 헤더 + 마지막 조각 여부)로 암호화하며,
+# 마지막 조각만 조각 크기보다 짧으므로 (빈 조각일 수 있음) 잘린 파일과 조각 순서 바꾸기를 알아챌 수 있습니다.
+STREAM_MAGIC = b"TGCCENC"
+STREAM_VERSION = 1
+_STREAM_HEADER = struct.Struct(">7sBI8s")
+STREAM_HEADER_SIZE = _STREAM_HEADER.size
+STREAM_TAG_SIZE = 16
+_STREAM_KEY_INFO = b"tgcc stream encryption v1"
+
 
 class ConfigEncryption:
     """설정 파일 암호화/복호화 클래스"""
@@ -23,9 +39,15 @@ class ConfigEncryption:
         """
         self.key_file = key_file or Path("data/.key")
         self.key_file.parent.mkdir(exist_ok=True)
-        self._fernet = self._get_or_create_fernet()
+        key = self._get_or_create_key()
+        self._fernet = Fernet(key)
+        # 스트림 암호화에는 같은 키 파일에서 유도한 별도 키를 씁니다
+        stream_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=_STREAM_KEY_INFO).derive(
+            base64.urlsafe_b64decode(key)
+        )
+        self._stream_aead = AESGCM(stream_key)
 
-    def _get_or_create_fernet(self) -> Fernet:
+    def _get_or_create_key(self) -> bytes:
         """암호화 키 가져오기 또는 생성"""
         if self.key_file.exists():
             # 기존 키 로드
@@ -39,7 +61,7 @@ class ConfigEncryption:
             # 키 파일 권한 설정 (읽기 전용)
             os.chmod(self.key_file, 0o600)
 
-        return Fernet(key)
+        return key
 
     def _derive_key_from_password(self, password: str, salt: bytes) -> bytes:
         """비밀번호로부터 암호화 키 유도"""
@@ -59,6 +81,14 @@ class ConfigEncryption:
         data: Dict[str, Any] = json.loads(decrypted.decode())
         return data
 
+    def encrypt_value(self, value: str) -> bytes:
+        """문자열 하나 암호화 (DB 필드 단위 암호화용)"""
+        return self._fernet.encrypt(value.encode())
+
+    def decrypt_value(self, token: bytes) -> str:
+        """encrypt_value로 암호화한 문자열 복호화"""
+        return self._fernet.decrypt(token).decode()
+
     def encrypt_file(self, file_path: Path, output_path: Optional[Path] = None):
         """파일 암호화"""
         if not file_path.exists():
@@ -84,6 +114,74 @@ class ConfigEncryption:
 
         return self.decrypt_data(encrypted_data)
 
+    # --- 스트림 암호화 ---
+
+    @staticmethod
+    def _chunk_nonce(prefix: bytes, index: int) -> bytes:
+        return prefix + struct.pack(">I", index)
+
+    def encrypt_stream(self, source: BinaryIO, target: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        """
+        source를 조각 단위로 읽어 암호화해 target에 씁니다. 파일 크기와 관계없이 조각 하나만큼의 메모리를 씁니다.
+
+        Returns:
+            암호화한 원본 바이트 수
+        """
+        if not 0 < chunk_size < 2**32:
+            raise ValueError(f"잘못된 조각 크기: {chunk_size}")
+        header = _STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, chunk_size, os.urandom(8))
+        prefix = header[-8:]
+        target.write(header)
+        total = 0
+        index = 0
+        while True:
+            chunk = _read_exact(source, chunk_size)
+            # 조각 크기만큼 채운 조각은 마지막이 아닙니다 (원본 크기가 조각 크기의 배수이면 빈 마지막 조각을 씁니다)
+            final = len(chunk) < chunk_size
+            aad = header + (b"\x01" if final else b"\x00")
+            target.write(self._stream_aead.encrypt(self._chunk_nonce(prefix, index), chunk, aad))
+            total += len(chunk)
+            index += 1
+            if final:
+                return total
+
+    def decrypt_stream(self, source: BinaryIO, target: BinaryIO) -> int:
+        """
+        encrypt_stream으로 암호화한 source를 조각 단위로 복호화해 target에 씁니다.
+        조각을 하나씩 검증하므로, 변조된 조각 앞까지는 이미 target에 쓰였을 수 있습니다.
+
+        Returns:
+            복호화한 바이트 수
+
+        Raises:
+            InvalidToken: 형식이 잘못되었거나, 변조되었거나, 잘린 경우 (또는 키가 다른 경우)
+        """
+        header, chunk_size, prefix = _read_stream_header(source)
+        total = 0
+        index = 0
+        while True:
+            block = _read_exact(source, chunk_size + STREAM_TAG_SIZE)
+            final = len(block) < chunk_size + STREAM_TAG_SIZE
+            plain = self._decrypt_chunk(header, prefix, index, block, final)
+            target.write(plain)
+            total += len(plain)
+            index += 1
+            if final:
+                return total
+
+    def _decrypt_chunk(self, header: bytes, prefix: bytes, index: int, block: bytes, final: bool) -> bytes:
+        if len(block) < STREAM_TAG_SIZE:
+            raise InvalidToken(f"암호화된 스트림이 잘렸습니다 (조각 {index})")
+        aad = header + (b"\x01" if final else b"\x00")
+        try:
+            return self._stream_aead.decrypt(self._chunk_nonce(prefix, index), block, aad)
+        except InvalidTag as e:
+            raise InvalidToken(f"암호화된 스트림 조각 {index}을 검증하지 못했습니다") from e
+
+    def open_stream(self, source: BinaryIO) -> "EncryptedStreamReader":
+        """임의 위치를 읽을 수 있는 (seek 가능한) 암호화 스트림 읽기 객체"""
+        return EncryptedStreamReader(self, source)
+
     def secure_delete(self, file_path: Path):
         """파일 안전 삭제 (덮어쓰기)"""
         if not file_path.exists():
@@ -101,56 +199,138 @@ class ConfigEncryption:
         file_path.unlink()
 
 
+def _read_exact(source: BinaryIO, size: int) -> bytes:
+    """size바이트를 다 읽거나 스트림 끝까지 읽습니다 (파이프처럼 짧게 읽히는 스트림 대비)."""
+    data = source.read(size)
+    if len(data) == size or not data:
+        return data
+    parts = [data]
+    remaining = size - len(data)
+    while remaining:
+        more = source.read(remaining)
+        if not more:
+            break
+        parts.append(more)
+        remaining -= len(more)
+    return b"".join(parts)
+
+
+def _read_stream_header(source: BinaryIO) -> Tuple[bytes, int, bytes]:
+    header = _read_exact(source, STREAM_HEADER_SIZE)
+    if len(header) < STREAM_HEADER_SIZE:
+        raise InvalidToken("암호화된 스트림 헤더가 없습니다")
+    magic, version, chunk_size, prefix = _STREAM_HEADER.unpack(header)
+    if magic != STREAM_MAGIC or version != STREAM_VERSION or chunk_size == 0:
+        raise InvalidToken("지원하지 않는 암호화 스트림 형식입니다")
+    return header, chunk_size, prefix
+
+
+class EncryptedStreamReader:
+    """
+    encrypt_stream 형식의 파일에서 필요한 조각만 복호화해 읽습니다.
+    조각 i의 위치는 헤더 크기 + i * (조각 크기 + 태그 크기)로 바로 계산됩니다.
+    읽은 조각만 검증하므로, 파일 끝이 잘렸는지는 마지막 조각을 읽을 때 알 수 있습니다.
+    """
+
+    def __init__(self, encryption: ConfigEncryption, source: BinaryIO):
+        self.encryption = encryption
+        self.source = source
+        source.seek(0)
+        self._header, self.chunk_size, self._prefix = _read_stream_header(source)
+        body = source.seek(0, os.SEEK_END) - STREAM_HEADER_SIZE
+        block_size = self.chunk_size + STREAM_TAG_SIZE
+        full_chunks, last_block = divmod(body, block_size)
+        if last_block < STREAM_TAG_SIZE:
+            raise InvalidToken("암호화된 스트림이 잘렸습니다")
+        self.chunk_count = full_chunks + 1
+        self.size = full_chunks * self.chunk_size + last_block - STREAM_TAG_SIZE
+
+    def read_chunk(self, index: int) -> bytes:
+        """index번째 조각을 복호화합니다."""
+        if not 0 <= index < self.chunk_count:
+            raise IndexError(f"조각 번호가 범위를 벗어났습니다: {index}")
+        block_size = self.chunk_size + STREAM_TAG_SIZE
+        self.source.seek(STREAM_HEADER_SIZE + index * block_size)
+        block = _read_exact(self.source, block_size)
+        final = index == self.chunk_count - 1
+        return self.encryption._decrypt_chunk(  # pylint: disable=protected-access
+            self._header, self._prefix, index, block, final
+        )
+
+    def read(self, offset: int, size: int) -> bytes:
+        """원본의 offset부터 size바이트 (필요한 조각만 복호화)"""
+        offset = max(0, offset)
+        end = min(self.size, offset + max(0, size))
+        parts = []
+        position = offset
+        while position < end:
+            index = position // self.chunk_size
+            chunk = self.read_chunk(index)
+            start = position - index * self.chunk_size
+            parts.append(chunk[start : start + end - position])
+            position += len(parts[-1])
+        return b"".join(parts)
+
+
 class SecureConfig:
-    """암호화된 설정 관리"""
-
-    def __init__(self, config_file: Optional[Path] = None):
-        self.config_file = config_file or Path("data/config.enc")
-        self.plain_config_file = Path("data/config.json")
-        self.encryption = ConfigEncryption()
-        self._migrate_if_needed()
-
-    def _migrate_if_needed(self):
-        """평문 설정을 암호화된 설정으로 마이그레이션"""
-        if self.plain_config_file.exists() and not self.config_file.exists():
-            # 평문 설정 암호화
-            self.encryption.encrypt_file(self.plain_config_file, self.config_file)
-            # 평문 파일 안전 삭제
-            self.encryption.secure_delete(self.plain_config_file)
+    """
+    암호화된 설정 관리 (이전 인터페이스).
+    별도의 파일을 두지 않고 Config와 같은 설정 저장소(SettingsStore, data/settings.db)를 사용하므로
+    두 쪽이 같은 내용을 보고 바꿉니다. API Hash는 저장소에서 항목마다 암호화됩니다.
+    """
 
-    def load_config(self) -> Dict[str, Any]:
-        """암호화된 설정 로드"""
-        if self.config_file.exists():
-            return self.encryption.decrypt_file(self.config_file)
-        return {"api_credentials": []}
+    def __init__(self, store=None):
+        # settings_store가 이 모듈의 ConfigEncryption을 쓰므로 여기서 불러옵니다
+        from core.settings_store import SettingsStore  # pylint: disable=import-outside-toplevel
 
-    def save_config(self, config: Dict[str, Any]):
-        """설정 암호화하여 저장"""
-        encrypted = self.encryption.encrypt_data(config)
-        with open(self.config_file, "wb") as f:
-            f.write(encrypted)
+        self.store = store or SettingsStore()
+        self.store.migrate_legacy()
 
-    def add_api_credential(self, name: str, api_id: str, api_hash: str) -> bool:
-        """API 자격증명 추가"""
-        config = self.load_config()
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Dict[str, Any]]:
+        """
+        여러 변경을 한 번에 커밋합니다. 예외로 끝나면 모두 되돌립니다.
+        넘겨받은 설정 dict는 복사본이므로, 직접 바꿨으면 save_config(config)로 저장하세요.
 
-        # 중복 체크
-        for cred in config["api_credentials"]:
-            if cred["name"] == name:
-                return False
+        사용 예:
+            with secure_config.transaction():
+                for name, api_id, api_hash in rows:
+                    secure_config.add_api_credential(name, api_id, api_hash)
+        """
+        with self.store.transaction():
+            yield self.load_config()
 
-        # API ID 해시 (일부만 보이도록)
-        api_id_hash = hashlib.sha256(api_id.encode()).hexdigest()[:8]
+    def load_config(self) -> Dict[str, Any]:
+        """설정 로드 (복사본이므로 바꿔도 저장되지 않습니다)"""
+        return {"api_credentials": self.get_api_credentials(), **self.store.settings()}
 
-        config["api_credentials"].append(
-            {"name": name, "api_id": api_id, "api_hash": api_hash, "id_hash": api_id_hash}  # 디버깅용
-        )
+    def save_config(self, config: Dict[str, Any]):
+        """
+        설정 저장. api_credentials는 주어진 목록과 같아지도록 추가/변경/삭제하고,
+        나머지 항목은 주어진 키만 바꿉니다 (없는 키는 그대로 둡니다).
+        """
+        with self.store.transaction():
+            names = set()
+            for cred in config.get("api_credentials", []):
+                name = cred.get("name")
+                if not name:
+                    continue
+                names.add(name)
+                api_id, api_hash = str(cred.get("api_id", "")), cred.get("api_hash", "")
+                if not self.store.add_credential(name, api_id, api_hash):
+                    self.store.update_credential(name, api_id, api_hash)
+            for cred in self.store.list_credentials():
+                if cred.name not in names:
+                    self.store.remove_credential(cred.name)
+            for key, value in config.items():
+                if key != "api_credentials":
+                    self.store.set_setting(key, value)
 
-        self.save_config(config)
-        return True
+    def add_api_credential(self, name: str, api_id: str, api_hash: str) -> bool:
+        """API 자격증명 추가 (같은 이름이 있으면 False)"""
+        with self.store.transaction():
+            return self.store.add_credential(name, api_id, api_hash)
 
     def get_api_credentials(self) -> List[Any]:
-        """API 자격증명 목록 반환"""
-        config = self.load_config()
-        credentials: List[Any] = config.get("api_credentials", [])
-        return credentials
+        """API 자격증명 목록 반환 (기존 형식대로 디버깅용 id_hash 포함)"""
+        return [{**cred.to_dict(), "id_hash": cred.id_hash} for cred in self.store.list_credentials()]
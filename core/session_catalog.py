@@ -0,0 +1,218 @@
+# core/session_catalog.py
+"""세션 폴더의 메타데이터를 SQLite에 보관하는 카탈로그 모듈"""
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.constants import CATALOG_FILE, SESSIONS_DIR
+from core.session_inspector import inspect_session_file
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions
+(
+    name               TEXT PRIMARY KEY,
+    size               INTEGER NOT NULL,
+    mtime_ns           INTEGER NOT NULL,
+    library            TEXT,
+    dc_id              INTEGER,
+    user_id            INTEGER,
+    has_auth_key       INTEGER NOT NULL DEFAULT 0,
+    error              TEXT,
+    last_check_status  TEXT,
+    last_check_message TEXT,
+    last_checked_at    TEXT
+);
+"""
+
+ENTRY_COLUMNS = (
+    "name, size, mtime_ns, library, dc_id, user_id, has_auth_key, error, "
+    "last_check_status, last_check_message, last_checked_at"
+)
+
+
+def default_catalog_path(sessions_dir: str = SESSIONS_DIR) -> str:
+    """세션 폴더 옆에 위치한 카탈로그 파일 경로"""
+    return os.path.join(os.path.dirname(os.path.abspath(sessions_dir)), CATALOG_FILE)
+
+
+@dataclass
+class CatalogEntry:
+    """카탈로그에 기록된 세션 파일 하나의 정보"""
+
+    name: str
+    size: int
+    mtime_ns: int
+    library: Optional[str] = None
+    dc_id: Optional[int] = None
+    user_id: Optional[int] = None
+    has_auth_key: bool = False
+    error: Optional[str] = None
+    last_check_status: Optional[str] = None
+    last_check_message: Optional[str] = None
+    last_checked_at: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: Tuple) -> "CatalogEntry":
+        entry = cls(*row)
+        entry.has_auth_key = bool(entry.has_auth_key)
+        return entry
+
+
+@dataclass
+class CatalogDelta:
+    """카탈로그 갱신으로 바뀐 세션 파일 목록"""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+
+class SessionCatalog:
+    """
+    세션 파일 이름, 크기, 수정 시각, 라이브러리, DC, 마지막 검사 결과를 보관하는 SQLite 인덱스.
+    갱신 시 폴더 목록의 수정 시각/크기를 비교해 바뀐 파일만 다시 읽습니다.
+    """
+
+    def __init__(self, sessions_dir: str = SESSIONS_DIR, db_path: Optional[str] = None):
+        """
+        Args:
+            sessions_dir: 세션 파일 폴더
+            db_path: 카탈로그 DB 경로 (기본값: 세션 폴더 옆의 CATALOG_FILE)
+        """
+        self.sessions_dir = sessions_dir
+        self.db_path = db_path or default_catalog_path(sessions_dir)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- 갱신 ---
+
+    def refresh(self) -> CatalogDelta:
+        """
+        세션 폴더와 카탈로그를 비교해 바뀐 부분만 반영합니다.
+        파일을 제자리에서 덮어쓰면 폴더 수정 시각은 그대로이므로 파일마다 (크기, 수정 시각)을 비교합니다.
+
+        Returns:
+            추가/삭제/수정된 세션 파일 목록
+        """
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        try:
+            with os.scandir(self.sessions_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".session") and entry.is_file():
+                        stat = entry.stat()
+                        on_disk[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            return self._apply(on_disk, full_scan=True)
+
+    def refresh_files(self, names: Iterable[str]) -> CatalogDelta:
+        """지정한 세션 파일만 다시 확인합니다 (폴더 감시 이벤트 처리용)."""
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        missing = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.sessions_dir, name))
+                on_disk[name] = (stat.st_size, stat.st_mtime_ns)
+            except FileNotFoundError:
+                missing.append(name)
+        with self._lock:
+            delta = self._apply(on_disk, full_scan=False, missing=missing)
+        return delta
+
+    def _apply(
+        self, on_disk: Dict[str, Tuple[int, int]], full_scan: bool, missing: Iterable[str] = ()
+    ) -> CatalogDelta:
+        """디스크 상태를 카탈로그에 반영합니다. 호출자가 잠금을 잡고 있어야 합니다."""
+        if full_scan:
+            known = {name: (size, mtime) for name, size, mtime in self._conn.execute(
+                "SELECT name, size, mtime_ns FROM sessions"
+            )}
+        else:
+            known = {}
+            for name in list(on_disk) + list(missing):
+                row = self._conn.execute("SELECT size, mtime_ns FROM sessions WHERE name = ?", (name,)).fetchone()
+                if row:
+                    known[name] = row
+
+        delta = CatalogDelta()
+        rows = []
+        for name, (size, mtime) in on_disk.items():
+            previous = known.get(name)
+            if previous == (size, mtime):
+                continue
+            (delta.modified if previous else delta.added).append(name)
+            info = inspect_session_file(os.path.join(self.sessions_dir, name))
+            rows.append((name, size, mtime, info.library, info.dc_id, info.user_id, int(info.has_auth_key), info.error))
+
+        if full_scan:
+            delta.removed = [name for name in known if name not in on_disk]
+        else:
+            delta.removed = [name for name in missing if name in known]
+
+        with self._conn:
+            # 검사 결과 컬럼은 유지하고 파일 정보만 갱신
+            self._conn.executemany(
+                "INSERT INTO sessions (name, size, mtime_ns, library, dc_id, user_id, has_auth_key, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "library = excluded.library, dc_id = excluded.dc_id, user_id = excluded.user_id, "
+                "has_auth_key = excluded.has_auth_key, error = excluded.error",
+                rows,
+            )
+            self._conn.executemany("DELETE FROM sessions WHERE name = ?", [(n,) for n in delta.removed])
+
+        if delta:
+            logger.debug(
+                f"카탈로그 갱신: 추가 {len(delta.added)}, 삭제 {len(delta.removed)}, 수정 {len(delta.modified)}"
+            )
+        return delta
+
+    # --- 조회 ---
+
+    def names(self) -> List[str]:
+        """카탈로그에 있는 세션 파일 이름 (정렬됨)"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT name FROM sessions ORDER BY name")]
+
+    def entries(self) -> List[CatalogEntry]:
+        """카탈로그의 모든 항목 (이름순)"""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {ENTRY_COLUMNS} FROM sessions ORDER BY name").fetchall()
+        return [CatalogEntry.from_row(row) for row in rows]
+
+    def get(self, name: str) -> Optional[CatalogEntry]:
+        """세션 파일 하나의 항목"""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {ENTRY_COLUMNS} FROM sessions WHERE name = ?", (name,)).fetchone()
+        return CatalogEntry.from_row(row) if row else None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    # --- 검사 결과 ---
+
+    def record_check_result(self, name: str, status: str, message: str, checked_at: str):
+        """세션 검사 결과를 기록합니다."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE sessions SET last_check_status = ?, last_check_message = ?, last_checked_at = ? "
+                "WHERE name = ?",
+                (status, message, checked_at, name),
+            )
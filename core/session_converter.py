@@ -0,0 +1,409 @@
+# core/session_converter.py
+"""Telethon <-> Pyrogram 세션 파일/문자열 오프라인 변환 모듈"""
+import base64
+import ipaddress
+import logging
+import os
+import sqlite3
+import struct
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.session_inspector import (
+    AUTH_KEY_SIZE,
+    DEFAULT_PORT,
+    LIBRARY_PYROGRAM,
+    LIBRARY_TELETHON,
+    dc_address,
+    inspect_session_file,
+)
+from core.session_vault import active_vault
+
+logger = logging.getLogger(__name__)
+
+# Telethon StringSession: 버전 문자 + base64(dc_id, ip, port, auth_key)
+TELETHON_STRING_VERSION = "1"
+TELETHON_STRING_FORMAT = ">B{}sH256s"
+TELETHON_SESSION_VERSION = 7
+
+# Pyrogram 세션 문자열 (pyrogram.storage.Storage와 같은 형식)
+PYROGRAM_STRING_FORMAT = ">BI?256sQ?"
+PYROGRAM_OLD_STRING_FORMAT = ">B?256sI?"
+PYROGRAM_OLD_STRING_FORMAT_64 = ">B?256sQ?"
+PYROGRAM_OLD_STRING_SIZE = 351
+PYROGRAM_OLD_STRING_SIZE_64 = 356
+PYROGRAM_SESSION_VERSION = 3
+
+TELETHON_SCHEMA = """
+CREATE TABLE version (version integer primary key);
+CREATE TABLE sessions (
+    dc_id integer primary key,
+    server_address text,
+    port integer,
+    auth_key blob,
+    takeout_id integer
+);
+CREATE TABLE entities (
+    id integer primary key,
+    hash integer not null,
+    username text,
+    phone integer,
+    name text,
+    date integer
+);
+CREATE TABLE sent_files (
+    md5_digest blob,
+    file_size integer,
+    type integer,
+    id integer,
+    hash integer,
+    primary key(md5_digest, file_size, type)
+);
+CREATE TABLE update_state (
+    id integer primary key,
+    pts integer,
+    qts integer,
+    date integer,
+    seq integer
+);
+"""
+
+PYROGRAM_SCHEMA = """
+CREATE TABLE sessions
+(
+    dc_id     INTEGER PRIMARY KEY,
+    api_id    INTEGER,
+    test_mode INTEGER,
+    auth_key  BLOB,
+    date      INTEGER NOT NULL,
+    user_id   INTEGER,
+    is_bot    INTEGER
+);
+
+CREATE TABLE peers
+(
+    id             INTEGER PRIMARY KEY,
+    access_hash    INTEGER,
+    type           INTEGER NOT NULL,
+    username       TEXT,
+    phone_number   TEXT,
+    last_update_on INTEGER NOT NULL DEFAULT (CAST(STRFTIME('%s', 'now') AS INTEGER))
+);
+
+CREATE TABLE version
+(
+    number INTEGER PRIMARY KEY
+);
+
+CREATE INDEX idx_peers_id ON peers (id);
+CREATE INDEX idx_peers_username ON peers (username);
+CREATE INDEX idx_peers_phone_number ON peers (phone_number);
+
+CREATE TRIGGER trg_peers_last_update_on
+    AFTER UPDATE
+    ON peers
+BEGIN
+    UPDATE peers
+    SET last_update_on = CAST(STRFTIME('%s', 'now') AS INTEGER)
+    WHERE id = NEW.id;
+END;
+"""
+
+
+@dataclass
+class SessionData:
+    """라이브러리에 독립적인 세션 핵심 정보"""
+
+    dc_id: int
+    auth_key: bytes
+    server_address: Optional[str] = None
+    port: int = DEFAULT_PORT
+    user_id: Optional[int] = None
+    api_id: Optional[int] = None
+    test_mode: bool = False
+    is_bot: bool = False
+
+    def __post_init__(self):
+        if len(self.auth_key) != AUTH_KEY_SIZE:
+            raise ValueError(f"인증 키 길이가 올바르지 않습니다: {len(self.auth_key)} bytes")
+        if not self.server_address:
+            self.server_address = dc_address(self.dc_id, self.test_mode)
+        if not self.server_address:
+            raise ValueError(f"알 수 없는 DC입니다: {self.dc_id}")
+
+
+@dataclass
+class ConversionResult:
+    """파일 하나의 변환 결과"""
+
+    source: str
+    destination: Optional[str]
+    ok: bool
+    message: str
+
+
+# --- 세션 문자열 ---
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def parse_telethon_string(session_string: str) -> SessionData:
+    """Telethon StringSession 문자열을 해석합니다."""
+    session_string = session_string.strip()
+    if not session_string.startswith(TELETHON_STRING_VERSION):
+        raise ValueError("Telethon 세션 문자열이 아닙니다")
+    body = session_string[1:]
+    ip_len = 4 if len(body) == 352 else 16
+    dc_id, ip, port, auth_key = struct.unpack(TELETHON_STRING_FORMAT.format(ip_len), _b64decode(body))
+    return SessionData(
+        dc_id=dc_id, auth_key=auth_key, server_address=ipaddress.ip_address(ip).compressed, port=port
+    )
+
+
+def parse_pyrogram_string(session_string: str) -> SessionData:
+    """Pyrogram 세션 문자열(현재 형식 및 이전 형식)을 해석합니다."""
+    session_string = session_string.strip()
+    raw = _b64decode(session_string)
+    api_id = None
+    if len(session_string) == PYROGRAM_OLD_STRING_SIZE:
+        dc_id, test_mode, auth_key, user_id, is_bot = struct.unpack(PYROGRAM_OLD_STRING_FORMAT, raw)
+    elif len(session_string) == PYROGRAM_OLD_STRING_SIZE_64:
+        dc_id, test_mode, auth_key, user_id, is_bot = struct.unpack(PYROGRAM_OLD_STRING_FORMAT_64, raw)
+    else:
+        dc_id, api_id, test_mode, auth_key, user_id, is_bot = struct.unpack(PYROGRAM_STRING_FORMAT, raw)
+    return SessionData(
+        dc_id=dc_id,
+        auth_key=auth_key,
+        user_id=user_id or None,
+        api_id=api_id or None,
+        test_mode=test_mode,
+        is_bot=is_bot,
+    )
+
+
+def parse_session_string(session_string: str) -> Tuple[str, SessionData]:
+    """
+    세션 문자열의 라이브러리를 판별하고 해석합니다.
+
+    Returns:
+        (라이브러리 이름, SessionData)
+
+    Raises:
+        ValueError: 어느 형식으로도 해석할 수 없는 경우
+    """
+    session_string = session_string.strip()
+    # Telethon 문자열은 '1' + 352자(IPv4) 또는 368자(IPv6)이며 base64 패딩을 포함합니다
+    if session_string.startswith(TELETHON_STRING_VERSION) and len(session_string) in (353, 369):
+        try:
+            return LIBRARY_TELETHON, parse_telethon_string(session_string)
+        except (ValueError, struct.error):
+            pass
+    try:
+        return LIBRARY_PYROGRAM, parse_pyrogram_string(session_string)
+    except (ValueError, struct.error) as e:
+        raise ValueError(f"세션 문자열 형식을 알 수 없습니다: {e}") from e
+
+
+def to_telethon_string(data: SessionData) -> str:
+    """Telethon StringSession 문자열을 만듭니다."""
+    ip = ipaddress.ip_address(data.server_address).packed
+    packed = struct.pack(TELETHON_STRING_FORMAT.format(len(ip)), data.dc_id, ip, data.port, data.auth_key)
+    return TELETHON_STRING_VERSION + base64.urlsafe_b64encode(packed).decode("ascii")
+
+
+def to_pyrogram_string(data: SessionData) -> str:
+    """Pyrogram 세션 문자열을 만듭니다 (사용자 ID 필요)."""
+    if not data.user_id:
+        raise ValueError("Pyrogram 세션에는 사용자 ID가 필요합니다")
+    packed = struct.pack(
+        PYROGRAM_STRING_FORMAT,
+        data.dc_id,
+        data.api_id or 0,
+        data.test_mode,
+        data.auth_key,
+        data.user_id,
+        data.is_bot,
+    )
+    return base64.urlsafe_b64encode(packed).decode().rstrip("=")
+
+
+def to_session_string(data: SessionData, library: str) -> str:
+    """지정한 라이브러리 형식의 세션 문자열을 만듭니다."""
+    if library == LIBRARY_TELETHON:
+        return to_telethon_string(data)
+    if library == LIBRARY_PYROGRAM:
+        return to_pyrogram_string(data)
+    raise ValueError(f"지원하지 않는 라이브러리입니다: {library}")
+
+
+# --- 세션 파일 ---
+
+
+def read_session_file(path: str) -> Tuple[str, SessionData]:
+    """
+    세션 파일을 직접 읽어 SessionData로 만듭니다.
+
+    Returns:
+        (라이브러리 이름, SessionData)
+
+    Raises:
+        ValueError: 인증 키가 없거나 읽을 수 없는 세션인 경우
+    """
+    info = inspect_session_file(path)
+    if info.error or info.library is None or info.dc_id is None or not info.has_auth_key:
+        raise ValueError(info.rejection_reason() or "변환할 수 없는 세션입니다")
+    data = SessionData(
+        dc_id=info.dc_id,
+        auth_key=info.auth_key,
+        server_address=info.server_address,
+        port=info.port or DEFAULT_PORT,
+        user_id=info.user_id,
+        api_id=info.api_id,
+        test_mode=info.test_mode,
+        is_bot=bool(info.is_bot),
+    )
+    return info.library, data
+
+
+def _write_sqlite(path: str, schema: str, populate: Callable[[sqlite3.Connection], None]):
+    """
+    임시 파일에 DB를 만든 뒤 원자적으로 교체합니다.
+    세션 볼트 모드에서는 메모리에서 DB를 만들어 암호화한 내용만 씁니다.
+    """
+    vault = active_vault()
+    if vault is not None:
+        conn = sqlite3.connect(":memory:")
+        try:
+            with conn:
+                conn.executescript(schema)
+                populate(conn)
+            vault.write(path, conn.serialize())
+        finally:
+            conn.close()
+        return
+
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        with conn:
+            conn.executescript(schema)
+            populate(conn)
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+def write_telethon_session(path: str, data: SessionData):
+    """Telethon SQLiteSession 형식의 세션 파일을 씁니다."""
+
+    def populate(conn):
+        conn.execute("INSERT INTO version VALUES (?)", (TELETHON_SESSION_VERSION,))
+        conn.execute(
+            "INSERT INTO sessions VALUES (?, ?, ?, ?, ?)",
+            (data.dc_id, data.server_address, data.port, data.auth_key, None),
+        )
+
+    _write_sqlite(path, TELETHON_SCHEMA, populate)
+
+
+def write_pyrogram_session(path: str, data: SessionData):
+    """Pyrogram FileStorage 형식의 세션 파일을 씁니다 (사용자 ID 필요)."""
+    if not data.user_id:
+        raise ValueError("Pyrogram 세션에는 사용자 ID가 필요합니다")
+
+    def populate(conn):
+        conn.execute("INSERT INTO version VALUES (?)", (PYROGRAM_SESSION_VERSION,))
+        conn.execute(
+            "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (data.dc_id, data.api_id, data.test_mode, data.auth_key, int(time.time()), data.user_id, data.is_bot),
+        )
+
+    _write_sqlite(path, PYROGRAM_SCHEMA, populate)
+
+
+def write_session_file(path: str, data: SessionData, library: str):
+    """지정한 라이브러리 형식의 세션 파일을 씁니다."""
+    if library == LIBRARY_TELETHON:
+        write_telethon_session(path, data)
+    elif library == LIBRARY_PYROGRAM:
+        write_pyrogram_session(path, data)
+    else:
+        raise ValueError(f"지원하지 않는 라이브러리입니다: {library}")
+
+
+def convert_session_file(
+    source: str,
+    destination: str,
+    target_library: str,
+    user_id: Optional[int] = None,
+    api_id: Optional[int] = None,
+) -> ConversionResult:
+    """
+    세션 파일 하나를 다른 라이브러리 형식으로 변환합니다 (네트워크 연결 없음).
+
+    Args:
+        source: 원본 세션 파일
+        destination: 저장할 세션 파일
+        target_library: "Telethon" 또는 "Pyrogram"
+        user_id: 원본에 사용자 ID가 없을 때 사용할 값 (Telethon -> Pyrogram 변환에 필요)
+        api_id: 원본에 api_id가 없을 때 기록할 값
+    """
+    try:
+        _, data = read_session_file(source)
+        data.user_id = data.user_id or user_id
+        data.api_id = data.api_id or api_id
+        write_session_file(destination, data, target_library)
+        return ConversionResult(source, destination, True, f"{target_library} 세션으로 변환 완료")
+    except (ValueError, OSError, sqlite3.Error) as e:
+        return ConversionResult(source, destination, False, str(e))
+
+
+def convert_directory(
+    source_dir: str,
+    destination_dir: str,
+    target_library: str,
+    user_ids: Optional[Dict[str, int]] = None,
+    api_id: Optional[int] = None,
+    on_result: Optional[Callable[[ConversionResult], None]] = None,
+) -> List[ConversionResult]:
+    """
+    폴더의 모든 .session 파일을 다른 라이브러리 형식으로 일괄 변환합니다.
+
+    Args:
+        source_dir: 원본 세션 폴더
+        destination_dir: 변환된 세션을 저장할 폴더 (원본 폴더와 달라야 합니다)
+        target_library: "Telethon" 또는 "Pyrogram"
+        user_ids: 세션 이름 -> 사용자 ID (원본에 사용자 ID가 없는 경우 사용)
+        api_id: 원본에 api_id가 없을 때 기록할 값
+        on_result: 파일 하나가 끝날 때마다 호출되는 콜백
+    """
+    if os.path.abspath(source_dir) == os.path.abspath(destination_dir):
+        raise ValueError("원본 폴더와 다른 폴더에 저장해야 합니다")
+    os.makedirs(destination_dir, exist_ok=True)
+    user_ids = user_ids or {}
+
+    results = []
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or not entry.name.endswith(".session"):
+                continue
+            session_name = entry.name[: -len(".session")]
+            result = convert_session_file(
+                entry.path,
+                os.path.join(destination_dir, entry.name),
+                target_library,
+                user_id=user_ids.get(session_name),
+                api_id=api_id,
+            )
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    converted = sum(1 for r in results if r.ok)
+    logger.info(f"세션 일괄 변환 완료: {converted}/{len(results)}개 -> {target_library}")
+    return results
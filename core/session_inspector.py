@@ -0,0 +1,198 @@
+# core/session_inspector.py
+"""텔레그램에 연결하지 않고 세션 파일(SQLite)을 직접 읽어 정보를 추출하는 모듈"""
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+LIBRARY_TELETHON = "Telethon"
+LIBRARY_PYROGRAM = "Pyrogram"
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+# 세션 볼트로 암호화된 파일의 시작 (core.security.STREAM_MAGIC)
+VAULT_MAGIC = b"TGCCENC"
+AUTH_KEY_SIZE = 256
+
+# Pyrogram은 세션 파일에 서버 주소를 저장하지 않으므로 DC 번호로 주소를 찾습니다
+PRODUCTION_DC_ADDRESSES = {
+    1: "149.154.175.53",
+    2: "149.154.167.51",
+    3: "149.154.175.100",
+    4: "149.154.167.91",
+    5: "91.108.56.130",
+}
+TEST_DC_ADDRESSES = {
+    1: "149.154.175.10",
+    2: "149.154.167.40",
+    3: "149.154.175.117",
+}
+DEFAULT_PORT = 443
+
+
+@dataclass
+class SessionFileInfo:
+    """세션 파일에서 읽어 낸 정보"""
+
+    path: str
+    library: Optional[str] = None
+    dc_id: Optional[int] = None
+    server_address: Optional[str] = None
+    port: Optional[int] = None
+    user_id: Optional[int] = None
+    api_id: Optional[int] = None
+    test_mode: bool = False
+    is_bot: Optional[bool] = None
+    auth_key: Optional[bytes] = field(default=None, repr=False)
+    # 읽기 실패 또는 구조 오류 메시지 (정상이면 None)
+    error: Optional[str] = None
+
+    @property
+    def has_auth_key(self) -> bool:
+        """인증 키가 저장되어 있는지 여부"""
+        return bool(self.auth_key) and len(self.auth_key) == AUTH_KEY_SIZE and any(self.auth_key)
+
+    @property
+    def is_plausible(self) -> bool:
+        """네트워크 검사를 해 볼 가치가 있는 세션인지 여부"""
+        return self.rejection_reason() is None
+
+    def rejection_reason(self) -> Optional[str]:
+        """네트워크 검사 전에 거부할 이유 (검사할 만하면 None)"""
+        if self.error:
+            return self.error
+        if self.library is None:
+            return "알 수 없는 세션 형식입니다"
+        if self.dc_id is None:
+            return "세션에 DC 정보가 없습니다"
+        if not self.has_auth_key:
+            return "세션에 인증 키가 없습니다"
+        if self.library == LIBRARY_PYROGRAM and not self.user_id:
+            # Pyrogram은 user_id가 없으면 로그인되지 않은 세션으로 취급합니다
+            return "로그인되지 않은 세션입니다 (사용자 ID 없음)"
+        return None
+
+
+def dc_address(dc_id: int, test_mode: bool = False) -> Optional[str]:
+    """DC 번호에 해당하는 서버 주소를 반환합니다."""
+    table = TEST_DC_ADDRESSES if test_mode else PRODUCTION_DC_ADDRESSES
+    return table.get(dc_id)
+
+
+def _table_columns(conn: sqlite3.Connection, table: str):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _read_telethon(conn: sqlite3.Connection, info: SessionFileInfo):
+    info.library = LIBRARY_TELETHON
+    row = conn.execute("SELECT dc_id, server_address, port, auth_key FROM sessions LIMIT 1").fetchone()
+    if row is None:
+        info.error = "세션 테이블이 비어있습니다"
+        return
+    dc_id, info.server_address, info.port, info.auth_key = row
+    # DC가 설정되지 않은 새 세션은 dc_id가 0으로 저장됩니다
+    info.dc_id = dc_id or None
+
+
+def _read_pyrogram(conn: sqlite3.Connection, info: SessionFileInfo):
+    info.library = LIBRARY_PYROGRAM
+    columns = _table_columns(conn, "sessions")
+    # 오래된 Pyrogram 세션(버전 2 이하)에는 api_id 컬럼이 없습니다
+    api_id_column = "api_id" if "api_id" in columns else "NULL"
+    row = conn.execute(
+        f"SELECT dc_id, {api_id_column}, test_mode, auth_key, user_id, is_bot FROM sessions LIMIT 1"
+    ).fetchone()
+    if row is None:
+        info.error = "세션 테이블이 비어있습니다"
+        return
+    info.dc_id, info.api_id, test_mode, info.auth_key, info.user_id, is_bot = row
+    info.test_mode = bool(test_mode)
+    info.is_bot = None if is_bot is None else bool(is_bot)
+    if info.dc_id is not None:
+        info.server_address = dc_address(info.dc_id, info.test_mode)
+        info.port = DEFAULT_PORT
+
+
+def read_session_connection(conn: sqlite3.Connection, path: str = ":memory:") -> SessionFileInfo:
+    """열려 있는 세션 DB 연결에서 정보를 읽습니다."""
+    info = SessionFileInfo(path=path)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if "sessions" not in tables:
+            info.error = "sessions 테이블이 없습니다"
+            return info
+
+        columns = _table_columns(conn, "sessions")
+        if {"server_address", "port"} <= columns:
+            _read_telethon(conn, info)
+        elif {"user_id", "test_mode"} <= columns:
+            _read_pyrogram(conn, info)
+        else:
+            info.error = "알 수 없는 세션 테이블 구조입니다"
+    except sqlite3.DatabaseError as e:
+        info.error = f"세션 DB 읽기 오류: {e}"
+    return info
+
+
+def _inspect_sealed_file(path: str) -> SessionFileInfo:
+    """세션 볼트로 암호화된 파일을 메모리에서 복호화해 읽습니다."""
+    # pylint: disable=import-outside-toplevel
+    from cryptography.fernet import InvalidToken
+
+    from core.session_vault import get_vault
+
+    info = SessionFileInfo(path=path)
+    try:
+        conn = get_vault().open_connection(path)
+    except InvalidToken:
+        info.error = "암호화된 세션 파일을 복호화할 수 없습니다 (다른 키이거나 손상됨)"
+        return info
+    except (OSError, sqlite3.Error) as e:
+        info.error = f"암호화된 세션 파일 읽기 오류: {e}"
+        return info
+    try:
+        return read_session_connection(conn, path)
+    finally:
+        conn.close()
+
+
+def inspect_session_file(path: str) -> SessionFileInfo:
+    """
+    세션 파일을 읽기 전용으로 열어 라이브러리, DC, 사용자 ID, 인증 키 등을 추출합니다.
+    네트워크에 연결하지 않으므로 손상되었거나 인증 키가 없는 세션을 빠르게 걸러낼 수 있습니다.
+
+    Args:
+        path: 세션 파일 경로
+
+    Returns:
+        SessionFileInfo (문제가 있으면 error에 이유가 담깁니다)
+    """
+    info = SessionFileInfo(path=path)
+    try:
+        if os.path.getsize(path) == 0:
+            info.error = "파일이 비어있습니다"
+            return info
+        with open(path, "rb") as f:
+            header = f.read(len(SQLITE_HEADER))
+        if header != SQLITE_HEADER:
+            if header.startswith(VAULT_MAGIC):
+                return _inspect_sealed_file(path)
+            info.error = "SQLite 세션 파일이 아닙니다"
+            return info
+    except FileNotFoundError:
+        info.error = "파일이 존재하지 않습니다"
+        return info
+    except OSError as e:
+        info.error = f"파일 읽기 오류: {e}"
+        return info
+
+    try:
+        conn = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error as e:
+        info.error = f"세션 DB 열기 오류: {e}"
+        return info
+    try:
+        result = read_session_connection(conn, path)
+    finally:
+        conn.close()
+    return result
@@ -0,0 +1,286 @@
+# core/session_vault.py
+"""세션 파일을 암호화해 보관하고, 사용할 때만 메모리에서 복호화하는 세션 볼트"""
+import io
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from cryptography.fernet import InvalidToken
+
+from core.constants import SESSIONS_DIR, VAULT_CACHE_BYTES
+from core.file_utils import write_file_atomic
+from core.security import STREAM_MAGIC, ConfigEncryption
+from core.session_inspector import SQLITE_HEADER
+
+logger = logging.getLogger(__name__)
+
+# 볼트 모드를 켜는 환경 변수 (워커 프로세스도 물려받습니다)
+ENV_VAR = "TGCC_SESSION_VAULT"
+
+
+@dataclass
+class VaultStats:
+    """복호화 캐시 상태"""
+
+    entries: int
+    bytes: int
+    capacity: int
+    hits: int
+    misses: int
+
+
+def is_sealed(path: str) -> bool:
+    """볼트로 암호화된 세션 파일인지 여부 (없거나 읽을 수 없으면 False)"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(STREAM_MAGIC)) == STREAM_MAGIC
+    except OSError:
+        return False
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SessionVault:
+    """
+    세션 파일(SQLite)을 ConfigEncryption 스트림 형식으로 암호화해 같은 이름(.session)으로 보관합니다.
+    어댑터가 세션을 열 때 메모리 SQLite(deserialize)로 복호화하고, 바뀐 내용은 다시 암호화해 씁니다.
+    평문이 디스크에 남지 않습니다.
+
+    복호화한 DB 이미지는 파일 (수정 시각, 크기)와 함께 LRU로 캐시하므로,
+    자주 검사하는 세션은 매번 복호화하지 않습니다. 캐시 전체 크기는 cache_bytes를 넘지 않습니다.
+    """
+
+    def __init__(self, encryption: Optional[ConfigEncryption] = None, cache_bytes: int = VAULT_CACHE_BYTES):
+        """
+        Args:
+            encryption: 암호화 키 (기본값: data/.key)
+            cache_bytes: 복호화 캐시의 최대 크기 (바이트, 0이면 캐시하지 않음)
+        """
+        if not hasattr(sqlite3.Connection, "deserialize"):
+            raise RuntimeError("세션 볼트에는 Python 3.11 이상의 sqlite3 (deserialize 지원)이 필요합니다")
+        self.encryption = encryption or ConfigEncryption()
+        self.cache_bytes = max(0, int(cache_bytes))
+        # 절대 경로 -> ((수정 시각, 크기), 복호화한 DB 이미지)
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    # --- 캐시 ---
+
+    def _cache_get(self, key: str, stamp: Tuple[int, int]) -> Optional[bytes]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry[0] != stamp:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def _cache_put(self, key: str, stamp: Optional[Tuple[int, int]], data: bytes):
+        with self._lock:
+            self._cache_drop(key)
+            if stamp is None or len(data) > self.cache_bytes:
+                return
+            self._cache[key] = (stamp, data)
+            self._cached_bytes += len(data)
+            while self._cached_bytes > self.cache_bytes:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    def _cache_drop(self, key: str):
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cached_bytes -= len(entry[1])
+
+    def invalidate(self, path: str):
+        """세션 파일 하나의 복호화 캐시를 비웁니다."""
+        with self._lock:
+            self._cache_drop(os.path.abspath(path))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+
+    def stats(self) -> VaultStats:
+        with self._lock:
+            return VaultStats(len(self._cache), self._cached_bytes, self.cache_bytes, self._hits, self._misses)
+
+    # --- 읽기/쓰기 ---
+
+    def read(self, path: str) -> bytes:
+        """
+        세션 DB 이미지를 반환합니다 (암호화되어 있으면 복호화, 평문이면 그대로).
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+            InvalidToken: 다른 키로 암호화되었거나 손상된 경우
+        """
+        key = os.path.abspath(path)
+        stamp = _file_stamp(key)
+        if stamp is None:
+            raise FileNotFoundError(f"세션 파일이 없습니다: {path}")
+        cached = self._cache_get(key, stamp)
+        if cached is not None:
+            return cached
+        with open(key, "rb") as f:
+            if f.read(len(STREAM_MAGIC)) != STREAM_MAGIC:
+                f.seek(0)
+                return f.read()
+            f.seek(0)
+            out = io.BytesIO()
+            self.encryption.decrypt_stream(f, out)
+        data = out.getvalue()
+        self._cache_put(key, stamp, data)
+        return data
+
+    def write(self, path: str, data: bytes):
+        """DB 이미지를 암호화해 원자적으로 저장합니다."""
+        key = os.path.abspath(path)
+        out = io.BytesIO()
+        self.encryption.encrypt_stream(io.BytesIO(data), out)
+        write_file_atomic(key, out.getvalue())
+        self._cache_put(key, _file_stamp(key), bytes(data))
+
+    def open_connection(self, path: str) -> sqlite3.Connection:
+        """
+        세션 파일을 메모리 SQLite 연결로 엽니다 (파일이 없으면 빈 DB).
+        바뀐 내용은 save_connection()으로 저장해야 파일에 반영됩니다.
+        """
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            data = self.read(path)
+        except FileNotFoundError:
+            return conn
+        if data:
+            conn.deserialize(data)
+        return conn
+
+    def save_connection(self, path: str, conn: sqlite3.Connection) -> bool:
+        """
+        메모리 SQLite 연결의 내용을 암호화해 세션 파일에 저장합니다.
+        캐시된 내용과 같으면 다시 암호화하지 않습니다.
+
+        Returns:
+            파일을 새로 썼는지 여부
+        """
+        conn.commit()
+        data = conn.serialize()
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is not None and entry[0] == _file_stamp(key) and entry[1] == data:
+            return False
+        self.write(path, data)
+        return True
+
+    # --- 변환 ---
+
+    def seal(self, path: str, destination: Optional[str] = None) -> bool:
+        """
+        평문 세션 파일을 암호화합니다 (이미 암호화되었거나 SQLite가 아니면 False).
+        destination을 주면 원본은 그대로 두고 암호화한 파일을 그 경로에 씁니다.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(SQLITE_HEADER)) != SQLITE_HEADER:
+                return False
+        # 쓰기 중이던 저널을 반영한 이미지를 얻도록 SQLite로 읽습니다
+        source = sqlite3.connect(path)
+        try:
+            data = source.serialize()
+        finally:
+            source.close()
+        self.write(destination or path, data)
+        return True
+
+    def unseal(self, path: str) -> bool:
+        """암호화된 세션 파일을 평문 SQLite로 되돌립니다 (암호화되지 않았으면 False)."""
+        if not is_sealed(path):
+            return False
+        data = self.read(path)
+        write_file_atomic(os.path.abspath(path), data)
+        self.invalidate(path)
+        return True
+
+    def seal_directory(self, sessions_dir: str = SESSIONS_DIR, unseal: bool = False) -> Dict[str, int]:
+        """
+        폴더의 모든 세션 파일을 암호화(또는 복호화)합니다.
+
+        Returns:
+            {"changed": 바뀐 파일 수, "skipped": 건너뛴 파일 수, "failed": 실패한 파일 수}
+        """
+        counts = {"changed": 0, "skipped": 0, "failed": 0}
+        with os.scandir(sessions_dir) as entries:
+            names = sorted(e.name for e in entries if e.is_file() and e.name.endswith(".session"))
+        for name in names:
+            path = os.path.join(sessions_dir, name)
+            try:
+                changed = self.unseal(path) if unseal else self.seal(path)
+            except (OSError, ValueError, sqlite3.Error, InvalidToken) as e:
+                logger.error(f"세션 파일 {'복호화' if unseal else '암호화'} 실패: {name} ({e!r})")
+                counts["failed"] += 1
+                continue
+            counts["changed" if changed else "skipped"] += 1
+        logger.info(f"세션 볼트 {'복호화' if unseal else '암호화'}: {counts}")
+        return counts
+
+
+_vault: Optional[SessionVault] = None
+_enabled = False
+_vault_lock = threading.Lock()
+
+
+def get_vault() -> SessionVault:
+    """암호화된 세션 파일을 읽을 때 쓰는 공유 볼트 (볼트 모드와 관계없이 사용할 수 있습니다)."""
+    global _vault  # pylint: disable=global-statement
+    with _vault_lock:
+        if _vault is None:
+            _vault = SessionVault()
+        return _vault
+
+
+def enable(cache_bytes: Optional[int] = None) -> SessionVault:
+    """볼트 모드를 켭니다. 이후 새로 만들거나 가져오는 세션 파일은 암호화되어 저장됩니다."""
+    global _enabled  # pylint: disable=global-statement
+    vault = get_vault()
+    if cache_bytes is not None:
+        vault.cache_bytes = max(0, int(cache_bytes))
+    _enabled = True
+    os.environ[ENV_VAR] = "1"
+    logger.info("세션 볼트 모드 사용 (세션 파일을 암호화해 저장합니다)")
+    return vault
+
+
+def disable():
+    """볼트 모드를 끕니다 (이미 암호화된 파일은 계속 읽을 수 있습니다)."""
+    global _enabled  # pylint: disable=global-statement
+    _enabled = False
+    os.environ.pop(ENV_VAR, None)
+
+
+def active_vault() -> Optional[SessionVault]:
+    """볼트 모드가 켜져 있으면 공유 볼트 (환경 변수로 켠 경우 포함)"""
+    if _enabled or os.environ.get(ENV_VAR):
+        return get_vault()
+    return None
+
+
+def vault_for(path: str) -> Optional[SessionVault]:
+    """이 세션 파일을 볼트로 열어야 하면 볼트를 반환합니다 (볼트 모드이거나 이미 암호화된 파일)."""
+    vault = active_vault()
+    if vault is not None:
+        return vault
+    return get_vault() if is_sealed(path) else None
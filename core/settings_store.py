@@ -0,0 +1,330 @@
+# core/settings_store.py
+"""API 자격 증명과 설정을 보관하는 SQLite 저장소 (비밀 필드는 행마다 따로 암호화)"""
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from cryptography.fernet import InvalidToken
+
+from core.constants import CONFIG_FILE, SECURE_CONFIG_FILE, SETTINGS_DB_FILE
+from core.security import ConfigEncryption
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS credentials
+(
+    name     TEXT PRIMARY KEY,
+    api_id   TEXT NOT NULL,
+    api_hash BLOB NOT NULL,
+    id_hash  TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS credentials_api_id ON credentials (api_id);
+
+CREATE TABLE IF NOT EXISTS settings
+(
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta
+(
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# 이전 형식의 설정(data/config.enc, config.json)을 가져왔는지 기록하는 meta 키
+_MIGRATED_SECURE = "migrated_secure_config"
+_MIGRATED_JSON = "migrated_json_config"
+
+# 가져온 config.json에 붙이는 접미사 (다시 가져오지 않도록 이름을 바꿔 둡니다)
+MIGRATED_SUFFIX = ".migrated"
+
+
+@dataclass(frozen=True)
+class Credential:
+    """API 자격 증명 하나 (api_hash는 복호화된 값)"""
+
+    name: str
+    api_id: str
+    api_hash: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"name": self.name, "api_id": self.api_id, "api_hash": self.api_hash}
+
+    @property
+    def id_hash(self) -> str:
+        return _id_hash(self.api_id)
+
+
+def _id_hash(api_id: str) -> str:
+    # 디버깅용 API ID 해시 (일부만 보이도록)
+    return hashlib.sha256(api_id.encode()).hexdigest()[:8]
+
+
+class SettingsStore:
+    """
+    API 자격 증명과 설정을 담는 SQLite 저장소.
+    자격 증명은 닉네임(기본 키)과 API ID(색인)로 찾고, API Hash는 ConfigEncryption 키로 행마다 따로 암호화합니다.
+    설정은 키 하나가 행 하나이므로, 무엇을 바꾸든 바뀐 행만 기록합니다.
+
+    autocommit=False이면 변경을 모아 두었다가 commit()을 호출할 때 한 번에 기록합니다.
+
+    복호화한 자격 증명과 설정은 메모리에 캐시해 조회할 때마다 복호화하지 않으며,
+    다른 연결(다른 프로세스 포함)이 DB를 바꾼 경우(PRAGMA data_version)에만 다시 읽습니다.
+    여러 변경은 transaction()으로 묶으면 한 번에 커밋됩니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str = SETTINGS_DB_FILE,
+        encryption: Optional[ConfigEncryption] = None,
+        autocommit: bool = True,
+    ):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            encryption: 비밀 필드 암호화에 쓸 키 (기본값: data/.key)
+            autocommit: 변경할 때마다 바로 커밋할지 여부
+        """
+        self.db_path = db_path
+        self.encryption = encryption or ConfigEncryption()
+        self.autocommit = autocommit
+        self._lock = threading.RLock()
+        self._depth = 0
+        # 복호화 캐시 (닉네임 → 자격 증명, 등록 순서 유지)와 캐시를 만든 시점의 data_version
+        self._credentials: Optional[Dict[str, Credential]] = None
+        self._settings: Optional[Dict[str, Any]] = None
+        self._data_version: Optional[int] = None
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    # --- 트랜잭션 ---
+
+    def _changed(self):
+        if self.autocommit and not self._depth:
+            self._conn.commit()
+
+    def commit(self):
+        """모아 둔 변경을 기록합니다."""
+        with self._lock:
+            self._conn.commit()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["SettingsStore"]:
+        """블록 안의 변경을 한 번에 커밋하고, 예외로 끝나면 모두 되돌립니다."""
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if not self._depth:
+                    self._conn.rollback()
+                    self._drop_cache()
+                raise
+            self._depth -= 1
+            if not self._depth:
+                self._conn.commit()
+
+    # --- 캐시 ---
+
+    def _drop_cache(self):
+        self._credentials = None
+        self._settings = None
+        self._data_version = None
+
+    def invalidate(self):
+        """다음 조회 때 DB에서 다시 읽도록 캐시를 비웁니다."""
+        with self._lock:
+            self._drop_cache()
+
+    def _cached(self):
+        """복호화 캐시를 반환합니다 (없거나 다른 연결이 DB를 바꿨으면 다시 읽습니다). 잠금을 잡고 호출합니다."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._credentials is None or version != self._data_version:
+            rows = self._conn.execute("SELECT name, api_id, api_hash FROM credentials ORDER BY rowid").fetchall()
+            self._credentials = {row[0]: self._credential(row) for row in rows}
+            rows = self._conn.execute("SELECT key, value FROM settings").fetchall()
+            self._settings = {key: json.loads(value) for key, value in rows}
+            self._data_version = version
+        return self._credentials, self._settings
+
+    # --- 메타 정보 ---
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute("REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    # --- 자격 증명 ---
+
+    def _credential(self, row) -> Credential:
+        return Credential(row[0], row[1], self.encryption.decrypt_value(row[2]))
+
+    def get_credential(self, name: str) -> Optional[Credential]:
+        with self._lock:
+            return self._cached()[0].get(name)
+
+    def find_credentials_by_id(self, api_id) -> List[Credential]:
+        api_id = str(api_id)
+        with self._lock:
+            return [cred for cred in self._cached()[0].values() if cred.api_id == api_id]
+
+    def list_credentials(self) -> List[Credential]:
+        """등록 순서대로 모든 자격 증명"""
+        with self._lock:
+            return list(self._cached()[0].values())
+
+    def add_credential(self, name: str, api_id, api_hash: str) -> bool:
+        """새 자격 증명을 추가합니다 (같은 닉네임이 있으면 False)."""
+        api_id = str(api_id)
+        with self._lock:
+            credentials = self._cached()[0]
+            if name in credentials:
+                return False
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO credentials (name, api_id, api_hash, id_hash) VALUES (?, ?, ?, ?)",
+                (name, api_id, self.encryption.encrypt_value(api_hash), _id_hash(api_id)),
+            )
+            if not cursor.rowcount:
+                # 캐시를 읽은 뒤 다른 연결이 같은 닉네임을 추가한 경우
+                self._drop_cache()
+                return False
+            credentials[name] = Credential(name, api_id, api_hash)
+            self._changed()
+        return True
+
+    def update_credential(self, name: str, api_id=None, api_hash: Optional[str] = None) -> bool:
+        """자격 증명 한 행의 API ID나 API Hash를 바꿉니다 (없는 닉네임이면 False)."""
+        assignments, params = [], []
+        if api_id is not None:
+            assignments += ["api_id = ?", "id_hash = ?"]
+            params += [str(api_id), _id_hash(str(api_id))]
+        if api_hash is not None:
+            assignments.append("api_hash = ?")
+            params.append(self.encryption.encrypt_value(api_hash))
+        with self._lock:
+            credentials = self._cached()[0]
+            cred = credentials.get(name)
+            if cred is None or not assignments:
+                return cred is not None
+            self._conn.execute(f"UPDATE credentials SET {', '.join(assignments)} WHERE name = ?", (*params, name))
+            credentials[name] = Credential(
+                name,
+                cred.api_id if api_id is None else str(api_id),
+                cred.api_hash if api_hash is None else api_hash,
+            )
+            self._changed()
+        return True
+
+    def remove_credential(self, name: str) -> bool:
+        with self._lock:
+            credentials = self._cached()[0]
+            if credentials.pop(name, None) is None:
+                return False
+            self._conn.execute("DELETE FROM credentials WHERE name = ?", (name,))
+            self._changed()
+        return True
+
+    # --- 설정 ---
+
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            settings = self._cached()[1]
+            return copy.deepcopy(settings[key]) if key in settings else default
+
+    def settings(self) -> Dict[str, Any]:
+        """모든 설정 (키 → 값, 복사본)"""
+        with self._lock:
+            return copy.deepcopy(self._cached()[1])
+
+    def set_setting(self, key: str, value: Any):
+        with self._lock:
+            settings = self._cached()[1]
+            self._conn.execute(
+                "REPLACE INTO settings (key, value) VALUES (?, ?)", (key, json.dumps(value, ensure_ascii=False))
+            )
+            settings[key] = copy.deepcopy(value)
+            self._changed()
+
+    # --- 이전 형식 가져오기 ---
+
+    def _import_config(self, config: Dict[str, Any], overwrite: bool) -> int:
+        """설정 dict (config.json/config.enc 구조)를 가져옵니다. overwrite가 False이면 이미 있는 항목은 그대로 둡니다."""
+        added = 0
+        for cred in config.get("api_credentials", []):
+            name = cred.get("name")
+            if not name:
+                continue
+            if self.add_credential(name, cred.get("api_id", ""), cred.get("api_hash", "")):
+                added += 1
+            elif overwrite:
+                self.update_credential(name, cred.get("api_id", ""), cred.get("api_hash", ""))
+        settings = self._cached()[1]
+        for key, value in config.items():
+            if key != "api_credentials" and (overwrite or key not in settings):
+                self.set_setting(key, value)
+        return added
+
+    def migrate_legacy(self, json_path: str = CONFIG_FILE, secure_path: str = SECURE_CONFIG_FILE):
+        """
+        이전 형식의 설정(data/config.enc, config.json)을 처음 한 번만 가져옵니다.
+        가져온 파일은 meta에 기록해 두므로 다시 가져오지 않으며, config.json은 지우지 않고
+        config.json.migrated로 이름만 바꿔 둡니다. 이후 설정은 Config의 save_* 메서드나 `tgcc config set`으로 바꿉니다.
+        """
+        json_imported = False
+        with self.transaction():
+            if os.path.exists(secure_path) and not self._get_meta(_MIGRATED_SECURE):
+                try:
+                    config = self.encryption.decrypt_file(Path(secure_path))
+                except (InvalidToken, ValueError) as e:
+                    logger.error(f"암호화된 설정을 복호화할 수 없어 가져오지 않았습니다: {secure_path} ({e!r})")
+                else:
+                    added = self._import_config(config, overwrite=False)
+                    self._set_meta(_MIGRATED_SECURE, os.path.abspath(secure_path))
+                    logger.info(f"{secure_path}에서 API {added}개를 가져왔습니다")
+            if os.path.exists(json_path) and not self._get_meta(_MIGRATED_JSON):
+                try:
+                    with open(json_path, "r", encoding="utf-8") as f:
+                        config = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.error(f"설정 파일을 읽을 수 없어 가져오지 않았습니다: {json_path} ({e})")
+                else:
+                    added = self._import_config(config, overwrite=True)
+                    self._set_meta(_MIGRATED_JSON, os.path.abspath(json_path))
+                    json_imported = True
+                    logger.info(f"{json_path}에서 API {added}개와 설정을 가져왔습니다")
+        if not json_imported:
+            return
+        try:
+            os.replace(json_path, json_path + MIGRATED_SUFFIX)
+        except OSError as e:
+            logger.warning(f"가져온 설정 파일의 이름을 바꾸지 못했습니다: {json_path} ({e})")
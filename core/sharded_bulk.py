@@ -0,0 +1,369 @@
+# core/sharded_bulk.py
+"""대량 일괄 검사/가져오기를 여러 프로세스로 나눠 실행하는 모듈"""
+import asyncio
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from core.bulk_check import BulkSessionChecker, SessionCheckResult, list_session_files
+from core.bulk_import import (
+    STATUS_DUPLICATE,
+    STATUS_FAILED,
+    STATUS_IMPORTED,
+    STATUS_INVALID,
+    BulkSessionImporter,
+    ImportFileReader,
+    ImportResult,
+)
+from core.constants import DEFAULT_BULK_CHECK_CONCURRENCY, RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND, SESSIONS_DIR
+from core.metrics import phase_metrics
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류
+TASK_CHECK = "check"
+TASK_IMPORT = "import"
+
+# 결과 큐 메시지 종류
+_MSG_RESULT = "result"
+_MSG_DONE = "done"
+# 큐와 중지 요청을 확인하는 간격 (초)
+_POLL_INTERVAL = 0.5
+
+
+def default_process_count() -> int:
+    """사용할 수 있는 CPU 코어 수"""
+    return os.cpu_count() or 1
+
+
+def create_adapter(library: str, api_id, api_hash):
+    """라이브러리 이름에 맞는 어댑터를 만듭니다. 필요한 라이브러리만 불러옵니다 (워커 프로세스, CLI)."""
+    if library == "Telethon":
+        from adapters.telethon_adapter import TelethonAdapter
+
+        return TelethonAdapter(api_id, api_hash)
+    from adapters.pyrogram_adapter import PyrogramAdapter
+
+    return PyrogramAdapter(api_id, api_hash)
+
+
+def _next_task(task_queue, stop_event) -> Any:
+    """작업 큐에서 다음 항목을 꺼냅니다 (끝 표시를 받거나 중지되면 None)."""
+    while not stop_event.is_set():
+        try:
+            return task_queue.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return None
+
+
+async def _run_shard(kind: str, library: str, api_id, api_hash, options: dict, task_queue, result_queue, stop_event):
+    """워커 프로세스 안에서 concurrency개의 코루틴으로 작업 큐를 처리합니다."""
+    from adapters.client_pool import client_pool
+    from adapters.rate_limiter import rate_limiter
+    from adapters.resilience import dc_breakers
+
+    dc_breakers.configure(**options["retry"])
+
+    # 속도 제한기는 프로세스마다 따로 있으므로 레인별 전체 속도가 그대로 유지되도록 나눕니다
+    processes = options["processes"]
+    rate_limiter.configure(rate=RATE_LIMIT_PER_SECOND / processes, burst=max(1, RATE_LIMIT_BURST // processes))
+
+    adapter = create_adapter(library, api_id, api_hash)
+    concurrency = options["concurrency"]
+    if kind == TASK_CHECK:
+        checker = BulkSessionChecker(adapter, concurrency, options["sessions_dir"])
+        handle = checker.check_one
+    else:
+        importer = BulkSessionImporter(adapter, concurrency, options["sessions_dir"], verify=options["verify"])
+
+        async def handle(task):
+            record, session_name = task
+            return await importer.import_prepared(record, session_name)
+
+    loop = asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(concurrency, thread_name_prefix="shard-queue")
+
+    async def worker():
+        while True:
+            task = await loop.run_in_executor(executor, _next_task, task_queue, stop_event)
+            if task is None:
+                return
+            result_queue.put((_MSG_RESULT, await handle(task)))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+
+    async def watch_stop():
+        # 중지 요청이 오면 진행 중인 요청도 취소해 어댑터가 연결을 정리하게 합니다
+        while not stop_event.is_set():
+            await asyncio.sleep(_POLL_INTERVAL)
+        for task in workers:
+            task.cancel()
+
+    watcher = asyncio.ensure_future(watch_stop())
+    try:
+        await asyncio.gather(*workers, return_exceptions=True)
+    finally:
+        watcher.cancel()
+        await client_pool.close_all()
+        executor.shutdown(wait=False)
+
+
+def _shard_main(index: int, kind: str, library: str, api_id, api_hash, options: dict, task_queue, result_queue, stop_event):
+    """워커 프로세스 진입점. 자기 이벤트 루프와 어댑터를 만들고, 끝나면 단계별 지연 시간 기록과 함께 완료 메시지를 보냅니다."""
+    error = None
+    try:
+        asyncio.run(_run_shard(kind, library, api_id, api_hash, options, task_queue, result_queue, stop_event))
+    except Exception as e:  # pylint: disable=broad-except
+        logger.error(f"샤드 {index} 오류: {type(e).__name__}: {e}", exc_info=True)
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        result_queue.put((_MSG_DONE, index, error, phase_metrics.export_state()))
+
+
+class _ShardedRunner:
+    """
+    작업 목록을 공유 큐로 여러 프로세스에 나눠 주고 결과를 호출한 스레드로 모아 오는 기반 클래스.
+    각 프로세스는 자기 이벤트 루프와 어댑터를 가지므로 암호화와 직렬화가 GIL 하나를 두고 다투지 않습니다.
+    """
+
+    KIND = ""
+
+    def __init__(
+        self,
+        library: str,
+        api_id,
+        api_hash,
+        processes: int,
+        concurrency: int = DEFAULT_BULK_CHECK_CONCURRENCY,
+        sessions_dir: str = SESSIONS_DIR,
+    ):
+        """
+        Args:
+            library: "Telethon" 또는 "Pyrogram"
+            api_id, api_hash: 워커 프로세스에서 어댑터를 만들 API 정보
+            processes: 워커 프로세스 수
+            concurrency: 프로세스마다 동시에 처리할 항목 수
+            sessions_dir: 세션 파일 폴더
+        """
+        self.library = library
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.processes = max(1, int(processes))
+        self.concurrency = max(1, int(concurrency))
+        self.sessions_dir = sessions_dir
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        # 이 프로세스에서 바로 끝난 항목의 결과 (작업 분배 스레드 -> 호출한 스레드)
+        self._local_results: "queue.Queue[Any]" = queue.Queue()
+        self._feed_error: Optional[str] = None
+
+    def stop(self):
+        """남은 항목을 건너뛰고 워커 프로세스의 진행 중인 요청을 취소합니다."""
+        self._stop_event.set()
+
+    def _options(self) -> dict:
+        from adapters.resilience import dc_breakers
+
+        return {
+            "processes": self.processes,
+            "concurrency": self.concurrency,
+            "sessions_dir": self.sessions_dir,
+            # 이 프로세스의 재시도/차단 설정을 워커 프로세스에도 적용
+            "retry": dc_breakers.settings(),
+        }
+
+    def _post(self, result: Any):
+        """워커 프로세스를 거치지 않고 끝난 결과를 호출한 스레드로 전달합니다."""
+        self._local_results.put(result)
+
+    def _drain_local(self, on_result: Callable[[Any], None]):
+        while True:
+            try:
+                on_result(self._local_results.get_nowait())
+            except queue.Empty:
+                return
+
+    def _feed(self, tasks: Iterable[Any], task_queue, processes: List, finished: threading.Event):
+        """작업을 큐에 넣고, 다 넣으면 워커 코루틴마다 끝 표시(None)를 보냅니다."""
+
+        def put(item) -> bool:
+            while not (self._stop_event.is_set() or finished.is_set()):
+                if not any(process.is_alive() for process in processes):
+                    return False
+                try:
+                    task_queue.put(item, timeout=_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            for task in tasks:
+                if not put(task):
+                    return
+            for _ in range(self.processes * self.concurrency):
+                if not put(None):
+                    return
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"샤드 작업 분배 오류: {type(e).__name__}: {e}", exc_info=True)
+            self._feed_error = f"작업 분배 오류: {type(e).__name__}: {e}"
+            self.stop()
+
+    def _run_shards(self, tasks: Iterable[Any], on_result: Callable[[Any], None]):
+        """
+        워커 프로세스를 띄워 작업을 처리하고, 결과를 도착 순서대로 on_result에 전달합니다.
+
+        Raises:
+            RuntimeError: 워커 프로세스가 오류로 끝난 경우 (그때까지의 결과는 전달된 뒤)
+        """
+        ctx = self._context
+        task_queue = ctx.Queue(maxsize=self.processes * self.concurrency * 2)
+        result_queue = ctx.Queue()
+        options = self._options()
+        processes = [
+            ctx.Process(
+                target=_shard_main,
+                args=(index, self.KIND, self.library, self.api_id, self.api_hash, options,
+                      task_queue, result_queue, self._stop_event),
+                name=f"{self.KIND}-shard-{index}",
+                daemon=True,
+            )
+            for index in range(self.processes)
+        ]
+        for process in processes:
+            process.start()
+        logger.info(f"샤드 작업 시작: {self.KIND}, 프로세스 {self.processes}개 x 동시성 {self.concurrency}")
+
+        finished = threading.Event()
+        feeder = threading.Thread(target=self._feed, args=(tasks, task_queue, processes, finished), daemon=True)
+        feeder.start()
+
+        errors = []
+        pending = set(range(self.processes))
+        try:
+            while pending:
+                self._drain_local(on_result)
+                try:
+                    message = result_queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    # 완료 메시지 없이 비정상 종료된 프로세스는 기다리지 않습니다
+                    for index in list(pending):
+                        exitcode = processes[index].exitcode
+                        if exitcode not in (None, 0):
+                            errors.append(f"샤드 {index} 비정상 종료 (exitcode={exitcode})")
+                            pending.discard(index)
+                    continue
+                if message[0] == _MSG_RESULT:
+                    on_result(message[1])
+                else:
+                    _, index, error, metrics = message
+                    pending.discard(index)
+                    phase_metrics.merge(metrics)
+                    if error:
+                        errors.append(f"샤드 {index}: {error}")
+        finally:
+            finished.set()
+            feeder.join(timeout=5)
+            for process in processes:
+                process.join(timeout=5)
+        self._drain_local(on_result)
+
+        if self._feed_error:
+            raise RuntimeError(self._feed_error)
+        if errors and not self._stop_event.is_set():
+            raise RuntimeError("; ".join(errors))
+
+
+class ShardedBulkChecker(_ShardedRunner):
+    """세션 폴더 검사를 여러 프로세스로 나눠 실행합니다 (BulkSessionChecker.run과 같은 사용법)."""
+
+    KIND = TASK_CHECK
+
+    def run(
+        self,
+        session_files: Optional[List[str]] = None,
+        on_result: Optional[Callable[[SessionCheckResult], None]] = None,
+    ) -> List[SessionCheckResult]:
+        """
+        세션들을 검사합니다. 결과 콜백은 호출한 스레드에서 실행됩니다.
+
+        Returns:
+            완료된 검사 결과 목록 (완료 순서)
+        """
+        if session_files is None:
+            session_files = list_session_files(self.sessions_dir)
+
+        logger.info(f"샤드 일괄 검사 시작: {len(session_files)}개 세션, 프로세스 {self.processes}개")
+        results: List[SessionCheckResult] = []
+
+        def collect(result: SessionCheckResult):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        self._run_shards(session_files, collect)
+        logger.info(f"샤드 일괄 검사 종료: {len(results)}/{len(session_files)}개 완료")
+        return results
+
+
+class ShardedBulkImporter(_ShardedRunner):
+    """
+    세션 문자열 파일 가져오기를 여러 프로세스로 나눠 실행합니다 (BulkSessionImporter.run과 같은 사용법).
+    형식 검사와 중복 확인, 파일 이름 결정은 이 프로세스에서 하므로 여러 프로세스가 같은 파일을 쓰지 않습니다.
+    """
+
+    KIND = TASK_IMPORT
+
+    def __init__(self, *args, verify: bool = True, overwrite: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.verify = verify
+        self._planner = BulkSessionImporter(None, self.concurrency, self.sessions_dir, verify, overwrite)
+
+    def _options(self) -> dict:
+        options = super()._options()
+        options["verify"] = self.verify
+        return options
+
+    def _tasks(self, reader: ImportFileReader) -> Iterator[Any]:
+        for record in reader:
+            if self._stop_event.is_set():
+                return
+            prepared = self._planner.prepare(record)
+            if isinstance(prepared, ImportResult):
+                self._post(prepared)
+            else:
+                yield record, prepared
+
+    def run(
+        self,
+        path: str,
+        on_result: Optional[Callable[[ImportResult, float], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        파일의 세션 문자열을 가져옵니다. 결과 콜백은 호출한 스레드에서 (결과, 파일 진행률)로 호출됩니다.
+
+        Returns:
+            상태별 항목 수
+        """
+        reader = ImportFileReader(path)
+        logger.info(f"샤드 일괄 가져오기 시작: {path} ({reader.format}, {reader.total_bytes} bytes), 프로세스 {self.processes}개")
+        counts = {STATUS_IMPORTED: 0, STATUS_DUPLICATE: 0, STATUS_INVALID: 0, STATUS_FAILED: 0}
+
+        def collect(result: ImportResult):
+            # 워커에서 가져오지 못한 항목의 이름은 이 프로세스의 목록에서 풉니다
+            self._planner.release(result)
+            counts[result.status] += 1
+            if on_result:
+                on_result(result, reader.progress)
+
+        self._run_shards(self._tasks(reader), collect)
+        logger.info(
+            f"샤드 일괄 가져오기 종료: 성공 {counts[STATUS_IMPORTED]}, 중복 {counts[STATUS_DUPLICATE]}, "
+            f"형식 오류 {counts[STATUS_INVALID]}, 실패 {counts[STATUS_FAILED]}"
+        )
+        return counts
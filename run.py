@@ -4,6 +4,7 @@
 두 파일(run.py, ui/main.py)의 장점을 결합
 """
 import logging
+import multiprocessing
 import os
 import sys
 import warnings
@@ -59,4 +60,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 대량 일괄 작업의 워커 프로세스가 패키징된 실행 파일에서도 시작되도록
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,2 @@
+# tgcc/__init__.py
+"""베로니카 명령줄 도구 (Qt 없이 실행됩니다)"""
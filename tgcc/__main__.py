@@ -0,0 +1,11 @@
+# tgcc/__main__.py
+"""python -m tgcc 진입점"""
+import multiprocessing
+import sys
+
+from tgcc.cli import main
+
+if __name__ == "__main__":
+    # 대량 일괄 작업의 워커 프로세스가 패키징된 실행 파일에서도 시작되도록
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,460 @@
+# tgcc/cli.py
+"""
+Qt 없이 세션을 일괄 처리하는 명령줄 도구.
+
+    python -m tgcc check   [세션 ...] [--api 닉네임] [--library Telethon] [--concurrency 20] [--json]
+    python -m tgcc import  파일 [--no-verify] [--overwrite] [--concurrency 20] [--json]
+    python -m tgcc export  출력파일 [세션 ...] [--format zip] [--string-library Pyrogram]
+    python -m tgcc convert 출력폴더 --to Pyrogram [--source 원본폴더]
+    python -m tgcc vault   seal|unseal [--sessions-dir 폴더]
+    python -m tgcc config  show [키] | set 키 값
+
+check/import는 GUI와 같은 세션 폴더(SESSIONS_DIR)와 설정 저장소(data/settings.db)의 API 정보를 사용합니다.
+--json을 지정하면 결과가 나올 때마다 stdout에 JSON 한 줄을 쓰고 마지막 줄에 요약을 씁니다. 로그는 stderr로 나갑니다.
+check/import의 단계별 지연 시간은 --metrics-file(끝날 때 저장)이나 --metrics-port(실행 중 제공)로 OpenMetrics 형식으로 받을 수 있습니다.
+
+종료 코드: 0 모두 성공, 1 실패한 항목이 있음, 2 사용법/설정 오류 또는 실행 실패, 130 사용자가 중단함
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from adapters.client_pool import client_pool
+from adapters.event_loop import get_background_loop
+from adapters.resilience import dc_breakers
+from core import session_vault
+from core.bulk_check import STATUS_VALID, BulkSessionChecker, CheckReportWriter
+from core.bulk_export import EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP, BulkSessionExporter
+from core.bulk_import import STATUS_FAILED, STATUS_INVALID, BulkSessionImporter
+from core.config import Config
+from core.constants import MAX_BULK_CHECK_CONCURRENCY, SESSIONS_DIR, SHARDING_MIN_IMPORT_BYTES, SHARDING_MIN_SESSIONS
+from core.metrics import phase_metrics, serve_openmetrics
+from core.session_catalog import SessionCatalog
+from core.session_converter import convert_directory
+from core.sharded_bulk import ShardedBulkChecker, ShardedBulkImporter, create_adapter
+
+logger = logging.getLogger(__name__)
+
+# 종료 코드 (EXIT_USAGE는 명령 자체를 실행하지 못한 경우도 포함)
+EXIT_OK = 0
+EXIT_FAILURES = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+LIBRARIES = ("Telethon", "Pyrogram")
+
+
+class CliError(Exception):
+    """사용법이나 설정 문제로 명령을 실행할 수 없는 경우"""
+
+
+class OutputWriter:
+    """결과를 사람이 읽는 한 줄 또는 JSON Lines로 출력합니다. 결과마다 바로 flush합니다."""
+
+    def __init__(self, command: str, json_mode: bool, stream: TextIO = sys.stdout):
+        self.command = command
+        self.json_mode = json_mode
+        self.stream = stream
+        self._started = time.perf_counter()
+
+    def _write(self, line: str):
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def result(self, payload: Dict[str, Any], text: str):
+        """항목 하나의 결과"""
+        if self.json_mode:
+            self._write(json.dumps({"type": "result", "command": self.command, **payload}, ensure_ascii=False))
+        else:
+            self._write(text)
+
+    def summary(self, counts: Dict[str, int], **extra):
+        """명령이 끝난 뒤 상태별 항목 수"""
+        elapsed = round(time.perf_counter() - self._started, 3)
+        if self.json_mode:
+            payload = {"type": "summary", "command": self.command, "counts": counts, "elapsed": elapsed, **extra}
+            self._write(json.dumps(payload, ensure_ascii=False))
+        else:
+            text = ", ".join(f"{key} {value}" for key, value in counts.items())
+            self._write(f"완료 ({elapsed:.1f}초): {text}")
+            for key, value in extra.items():
+                self._write(f"{key}: {value}")
+
+
+# --- 설정 ---
+
+
+def resolve_api(args: argparse.Namespace, config: Config) -> Tuple[Any, str]:
+    """
+    사용할 API ID와 Hash를 정합니다.
+    --api-id/--api-hash가 있으면 그대로 쓰고, 없으면 --api 닉네임, 마지막 사용 API, 하나뿐인 API 순서로 찾습니다.
+
+    Raises:
+        CliError: API 정보를 찾지 못한 경우
+    """
+    if args.api_id or args.api_hash:
+        if not (args.api_id and args.api_hash):
+            raise CliError("--api-id와 --api-hash를 함께 지정해야 합니다")
+        return args.api_id, args.api_hash
+
+    credentials = config.get_api_credentials()
+    nickname = args.api or config.get_last_used_api()
+    if nickname is None and len(credentials) == 1:
+        nickname = credentials[0].get("name")
+    cred = config.get_api_credential(nickname) if nickname else None
+    if cred is not None:
+        return cred["api_id"], cred["api_hash"]
+    if nickname:
+        raise CliError(f"등록된 API가 아닙니다: {nickname}")
+    raise CliError("사용할 API를 --api 또는 --api-id/--api-hash로 지정하세요")
+
+
+def resolve_concurrency(args: argparse.Namespace, config: Config) -> int:
+    concurrency = args.concurrency or config.get_bulk_check_concurrency()
+    return max(1, min(int(concurrency), MAX_BULK_CHECK_CONCURRENCY))
+
+
+def resolve_processes(args: argparse.Namespace, config: Config, size: int, threshold: int) -> int:
+    """직접 지정한 프로세스 수는 그대로 쓰고, 설정값은 GUI처럼 규모가 클 때만 사용합니다."""
+    if args.processes is not None:
+        return max(1, args.processes)
+    processes = config.get_shard_processes()
+    return processes if size >= threshold else 1
+
+
+def configure_network(config: Config):
+    """GUI와 같은 연결 풀/재시도 설정을 적용합니다."""
+    client_pool.configure(config.get_client_pool_ttl(), config.get_client_pool_max_size())
+    dc_breakers.configure(**config.get_retry_settings())
+
+
+def configure_vault(config: Config):
+    """GUI와 같이 설정에서 세션 볼트 모드를 켰으면 켭니다 (워커 프로세스도 물려받습니다)."""
+    if config.get_session_vault():
+        session_vault.enable(config.get_vault_cache_bytes())
+
+
+def setting_values(config: Config) -> Dict[str, Any]:
+    """`tgcc config`로 보고 바꿀 수 있는 설정 (재시도 설정은 "retry.항목" 키)"""
+    values = {
+        "bulk_check_concurrency": config.get_bulk_check_concurrency(),
+        "shard_processes": config.get_shard_processes(),
+        "client_pool_ttl": config.get_client_pool_ttl(),
+        "client_pool_max_size": config.get_client_pool_max_size(),
+        "metrics_port": config.get_metrics_port(),
+        "vault_cache_bytes": config.get_vault_cache_bytes(),
+    }
+    values.update({f"retry.{key}": value for key, value in config.get_retry_settings().items()})
+    return values
+
+
+def save_setting(config: Config, key: str, value: Any):
+    """setting_values()의 키 하나를 Config의 저장 메서드로 바꿉니다."""
+    if key.startswith("retry."):
+        config.save_retry_settings(**{key[len("retry.") :]: value})
+    else:
+        getattr(config, f"save_{key}")(value)
+
+
+def close_clients():
+    """공유 루프에 남은 연결을 정리합니다."""
+    try:
+        get_background_loop().run(client_pool.close_all(), timeout=10)
+    except Exception as e:  # pylint: disable=broad-except
+        logger.warning(f"연결 정리 중 오류: {type(e).__name__}: {e}")
+
+
+@contextlib.contextmanager
+def metrics_output(args: argparse.Namespace):
+    """요청한 경우 실행 중 메트릭 엔드포인트를 열고, 끝나면 (실패하거나 중단되어도) 메트릭 파일을 저장합니다."""
+    port = getattr(args, "metrics_port", None)
+    path = getattr(args, "metrics_file", None)
+    server = serve_openmetrics(port) if port else None
+    try:
+        yield
+    finally:
+        if path:
+            phase_metrics.write_openmetrics(path)
+        if server:
+            server.shutdown()
+
+
+def run_interruptible(runner, func: Callable[[], Any]) -> Any:
+    """Ctrl+C를 누르면 runner.stop()으로 진행 중인 작업을 취소한 뒤 KeyboardInterrupt를 다시 발생시킵니다."""
+    try:
+        return func()
+    except KeyboardInterrupt:
+        runner.stop()
+        raise
+
+
+# --- 명령 ---
+
+
+def cmd_check(args: argparse.Namespace, out: OutputWriter) -> int:
+    config = Config()
+    api_id, api_hash = resolve_api(args, config)
+    library = args.library or config.get_last_used_library()
+    concurrency = resolve_concurrency(args, config)
+    configure_network(config)
+    configure_vault(config)
+
+    catalog = SessionCatalog(SESSIONS_DIR)
+    try:
+        catalog.refresh()
+        session_files = [_session_file(name) for name in args.sessions] if args.sessions else catalog.names()
+        processes = resolve_processes(args, config, len(session_files), SHARDING_MIN_SESSIONS)
+        if processes > 1:
+            checker = ShardedBulkChecker(library, api_id, api_hash, processes, concurrency)
+        else:
+            checker = BulkSessionChecker(create_adapter(library, api_id, api_hash), concurrency)
+        logger.info(f"CLI 일괄 검사: {len(session_files)}개 세션, {library}, 동시성={concurrency}, 프로세스={processes}")
+
+        counts: Dict[str, int] = {}
+        report = CheckReportWriter(args.report_dir) if args.report_dir else None
+
+        def on_result(result):
+            counts[result.status] = counts.get(result.status, 0) + 1
+            catalog.record_check_result(result.session_file, result.status, result.message, result.checked_at)
+            if report:
+                report.write(result)
+            out.result(asdict(result), f"{result.session_file}\t{result.status}\t{result.latency:.2f}s\t{result.message}")
+
+        try:
+            run_interruptible(checker, lambda: checker.run(session_files, on_result=on_result))
+        finally:
+            if report:
+                report.close()
+    finally:
+        catalog.close()
+        close_clients()
+
+    extra = {"report": report.json_path} if report else {}
+    out.summary(counts, **extra)
+    failed = sum(count for status, count in counts.items() if status != STATUS_VALID)
+    return EXIT_FAILURES if failed or len(session_files) > sum(counts.values()) else EXIT_OK
+
+
+def cmd_import(args: argparse.Namespace, out: OutputWriter) -> int:
+    if not os.path.isfile(args.path):
+        raise CliError(f"파일을 찾을 수 없습니다: {args.path}")
+    config = Config()
+    api_id, api_hash = resolve_api(args, config)
+    library = args.library or config.get_last_used_library()
+    concurrency = resolve_concurrency(args, config)
+    configure_network(config)
+    configure_vault(config)
+
+    processes = resolve_processes(args, config, os.path.getsize(args.path), SHARDING_MIN_IMPORT_BYTES)
+    if processes > 1:
+        importer = ShardedBulkImporter(
+            library, api_id, api_hash, processes, concurrency, verify=not args.no_verify, overwrite=args.overwrite
+        )
+    else:
+        importer = BulkSessionImporter(
+            create_adapter(library, api_id, api_hash), concurrency, verify=not args.no_verify, overwrite=args.overwrite
+        )
+    logger.info(f"CLI 일괄 가져오기: {args.path}, {library}, 동시성={concurrency}, 프로세스={processes}")
+
+    def on_result(result, progress):
+        payload = {**asdict(result), "progress": round(progress, 4)}
+        out.result(payload, f"{result.line_no}\t{result.status}\t{result.session_file or '-'}\t{result.message}")
+
+    try:
+        counts = run_interruptible(importer, lambda: importer.run(args.path, on_result=on_result))
+    finally:
+        close_clients()
+
+    out.summary(counts)
+    return EXIT_FAILURES if counts[STATUS_INVALID] or counts[STATUS_FAILED] else EXIT_OK
+
+
+def cmd_export(args: argparse.Namespace, out: OutputWriter) -> int:
+    export_format = args.format or (EXPORT_FORMAT_ZIP if args.output.lower().endswith(".zip") else EXPORT_FORMAT_JSONL)
+    if args.sessions:
+        session_files = [_session_file(name) for name in args.sessions]
+    else:
+        session_files = _list_sessions(args.sessions_dir)
+    exporter = BulkSessionExporter(args.sessions_dir, string_library=args.string_library)
+
+    def on_result(result):
+        out.result(asdict(result), f"{result.session_file}\t{'ok' if result.ok else 'failed'}\t{result.message}")
+
+    counts = run_interruptible(
+        exporter, lambda: exporter.run(session_files, args.output, export_format, on_result=on_result)
+    )
+    out.summary(counts, output=args.output)
+    return EXIT_FAILURES if counts["failed"] else EXIT_OK
+
+
+def cmd_convert(args: argparse.Namespace, out: OutputWriter) -> int:
+    counts = {"converted": 0, "failed": 0}
+
+    def on_result(result):
+        counts["converted" if result.ok else "failed"] += 1
+        out.result(asdict(result), f"{os.path.basename(result.source)}\t{'ok' if result.ok else 'failed'}\t{result.message}")
+
+    try:
+        convert_directory(args.source, args.output, args.to, api_id=args.api_id, on_result=on_result)
+    except ValueError as e:
+        raise CliError(str(e)) from e
+    out.summary(counts, output=args.output)
+    return EXIT_FAILURES if counts["failed"] else EXIT_OK
+
+
+def cmd_vault(args: argparse.Namespace, out: OutputWriter) -> int:
+    if not os.path.isdir(args.sessions_dir):
+        raise CliError(f"세션 폴더를 찾을 수 없습니다: {args.sessions_dir}")
+    config = Config()
+    seal = args.action == "seal"
+    counts = session_vault.get_vault().seal_directory(args.sessions_dir, unseal=not seal)
+    # 이후 GUI와 CLI가 새로 쓰는 세션 파일도 같은 방식으로 저장되도록 설정을 바꿉니다
+    config.save_session_vault(seal)
+    config.flush()
+    out.summary(counts, sessions_dir=args.sessions_dir, session_vault=seal)
+    return EXIT_FAILURES if counts["failed"] else EXIT_OK
+
+
+def cmd_config(args: argparse.Namespace, out: OutputWriter) -> int:
+    config = Config()
+    values = setting_values(config)
+    if args.key is not None and args.key not in values:
+        raise CliError(f"알 수 없는 설정: {args.key} (사용 가능: {', '.join(values)})")
+    if args.action == "set":
+        if args.key is None or args.value is None:
+            raise CliError("바꿀 설정의 키와 값을 지정하세요")
+        try:
+            value = type(values[args.key])(args.value)
+        except ValueError as e:
+            raise CliError(f"{args.key}에 쓸 수 없는 값입니다: {args.value}") from e
+        save_setting(config, args.key, value)
+        config.flush()
+        values = setting_values(config)
+    elif args.value is not None:
+        raise CliError("show에는 값을 지정할 수 없습니다")
+
+    keys = [args.key] if args.key else list(values)
+    for key in keys:
+        out.result({"key": key, "value": values[key]}, f"{key}\t{values[key]}")
+    out.summary({"settings": len(keys)})
+    return EXIT_OK
+
+
+def _session_file(name: str) -> str:
+    return name if name.endswith(".session") else f"{name}.session"
+
+
+def _list_sessions(sessions_dir: str) -> List[str]:
+    if not os.path.isdir(sessions_dir):
+        raise CliError(f"세션 폴더를 찾을 수 없습니다: {sessions_dir}")
+    return sorted(name for name in os.listdir(sessions_dir) if name.endswith(".session"))
+
+
+# --- 인자 ---
+
+
+def _add_output_options(parser: argparse.ArgumentParser):
+    parser.add_argument("--json", action="store_true", help="결과를 JSON Lines로 stdout에 출력")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그를 stderr에 출력")
+
+
+def _add_api_options(parser: argparse.ArgumentParser):
+    parser.add_argument("--api", help="설정 저장소(data/settings.db)에 등록된 API 닉네임 (기본값: 마지막 사용 API)")
+    parser.add_argument("--api-id", help="API ID (--api-hash와 함께 지정)")
+    parser.add_argument("--api-hash", help="API Hash")
+    parser.add_argument("--library", choices=LIBRARIES, help="사용할 라이브러리 (기본값: 마지막 사용 라이브러리)")
+    parser.add_argument(
+        "--concurrency", type=int, help=f"동시에 처리할 세션 수 (최대 {MAX_BULK_CHECK_CONCURRENCY}, 기본값: 설정값)"
+    )
+    parser.add_argument("--processes", type=int, help="워커 프로세스 수 (기본값: 대량 작업일 때만 설정값 사용)")
+    parser.add_argument("--metrics-file", help="단계별 지연 시간을 OpenMetrics 형식으로 저장할 파일")
+    parser.add_argument("--metrics-port", type=int, help="실행 중 /metrics 엔드포인트를 열 포트 (127.0.0.1)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="tgcc", description="텔레그램 세션 일괄 처리 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    check = subparsers.add_parser("check", help="세션 유효성 일괄 검사")
+    check.add_argument("sessions", nargs="*", help="검사할 세션 이름 (없으면 세션 폴더 전체)")
+    check.add_argument("--report-dir", help="CSV/JSON 리포트를 저장할 폴더")
+    _add_api_options(check)
+    _add_output_options(check)
+    check.set_defaults(handler=cmd_check)
+
+    import_ = subparsers.add_parser("import", help="세션 문자열 파일 일괄 가져오기 (.txt/.csv/.jsonl)")
+    import_.add_argument("path", help="세션 문자열 파일")
+    import_.add_argument("--no-verify", action="store_true", help="텔레그램 연결 확인 없이 저장")
+    import_.add_argument("--overwrite", action="store_true", help="같은 이름의 세션 파일 덮어쓰기")
+    _add_api_options(import_)
+    _add_output_options(import_)
+    import_.set_defaults(handler=cmd_import)
+
+    export = subparsers.add_parser("export", help="세션 일괄 내보내기 (JSONL 문자열 또는 ZIP)")
+    export.add_argument("output", help="결과 파일 (.jsonl 또는 .zip)")
+    export.add_argument("sessions", nargs="*", help="내보낼 세션 이름 (없으면 세션 폴더 전체)")
+    export.add_argument("--format", choices=(EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP), help="기본값: 출력 파일 확장자")
+    export.add_argument("--string-library", choices=LIBRARIES, help="JSONL에 기록할 세션 문자열 형식")
+    export.add_argument("--sessions-dir", default=SESSIONS_DIR, help="세션 폴더")
+    _add_output_options(export)
+    export.set_defaults(handler=cmd_export)
+
+    convert = subparsers.add_parser("convert", help="세션 파일을 다른 라이브러리 형식으로 일괄 변환")
+    convert.add_argument("output", help="변환된 세션을 저장할 폴더")
+    convert.add_argument("--to", required=True, choices=LIBRARIES, help="변환할 라이브러리 형식")
+    convert.add_argument("--source", default=SESSIONS_DIR, help="원본 세션 폴더")
+    convert.add_argument("--api-id", type=int, help="원본에 api_id가 없을 때 기록할 값")
+    _add_output_options(convert)
+    convert.set_defaults(handler=cmd_convert)
+
+    vault = subparsers.add_parser("vault", help="세션 파일 암호화 보관(볼트 모드) 켜기/끄기")
+    vault.add_argument(
+        "action", choices=("seal", "unseal"), help="seal: 모든 세션 파일 암호화, unseal: 평문 SQLite로 되돌림"
+    )
+    vault.add_argument("--sessions-dir", default=SESSIONS_DIR, help="세션 폴더")
+    _add_output_options(vault)
+    vault.set_defaults(handler=cmd_vault)
+
+    config = subparsers.add_parser("config", help="설정 저장소(data/settings.db)의 설정 보기/바꾸기")
+    config.add_argument("action", choices=("show", "set"), help="show: 설정 보기, set: 설정 하나 바꾸기")
+    config.add_argument("key", nargs="?", help="설정 키 (예: metrics_port, retry.max_attempts)")
+    config.add_argument("value", nargs="?", help="새 값 (set)")
+    _add_output_options(config)
+    config.set_defaults(handler=cmd_config)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # stdout은 결과 전용이므로 로그는 stderr로 보냅니다
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+    for name in ("pyrogram", "telethon", "asyncio"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    out = OutputWriter(args.command, args.json)
+    try:
+        with metrics_output(args):
+            return args.handler(args, out)
+    except CliError as e:
+        print(f"tgcc {args.command}: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        print(f"tgcc {args.command}: 중단되었습니다", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    except (OSError, RuntimeError) as e:
+        logger.error(f"{args.command} 실패: {type(e).__name__}: {e}", exc_info=args.verbose)
+        print(f"tgcc {args.command}: {type(e).__name__}: {e}", file=sys.stderr)
+        return EXIT_USAGE
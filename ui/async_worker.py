@@ -1,11 +1,14 @@
 # ui/async_worker.py
 """비동기 작업 처리를 위한 QThread 워커"""
 import asyncio
+import concurrent.futures
 import logging
 import sentry_sdk
 
 from PyQt5.QtCore import QThread, pyqtSignal
 
+from adapters.event_loop import get_background_loop
+
 logger = logging.getLogger(__name__)
 
 # Sentry 초기화 (중복 방지를 위해 조건부 초기화)
@@ -18,7 +21,10 @@ if not sentry_sdk.Hub.current.client:
 
 
 class AsyncWorker(QThread):
-    """비동기 코루틴을 실행하는 워커 스레드"""
+    """
+    비동기 코루틴을 공유 백그라운드 루프에서 실행하고 결과를 시그널로 전달하는 워커 스레드.
+    루프는 모든 워커가 함께 쓰므로 여러 워커의 작업이 한 루프에서 동시에 진행됩니다.
+    """
 
     result = pyqtSignal(object)  # dict -> object로 변경 (모든 타입 허용)
     error = pyqtSignal(str)
@@ -28,7 +34,7 @@ class AsyncWorker(QThread):
         super().__init__()
         self.coro = coro
         self._is_running = True
-        self.loop = None
+        self.future = None
         
         # Sentry 컨텍스트 설정
         with sentry_sdk.configure_scope() as scope:
@@ -45,12 +51,14 @@ class AsyncWorker(QThread):
                 logger.info("AsyncWorker 시작")
                 self.progress.emit("작업 시작...")
 
-                # 새로운 이벤트 루프 생성
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
+                if not self._is_running:
+                    # 시작하기 전에 중지됨
+                    self.coro.close()
+                    return
 
-                # 코루틴 실행
-                result = self.loop.run_until_complete(self.coro)
+                # 공유 루프에 코루틴 예약 후 완료 대기
+                self.future = get_background_loop().submit(self.coro)
+                result = self.future.result()
 
                 if self._is_running:
                     logger.info("AsyncWorker 완료")
@@ -62,7 +70,7 @@ class AsyncWorker(QThread):
                         level="info"
                     )
 
-            except asyncio.CancelledError as e:
+            except (asyncio.CancelledError, concurrent.futures.CancelledError) as e:
                 logger.warning("AsyncWorker 취소됨")
                 self.error.emit("작업이 취소되었습니다")
                 
@@ -102,22 +110,6 @@ class AsyncWorker(QThread):
                 sentry_sdk.capture_exception(e)
 
             finally:
-                # 이벤트 루프 정리
-                if self.loop:
-                    try:
-                        # 남은 태스크 취소
-                        pending = asyncio.all_tasks(self.loop)
-                        for task in pending:
-                            task.cancel()
-
-                        # 루프 종료
-                        self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                        self.loop.close()
-
-                    except (RuntimeError, OSError) as e:
-                        logger.error("루프 정리 중 오류: %s", e)
-                        sentry_sdk.capture_exception(e)
-
                 logger.info("AsyncWorker 종료")
 
     def stop(self):
@@ -125,13 +117,11 @@ class AsyncWorker(QThread):
         logger.info("AsyncWorker 중지 요청")
         self._is_running = False
 
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
+        # 공유 루프는 멈추지 않고 이 워커의 작업만 취소
+        # (코루틴은 루프에서 취소를 받아 스스로 정리하고, 스레드는 Future만 기다리므로 곧바로 끝납니다)
+        if self.future and not self.future.done():
+            self.future.cancel()
 
-        # 스레드 종료 대기
-        if self.isRunning():
-            self.quit()
-            if not self.wait(5000):  # 5초 대기
-                logger.warning("AsyncWorker 강제 종료")
-                self.terminate()
-                self.wait()
+        # 스레드 종료 대기 (강제 종료하면 잠금이나 연결이 정리되지 않으므로 사용하지 않음)
+        if self.isRunning() and not self.wait(5000):
+            logger.warning("AsyncWorker가 5초 안에 종료되지 않았습니다")
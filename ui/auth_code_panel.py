@@ -0,0 +1,103 @@
+# ui/auth_code_panel.py
+"""여러 로그인의 인증 코드 요청을 모달 대화상자 없이 받는 패널"""
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QApplication, QGroupBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QVBoxLayout, QWidget
+
+from core.auth_code_broker import EVENT_REQUESTED, auth_code_broker
+from ui.constants import AUTH_CODE_PANEL_TITLE, AUTH_CODE_PLACEHOLDER
+
+
+class AuthCodeRow(QWidget):
+    """요청 하나에 대한 입력 줄 (전화번호, 안내 문구, 입력칸, 확인/취소 버튼)"""
+
+    def __init__(self, request, broker, parent=None):
+        super().__init__(parent)
+        self.request = request
+        self.broker = broker
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        label = QLabel(f"{request.phone}: {request.prompt}")
+        label.setWordWrap(True)
+        layout.addWidget(label, 2)
+
+        self.input = QLineEdit()
+        self.input.setPlaceholderText(AUTH_CODE_PLACEHOLDER)
+        if request.is_password:
+            self.input.setEchoMode(QLineEdit.Password)
+        self.input.returnPressed.connect(self.submit)
+        layout.addWidget(self.input, 1)
+
+        submit_button = QPushButton("확인")
+        submit_button.clicked.connect(self.submit)
+        layout.addWidget(submit_button)
+
+        cancel_button = QPushButton("취소")
+        cancel_button.clicked.connect(self.cancel)
+        layout.addWidget(cancel_button)
+
+    def submit(self):
+        code = self.input.text().strip()
+        if code:
+            self.broker.submit(self.request.id, code)
+
+    def cancel(self):
+        self.broker.cancel(self.request.id)
+
+
+class AuthCodePanel(QGroupBox):
+    """
+    대기 중인 인증 코드 요청을 전화번호별로 한 줄씩 보여주는 패널.
+    요청이 없으면 숨겨지고, 입력한 코드는 중개자를 통해 해당 로그인에만 전달됩니다.
+    """
+
+    # 중개자 알림은 이벤트 루프 스레드에서 오므로 시그널로 GUI 스레드에 넘깁니다
+    _broker_event = pyqtSignal(str, object)
+
+    def __init__(self, broker=auth_code_broker, parent=None):
+        super().__init__(AUTH_CODE_PANEL_TITLE, parent)
+        self.broker = broker
+        self._rows = {}
+
+        self._layout = QVBoxLayout(self)
+        self.setVisible(False)
+
+        self._broker_event.connect(self._on_broker_event)
+        self._listener = self._broker_event.emit
+        self.broker.add_listener(self._listener)
+        # 패널을 만들기 전에 들어온 요청도 표시
+        for request in self.broker.pending():
+            self._add_request(request)
+
+    def _on_broker_event(self, event, request):
+        if event == EVENT_REQUESTED:
+            self._add_request(request)
+            QApplication.alert(self.window())
+        else:
+            self._remove_request(request)
+
+    def _add_request(self, request):
+        if request.id in self._rows:
+            return
+        row = AuthCodeRow(request, self.broker, self)
+        self._rows[request.id] = row
+        self._layout.addWidget(row)
+        self._update_title()
+        if len(self._rows) == 1:
+            row.input.setFocus()
+
+    def _remove_request(self, request):
+        row = self._rows.pop(request.id, None)
+        if row is not None:
+            self._layout.removeWidget(row)
+            row.deleteLater()
+        self._update_title()
+
+    def _update_title(self):
+        count = len(self._rows)
+        self.setTitle(f"{AUTH_CODE_PANEL_TITLE} ({count})" if count else AUTH_CODE_PANEL_TITLE)
+        self.setVisible(count > 0)
+
+    def shutdown(self):
+        """창을 닫을 때 중개자에서 리스너를 해제합니다."""
+        self.broker.remove_listener(self._listener)
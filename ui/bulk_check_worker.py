@@ -0,0 +1,90 @@
+# ui/bulk_check_worker.py
+"""세션 일괄 검사를 위한 QThread 워커"""
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from adapters.pyrogram_adapter import PyrogramAdapter
+from adapters.telethon_adapter import TelethonAdapter
+from core.bulk_check import BulkSessionChecker, CheckReportWriter, list_session_files
+from core.sharded_bulk import ShardedBulkChecker
+from ui.constants import REPORTS_DIR, SHARDING_MIN_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+
+class BulkCheckWorker(QObject):
+    finished = pyqtSignal()
+    # 세션 하나의 검사 결과 (SessionCheckResult)
+    result = pyqtSignal(object)
+    # (완료 수, 전체 수)
+    progress = pyqtSignal(int, int)
+    # (CSV 경로, JSON 경로)
+    report_saved = pyqtSignal(str, str)
+    failure = pyqtSignal(str)
+
+    def __init__(self, library, api_id, api_hash, concurrency, report_dir=REPORTS_DIR, catalog=None, processes=1):
+        super().__init__()
+        self.library = library
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.concurrency = concurrency
+        # 세션이 SHARDING_MIN_SESSIONS개 이상이면 이 수만큼 프로세스를 나눠 검사
+        self.processes = processes
+        self.report_dir = report_dir
+        # 결과를 기록할 SessionCatalog (없으면 리포트만 저장)
+        self.catalog = catalog
+        self.checker = None
+        self._done = 0
+
+        logger.info(f"BulkCheckWorker 초기화: library={library}, concurrency={concurrency}, processes={processes}")
+
+    def run(self):
+        try:
+            if self.catalog is not None:
+                self.catalog.refresh()
+                session_files = self.catalog.names()
+            else:
+                session_files = list_session_files()
+            total = len(session_files)
+            self.progress.emit(0, total)
+
+            if self.processes > 1 and total >= SHARDING_MIN_SESSIONS:
+                # 결과는 이 스레드로 모이므로 카탈로그 기록과 시그널은 그대로입니다
+                self.checker = ShardedBulkChecker(
+                    self.library, self.api_id, self.api_hash, self.processes, self.concurrency
+                )
+            else:
+                if self.library == "Telethon":
+                    adapter = TelethonAdapter(self.api_id, self.api_hash)
+                else:
+                    adapter = PyrogramAdapter(self.api_id, self.api_hash)
+                self.checker = BulkSessionChecker(adapter, self.concurrency)
+
+            with CheckReportWriter(self.report_dir) as report:
+
+                def on_result(check_result):
+                    report.write(check_result)
+                    if self.catalog is not None:
+                        self.catalog.record_check_result(
+                            check_result.session_file,
+                            check_result.status,
+                            check_result.message,
+                            check_result.checked_at,
+                        )
+                    self._done += 1
+                    self.result.emit(check_result)
+                    self.progress.emit(self._done, total)
+
+                self.checker.run(session_files, on_result=on_result)
+
+            self.report_saved.emit(report.csv_path, report.json_path)
+        except (OSError, ValueError, TypeError, RuntimeError) as e:
+            logger.error(f"일괄 검사 오류: {type(e).__name__}: {e}", exc_info=True)
+            self.failure.emit(f"일괄 검사 오류: {type(e).__name__}: {e}")
+        finally:
+            self.finished.emit()
+
+    def stop(self):
+        if self.checker:
+            self.checker.stop()
@@ -0,0 +1,51 @@
+# ui/bulk_export_worker.py
+"""세션 일괄 내보내기를 위한 QThread 워커"""
+import logging
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.bulk_export import BulkSessionExporter
+
+logger = logging.getLogger(__name__)
+
+
+class BulkExportWorker(QObject):
+    finished = pyqtSignal()
+    # 세션 하나의 내보내기 결과 (ExportResult)
+    result = pyqtSignal(object)
+    # (완료 수, 전체 수)
+    progress = pyqtSignal(int, int)
+    # 상태별 항목 수
+    summary = pyqtSignal(object)
+    failure = pyqtSignal(str)
+
+    def __init__(self, session_files, destination, export_format):
+        super().__init__()
+        self.session_files = session_files
+        self.destination = destination
+        self.export_format = export_format
+        self.exporter = BulkSessionExporter()
+        self._done = 0
+
+        logger.info(f"BulkExportWorker 초기화: {len(session_files)}개 세션 -> {destination} ({export_format})")
+
+    def run(self):
+        try:
+            total = len(self.session_files)
+            self.progress.emit(0, total)
+
+            def on_result(export_result):
+                self._done += 1
+                self.result.emit(export_result)
+                self.progress.emit(self._done, total)
+
+            counts = self.exporter.run(self.session_files, self.destination, self.export_format, on_result=on_result)
+            self.summary.emit(counts)
+        except (OSError, ValueError) as e:
+            logger.error(f"일괄 내보내기 오류: {type(e).__name__}: {e}", exc_info=True)
+            self.failure.emit(f"일괄 내보내기 오류: {type(e).__name__}: {e}")
+        finally:
+            self.finished.emit()
+
+    def stop(self):
+        self.exporter.stop()
@@ -0,0 +1,69 @@
+# ui/bulk_import_worker.py
+"""세션 문자열 파일 일괄 가져오기를 위한 QThread 워커"""
+import logging
+import os
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from adapters.pyrogram_adapter import PyrogramAdapter
+from adapters.telethon_adapter import TelethonAdapter
+from core.bulk_import import BulkSessionImporter
+from core.sharded_bulk import ShardedBulkImporter
+from ui.constants import SHARDING_MIN_IMPORT_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class BulkImportWorker(QObject):
+    finished = pyqtSignal()
+    # 세션 문자열 하나의 가져오기 결과 (ImportResult)
+    result = pyqtSignal(object)
+    # (처리한 항목 수, 파일 진행률 0~100)
+    progress = pyqtSignal(int, int)
+    # 상태별 항목 수
+    summary = pyqtSignal(object)
+    failure = pyqtSignal(str)
+
+    def __init__(self, library, api_id, api_hash, path, concurrency, verify=True, processes=1):
+        super().__init__()
+        self.library = library
+        self.api_id = api_id
+        self.api_hash = api_hash
+        self.path = path
+        self.concurrency = concurrency
+        self.verify = verify
+        # 파일이 SHARDING_MIN_IMPORT_BYTES 이상이면 이 수만큼 프로세스를 나눠 가져오기
+        self.processes = processes
+        self.importer = None
+        self._done = 0
+
+        logger.info(f"BulkImportWorker 초기화: library={library}, path={path}, concurrency={concurrency}")
+
+    def run(self):
+        try:
+            if self.processes > 1 and os.path.getsize(self.path) >= SHARDING_MIN_IMPORT_BYTES:
+                self.importer = ShardedBulkImporter(
+                    self.library, self.api_id, self.api_hash, self.processes, self.concurrency, verify=self.verify
+                )
+            else:
+                if self.library == "Telethon":
+                    adapter = TelethonAdapter(self.api_id, self.api_hash)
+                else:
+                    adapter = PyrogramAdapter(self.api_id, self.api_hash)
+                self.importer = BulkSessionImporter(adapter, self.concurrency, verify=self.verify)
+
+            def on_result(import_result, file_progress):
+                self._done += 1
+                self.result.emit(import_result)
+                self.progress.emit(self._done, int(file_progress * 100))
+
+            self.summary.emit(self.importer.run(self.path, on_result=on_result))
+        except (OSError, ValueError, TypeError, RuntimeError) as e:
+            logger.error(f"일괄 가져오기 오류: {type(e).__name__}: {e}", exc_info=True)
+            self.failure.emit(f"일괄 가져오기 오류: {type(e).__name__}: {e}")
+        finally:
+            self.finished.emit()
+
+    def stop(self):
+        if self.importer:
+            self.importer.stop()
@@ -1,21 +1,62 @@
 # ui/constants.py
 
+# Qt와 관계없는 설정값은 core.constants에 있으며, 기존 코드를 위해 여기서도 가져올 수 있게 합니다
+from core.constants import (  # noqa: F401
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_PARK_SECONDS,
+    BREAKER_RECOVERY_TIMEOUT,
+    CATALOG_FILE,
+    CLIENT_POOL_MAX_SIZE,
+    CLIENT_POOL_TTL,
+    CONFIG_FILE,
+    DEFAULT_BULK_CHECK_CONCURRENCY,
+    DEFAULT_JOB_CONCURRENCY,
+    DEFAULT_JOBS_PER_API,
+    DEFAULT_SHARD_PROCESSES,
+    FLOOD_WAIT_MAX_RETRIES,
+    FLOOD_WAIT_MAX_SECONDS,
+    JOB_HISTORY_LIMIT,
+    MAX_BULK_CHECK_CONCURRENCY,
+    MAX_JOB_CONCURRENCY,
+    OPERATION_TIMEOUTS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    REPORTS_DIR,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRY_MULTIPLIER,
+    SESSIONS_DIR,
+    SHARDING_MIN_IMPORT_BYTES,
+    SHARDING_MIN_SESSIONS,
+)
+
 # --- Window Settings ---
 TITLE = "베로니카 v0.1"
 WINDOW_SIZE = (600, 200, 750, 600)
 
-# --- File Paths ---
-SESSIONS_DIR = "sessions"
-CONFIG_FILE = "config.json"
+# --- Session Folder Watch ---
+# 세션 폴더 변경 이벤트를 묶어서 처리할 대기 시간 (밀리초)
+SESSIONS_WATCH_DEBOUNCE_MS = 300
 
 # --- UI Text: Labels and Titles ---
 LIBRARY_LABEL = "사용 라이브러리:"
 LOG_AREA_TITLE = "로그"
 SESSION_LIST_TITLE = "세션 파일 목록"
+AUTH_CODE_PANEL_TITLE = "인증 코드 입력 대기"
+SESSION_TABLE_HEADERS = ("전화번호", "상태", "DC", "마지막 확인", "크기")
+SESSION_STATUS_LABELS = {
+    "valid": "정상",
+    "invalid": "무효",
+    "network_error": "네트워크 오류",
+    "error": "오류",
+}
 
 # --- UI Text: Placeholders ---
 API_ID_PLACEHOLDER = "API ID (숫자만)"
 API_HASH_PLACEHOLDER = "API Hash"
+AUTH_CODE_PLACEHOLDER = "코드 입력"
+SESSION_FILTER_PLACEHOLDER = "세션 검색 (전화번호, 상태, DC)"
 PHONE_PLACEHOLDER = "전화번호 (+8210...)"
 SESSION_STRING_PLACEHOLDER = "여기에 세션 문자열을 붙여넣으세요..."
 
@@ -27,3 +68,22 @@ COPY_SESSION_STRING_BUTTON = "복사"
 ADD_API_BUTTON = "API 추가"
 REMOVE_API_BUTTON = "API 삭제"
 OPEN_SESSIONS_FOLDER_BUTTON = "폴더 열기"
+BULK_CHECK_BUTTON = "전체 세션 확인"
+CONVERT_SESSIONS_BUTTON = "세션 일괄 변환"
+BULK_IMPORT_BUTTON = "📥 문자열 파일 가져오기"
+BULK_EXPORT_BUTTON = "📦 세션 일괄 내보내기"
+
+# --- Job Panel ---
+JOB_PANEL_TITLE = "작업 목록"
+JOB_TABLE_HEADERS = ("ID", "작업", "대상", "상태", "메시지")
+JOB_STATUS_LABELS = {
+    "queued": "대기",
+    "running": "실행 중",
+    "succeeded": "완료",
+    "failed": "실패",
+    "cancelled": "취소됨",
+}
+CANCEL_JOB_BUTTON = "선택 작업 취소"
+JOB_SETTINGS_BUTTON = "동시 실행 설정"
+# 작업 패널에서 멈춘 레인 표시를 갱신하는 간격 (밀리초)
+RATE_LIMIT_MONITOR_INTERVAL_MS = 1000
@@ -0,0 +1,139 @@
+# ui/job_panel.py
+"""작업 스케줄러의 작업 목록을 보여주고 취소할 수 있는 패널"""
+from PyQt5.QtCore import QTimer, pyqtSignal
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from adapters.rate_limiter import rate_limiter
+from adapters.resilience import BREAKER_HALF_OPEN, dc_breakers
+from ui.constants import (
+    CANCEL_JOB_BUTTON,
+    JOB_HISTORY_LIMIT,
+    JOB_PANEL_TITLE,
+    JOB_SETTINGS_BUTTON,
+    JOB_STATUS_LABELS,
+    JOB_TABLE_HEADERS,
+    RATE_LIMIT_MONITOR_INTERVAL_MS,
+)
+
+JOB_KIND_LABELS = {
+    "create": "세션 생성",
+    "check": "세션 확인",
+    "string_import": "문자열 가져오기",
+    "bulk_check": "일괄 검사",
+    "bulk_import": "일괄 가져오기",
+}
+
+
+class JobPanel(QWidget):
+    """작업 상태를 한 줄씩 보여주는 위젯. 작업 상태가 바뀔 때마다 update_job()으로 갱신합니다."""
+
+    # 취소를 요청한 작업 (Job)
+    cancel_requested = pyqtSignal(object)
+    settings_requested = pyqtSignal()
+
+    def __init__(self, parent=None, limiter=rate_limiter, breakers=dc_breakers):
+        super().__init__(parent)
+        self.limiter = limiter
+        self.breakers = breakers
+        self._items = {}
+        self._jobs = {}
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        header_layout = QHBoxLayout()
+        self.title_label = QLabel(JOB_PANEL_TITLE)
+        header_layout.addWidget(self.title_label)
+        header_layout.addStretch()
+        self.settings_button = QPushButton(JOB_SETTINGS_BUTTON)
+        self.settings_button.clicked.connect(self.settings_requested)
+        header_layout.addWidget(self.settings_button)
+        self.cancel_button = QPushButton(CANCEL_JOB_BUTTON)
+        self.cancel_button.clicked.connect(self._cancel_selected)
+        header_layout.addWidget(self.cancel_button)
+        layout.addLayout(header_layout)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(JOB_TABLE_HEADERS)
+        self.tree.setRootIsDecorated(False)
+        self.tree.setUniformRowHeights(True)
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        layout.addWidget(self.tree)
+
+        # FloodWait로 멈춘 레인(API ID + DC)과 장애로 차단된 DC 표시
+        self.network_status_label = QLabel()
+        self.network_status_label.setWordWrap(True)
+        self.network_status_label.setVisible(False)
+        layout.addWidget(self.network_status_label)
+        self._network_status_timer = QTimer(self)
+        self._network_status_timer.timeout.connect(self.update_network_status)
+        self._network_status_timer.start(RATE_LIMIT_MONITOR_INTERVAL_MS)
+
+    def update_job(self, job):
+        """작업 한 줄을 추가하거나 갱신합니다."""
+        item = self._items.get(job.id)
+        if item is None:
+            item = QTreeWidgetItem([str(job.id), JOB_KIND_LABELS.get(job.kind, job.kind), job.label, "", ""])
+            self.tree.insertTopLevelItem(0, item)
+            self._items[job.id] = item
+            self._trim()
+        self._jobs[job.id] = job
+        item.setText(3, JOB_STATUS_LABELS.get(job.status, job.status))
+        item.setText(4, job.message.splitlines()[0] if job.message else "")
+        item.setToolTip(4, job.message)
+        self._update_title()
+
+    def _trim(self):
+        """끝난 작업이 너무 많으면 오래된 것부터 목록에서 지웁니다."""
+        while self.tree.topLevelItemCount() > JOB_HISTORY_LIMIT:
+            for index in range(self.tree.topLevelItemCount() - 1, -1, -1):
+                job_id = int(self.tree.topLevelItem(index).text(0))
+                if self._jobs.get(job_id) is None or self._jobs[job_id].is_done:
+                    self.tree.takeTopLevelItem(index)
+                    self._items.pop(job_id, None)
+                    self._jobs.pop(job_id, None)
+                    break
+            else:
+                return
+
+    def _update_title(self):
+        active = sum(1 for job in self._jobs.values() if not job.is_done)
+        self.title_label.setText(f"{JOB_PANEL_TITLE} (진행 중 {active})" if active else JOB_PANEL_TITLE)
+
+    def _cancel_selected(self):
+        for item in self.tree.selectedItems():
+            job = self._jobs.get(int(item.text(0)))
+            if job is not None and not job.is_done:
+                self.cancel_requested.emit(job)
+
+    def update_network_status(self):
+        """FloodWait로 멈춘 레인과 장애로 차단된 DC를 읽어 남은 대기 시간을 보여줍니다."""
+        lines = []
+        paused = self.limiter.paused_lanes()
+        if paused:
+            lanes = ", ".join(
+                f"API {state.api_id} / DC {state.dc_id or '?'} {int(state.paused_for)}초 (대기 {state.waiting})"
+                for state in paused
+            )
+            lines.append(f"요청 제한 대기 중: {lanes}")
+        broken = self.breakers.open_breakers()
+        if broken:
+            dcs = ", ".join(
+                f"DC {state.dc_id or '?'} "
+                + ("복구 확인 중" if state.state == BREAKER_HALF_OPEN else f"{int(state.retry_in)}초 후 복구 확인")
+                + f" (대기 세션 {state.parked})"
+                for state in broken
+            )
+            lines.append(f"DC 장애 감지: {dcs}")
+        if lines:
+            self.network_status_label.setText("\n".join(lines))
+        self.network_status_label.setVisible(bool(lines))
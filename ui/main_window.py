@@ -1,4 +1,5 @@
 # ui/main_window.py
+import asyncio
 import os
 
 from PyQt5.QtCore import Qt, QUrl
@@ -9,38 +10,62 @@ from PyQt5.QtWidgets import (
     QComboBox,
     QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QInputDialog,
     QLabel,
     QLineEdit,
-    QListWidget,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QSplitter,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from adapters.client_pool import client_pool
+from adapters.event_loop import get_background_loop
+from adapters.resilience import dc_breakers
+from core import session_vault
+from core.bulk_export import EXPORT_FORMAT_JSONL, EXPORT_FORMAT_ZIP
 from core.config import Config
+from core.file_utils import write_file_atomic
+from core.metrics import serve_openmetrics
+from core.session_catalog import SessionCatalog
+from core.session_converter import convert_directory
+from core.sharded_bulk import default_process_count
+from ui.async_worker import AsyncWorker
+from ui.auth_code_panel import AuthCodePanel
 from ui.constants import (
     ADD_API_BUTTON,
+    BULK_CHECK_BUTTON,
+    BULK_EXPORT_BUTTON,
+    BULK_IMPORT_BUTTON,
     CHECK_SESSION_BUTTON,
+    CONVERT_SESSIONS_BUTTON,
     COPY_SESSION_STRING_BUTTON,
     CREATE_SESSION_BUTTON,
     IMPORT_STRING_BUTTON,
     LIBRARY_LABEL,
     LOG_AREA_TITLE,
+    MAX_BULK_CHECK_CONCURRENCY,
+    MAX_JOB_CONCURRENCY,
     OPEN_SESSIONS_FOLDER_BUTTON,
     PHONE_PLACEHOLDER,
     REMOVE_API_BUTTON,
+    SESSION_FILTER_PLACEHOLDER,
     SESSION_LIST_TITLE,
     SESSION_STRING_PLACEHOLDER,
     SESSIONS_DIR,
+    SHARDING_MIN_SESSIONS,
     TITLE,
     WINDOW_SIZE,
 )
+from ui.job_panel import JobPanel
 from ui.session_manager import SessionManager
+from ui.session_model import SessionFilterProxyModel, SessionTableModel
+from ui.session_watcher import SessionFolderWatcher
 from ui.styles import DARK_STYLE
 
 
@@ -52,11 +77,27 @@ class MainWindow(QMainWindow):
         self.setStyleSheet(DARK_STYLE)
 
         self.config = Config()
+        client_pool.configure(self.config.get_client_pool_ttl(), self.config.get_client_pool_max_size())
+        dc_breakers.configure(**self.config.get_retry_settings())
+        if self.config.get_session_vault():
+            session_vault.enable(self.config.get_vault_cache_bytes())
+        self.catalog = SessionCatalog()
+        self.session_model = SessionTableModel(self.catalog, self)
+        self.session_proxy = SessionFilterProxyModel(self)
+        self.session_proxy.setSourceModel(self.session_model)
         self.session_manager = SessionManager(self)
+        self.convert_worker = None
 
         self.init_ui()
         self.load_config()
-        self.update_session_list()
+
+        # 외부에서 추가/삭제된 세션 파일도 변경분만 목록에 반영
+        self.session_watcher = SessionFolderWatcher(self.catalog, parent=self)
+        self.session_watcher.changed.connect(self.session_model.apply_delta)
+        self.populate_session_list()
+
+        self.metrics_server = None
+        self.start_metrics_server()
 
     def init_ui(self):
         central_widget = QWidget()
@@ -103,6 +144,10 @@ class MainWindow(QMainWindow):
         self.create_session_button.clicked.connect(self.create_session)
         left_layout.addWidget(self.create_session_button)
 
+        # 로그인 중인 세션들의 인증 코드 입력 (요청이 있을 때만 표시)
+        self.auth_code_panel = AuthCodePanel()
+        left_layout.addWidget(self.auth_code_panel)
+
         left_layout.addWidget(QLabel("─" * 20))
 
         # 세션 파일 불러오기 (새로운 기능)
@@ -124,6 +169,11 @@ class MainWindow(QMainWindow):
         self.import_string_button.clicked.connect(self.import_from_string)
         left_layout.addWidget(self.import_string_button)
 
+        self.bulk_import_button = QPushButton(BULK_IMPORT_BUTTON)
+        self.bulk_import_button.clicked.connect(self.bulk_import_sessions)
+        self.bulk_import_button.setToolTip("TXT/CSV/JSONL 파일의 세션 문자열을 한 번에 가져옵니다")
+        left_layout.addWidget(self.bulk_import_button)
+
         splitter.addWidget(left_panel)
 
         # 오른쪽 패널 - 세션 목록 및 관리
@@ -132,9 +182,26 @@ class MainWindow(QMainWindow):
 
         right_layout.addWidget(QLabel(SESSION_LIST_TITLE))
 
-        self.session_list_widget = QListWidget()
-        self.session_list_widget.setSelectionMode(QAbstractItemView.SingleSelection)
-        right_layout.addWidget(self.session_list_widget)
+        self.session_filter_input = QLineEdit()
+        self.session_filter_input.setPlaceholderText(SESSION_FILTER_PLACEHOLDER)
+        self.session_filter_input.setClearButtonEnabled(True)
+        self.session_filter_input.textChanged.connect(self.session_proxy.set_filter_text)
+        right_layout.addWidget(self.session_filter_input)
+
+        # 보이는 행만 그리는 표 뷰 (수만 개의 세션도 위젯 없이 표시)
+        self.session_table = QTableView()
+        self.session_table.setModel(self.session_proxy)
+        self.session_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.session_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.session_table.setSortingEnabled(True)
+        self.session_table.sortByColumn(0, Qt.AscendingOrder)
+        self.session_table.setWordWrap(False)
+        self.session_table.verticalHeader().setVisible(False)
+        self.session_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.session_table.verticalHeader().setDefaultSectionSize(22)
+        self.session_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.session_table.horizontalHeader().setStretchLastSection(True)
+        right_layout.addWidget(self.session_table)
 
         # 세션 관리 버튼들
         session_buttons_layout = QVBoxLayout()
@@ -162,20 +229,48 @@ class MainWindow(QMainWindow):
         self.export_session_button.clicked.connect(self.export_session)
         self.export_session_button.setToolTip("선택된 세션을 다른 위치로 복사합니다")
         session_buttons_row2.addWidget(self.export_session_button)
+
+        self.bulk_export_button = QPushButton(BULK_EXPORT_BUTTON)
+        self.bulk_export_button.clicked.connect(self.bulk_export_sessions)
+        self.bulk_export_button.setToolTip("선택된 세션(선택이 없으면 전체)을 세션 문자열 파일 또는 압축 파일로 내보냅니다")
+        session_buttons_row2.addWidget(self.bulk_export_button)
         session_buttons_layout.addLayout(session_buttons_row2)
 
+        # 세 번째 줄: 전체 세션 일괄 검사
+        self.bulk_check_button = QPushButton(BULK_CHECK_BUTTON)
+        self.bulk_check_button.clicked.connect(self.bulk_check_sessions)
+        self.bulk_check_button.setToolTip("세션 폴더의 모든 세션을 동시에 검사하고 리포트를 저장합니다")
+        session_buttons_layout.addWidget(self.bulk_check_button)
+
+        # 네 번째 줄: Telethon <-> Pyrogram 일괄 변환 (오프라인)
+        self.convert_sessions_button = QPushButton(CONVERT_SESSIONS_BUTTON)
+        self.convert_sessions_button.clicked.connect(self.convert_sessions)
+        self.convert_sessions_button.setToolTip("세션 폴더 전체를 다른 라이브러리 형식으로 변환합니다 (네트워크 연결 없음)")
+        session_buttons_layout.addWidget(self.convert_sessions_button)
+
         right_layout.addLayout(session_buttons_layout)
         splitter.addWidget(right_panel)
 
         main_layout.addWidget(splitter)
 
-        # 하단 영역 - 로그 및 세션 문자열 출력
+        # 하단 영역 - 작업 목록, 로그 및 세션 문자열 출력
         bottom_layout = QVBoxLayout()
-        bottom_layout.addWidget(QLabel(LOG_AREA_TITLE))
+        bottom_splitter = QSplitter(Qt.Horizontal)
+
+        self.job_panel = JobPanel()
+        self.job_panel.cancel_requested.connect(self.session_manager.cancel_job)
+        self.job_panel.settings_requested.connect(self.configure_jobs)
+        bottom_splitter.addWidget(self.job_panel)
 
+        log_panel = QWidget()
+        log_layout = QVBoxLayout(log_panel)
+        log_layout.setContentsMargins(0, 0, 0, 0)
+        log_layout.addWidget(QLabel(LOG_AREA_TITLE))
         self.log_area = QTextEdit()
         self.log_area.setReadOnly(True)
-        bottom_layout.addWidget(self.log_area)
+        log_layout.addWidget(self.log_area)
+        bottom_splitter.addWidget(log_panel)
+        bottom_layout.addWidget(bottom_splitter)
 
         # 세션 문자열 출력 및 복사
         session_string_layout = QHBoxLayout()
@@ -201,15 +296,15 @@ class MainWindow(QMainWindow):
         if not credentials:
             self.api_combo.addItem("등록된 API 없음")
             return
+        # 항목 데이터에 닉네임을 넣어 두고 선택된 API는 설정 색인으로 바로 찾습니다
         for cred in credentials:
-            self.api_combo.addItem(f"{cred['name']} ({cred['api_id']})")
+            self.api_combo.addItem(f"{cred['name']} ({cred['api_id']})", cred["name"])
 
         last_api = self.config.get_last_used_api()
         if last_api:
-            for i in range(self.api_combo.count()):
-                if self.api_combo.itemText(i).startswith(last_api):
-                    self.api_combo.setCurrentIndex(i)
-                    break
+            index = self.api_combo.findData(last_api)
+            if index >= 0:
+                self.api_combo.setCurrentIndex(index)
 
     def load_config(self):
         """설정 파일에서 마지막 상태를 불러옵니다."""
@@ -221,23 +316,17 @@ class MainWindow(QMainWindow):
 
     def save_config(self):
         """현재 상태를 설정 파일에 저장합니다."""
-        nickname = None
-        current_text = self.api_combo.currentText()
-        if current_text and "등록된" not in current_text:
-            nickname = current_text.split(" (")[0]
+        nickname = self.api_combo.currentData()
         library_name = self.library_combo.currentText()
         self.config.save_last_used(nickname, library_name)
 
     def get_selected_api(self):
         """콤보박스에서 선택된 API의 ID와 Hash를 반환합니다."""
-        current_text = self.api_combo.currentText()
-        if not current_text or "등록된" in current_text:
+        nickname = self.api_combo.currentData()
+        cred = self.config.get_api_credential(nickname) if nickname else None
+        if cred is None:
             return None, None
-        nickname = current_text.split(" (")[0]
-        for cred in self.config.get_api_credentials():
-            if cred["name"] == nickname:
-                return cred["api_id"], cred["api_hash"]
-        return None, None
+        return cred["api_id"], cred["api_hash"]
 
     def add_api(self):
         """사용자로부터 API 정보를 입력받아 추가합니다."""
@@ -261,12 +350,11 @@ class MainWindow(QMainWindow):
 
     def remove_api(self):
         """선택된 API를 설정에서 삭제합니다."""
-        current_text = self.api_combo.currentText()
-        if not current_text or "등록된" in current_text:
+        nickname = self.api_combo.currentData()
+        if not nickname:
             QMessageBox.warning(self, "선택 오류", "삭제할 API를 목록에서 선택해주세요.")
             return
 
-        nickname = current_text.split(" (")[0]
         reply = QMessageBox.question(
             self,
             "삭제 확인",
@@ -298,15 +386,96 @@ class MainWindow(QMainWindow):
         self.session_manager.create_session(library, api_id, api_hash, phone)
 
     def check_session(self):
-        selected = self.session_list_widget.currentItem()
-        if not selected:
+        session_file = self.selected_session_file()
+        if not session_file:
             QMessageBox.warning(self, "선택 오류", "확인할 세션 파일을 목록에서 선택해주세요.")
             return
         api_id, api_hash = self.get_selected_api()
         if not api_id:
             QMessageBox.warning(self, "API 선택 필요", "세션을 확인하려면 API를 선택해야 합니다.")
             return
-        self.session_manager.check_session(selected.text())
+        self.session_manager.check_session(session_file)
+
+    def bulk_check_sessions(self):
+        api_id, api_hash = self.get_selected_api()
+        if not api_id:
+            QMessageBox.warning(self, "API 선택 필요", "세션을 확인하려면 API를 선택해야 합니다.")
+            return
+        concurrency, ok = QInputDialog.getInt(
+            self,
+            "전체 세션 확인",
+            "동시에 검사할 세션 수:",
+            self.config.get_bulk_check_concurrency(),
+            1,
+            MAX_BULK_CHECK_CONCURRENCY,
+        )
+        if not ok:
+            return
+        self.config.save_bulk_check_concurrency(concurrency)
+        library = self.get_selected_library()
+        self.session_manager.bulk_check_sessions(library, api_id, api_hash, concurrency)
+
+    def configure_jobs(self):
+        current, current_per_api = self.config.get_job_concurrency()
+        concurrency, ok = QInputDialog.getInt(
+            self, "동시 실행 설정", "동시에 실행할 작업 수:", current, 1, MAX_JOB_CONCURRENCY
+        )
+        if not ok:
+            return
+        per_api, ok = QInputDialog.getInt(
+            self, "동시 실행 설정", "같은 API로 동시에 실행할 작업 수:", min(current_per_api, concurrency), 1, concurrency
+        )
+        if not ok:
+            return
+        processes, ok = QInputDialog.getInt(
+            self,
+            "동시 실행 설정",
+            f"대량 일괄 작업(세션 {SHARDING_MIN_SESSIONS}개 이상)에 사용할 프로세스 수 (1 = 사용 안 함):",
+            self.config.get_shard_processes(),
+            1,
+            default_process_count(),
+        )
+        if not ok:
+            return
+        self.session_manager.configure_jobs(concurrency, per_api)
+        self.config.save_shard_processes(processes)
+        self.log(f"⚙️ 작업 동시 실행 수: 전체 {concurrency}개, API별 {per_api}개, 대량 작업 프로세스 {processes}개")
+
+    def convert_sessions(self):
+        """세션 폴더 전체를 다른 라이브러리 형식으로 변환하여 다른 폴더에 저장합니다."""
+        if self.convert_worker and self.convert_worker.isRunning():
+            QMessageBox.warning(self, "경고", "이미 변환 작업이 진행 중입니다.")
+            return
+        target_library, ok = QInputDialog.getItem(
+            self, "세션 일괄 변환", "변환할 라이브러리 형식:", ["Pyrogram", "Telethon"], 0, False
+        )
+        if not ok:
+            return
+        destination = QFileDialog.getExistingDirectory(self, "변환된 세션을 저장할 폴더 선택")
+        if not destination:
+            return
+
+        api_id, _ = self.get_selected_api()
+        self.log(f"🔄 세션 일괄 변환 시작: {SESSIONS_DIR} -> {destination} ({target_library})")
+        self.convert_worker = AsyncWorker(
+            asyncio.to_thread(
+                convert_directory,
+                SESSIONS_DIR,
+                destination,
+                target_library,
+                api_id=int(api_id) if api_id else None,
+            )
+        )
+        self.convert_worker.result.connect(self.on_convert_finished)
+        self.convert_worker.error.connect(lambda message: self.log(f"❌ 세션 변환 실패: {message}", is_error=True))
+        self.convert_worker.start()
+
+    def on_convert_finished(self, results):
+        for result in results:
+            if not result.ok:
+                self.log(f"⚠️ {os.path.basename(result.source)}: {result.message}", is_error=True)
+        converted = sum(1 for r in results if r.ok)
+        self.log(f"🔄 세션 일괄 변환 완료: {converted}/{len(results)}개")
 
     def import_from_string(self):
         api_id, api_hash = self.get_selected_api()
@@ -323,6 +492,42 @@ class MainWindow(QMainWindow):
         library = self.get_selected_library()
         self.session_manager.import_from_string(library, api_id, api_hash, session_string, filename)
 
+    def bulk_import_sessions(self):
+        api_id, api_hash = self.get_selected_api()
+        if not api_id:
+            QMessageBox.warning(self, "API 선택 필요", "세션을 가져오려면 API를 선택해야 합니다.")
+            return
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "세션 문자열 파일 선택",
+            "",
+            "Session strings (*.txt *.csv *.jsonl *.ndjson);;All files (*.*)"
+        )
+        if not path:
+            return
+        concurrency, ok = QInputDialog.getInt(
+            self,
+            "세션 문자열 일괄 가져오기",
+            "동시에 가져올 세션 수:",
+            self.config.get_bulk_check_concurrency(),
+            1,
+            MAX_BULK_CHECK_CONCURRENCY,
+        )
+        if not ok:
+            return
+        reply = QMessageBox.question(
+            self,
+            "세션 검증",
+            "저장하기 전에 텔레그램에 연결해 각 세션이 유효한지 확인하시겠습니까?\n\n"
+            "'아니요'를 선택하면 형식만 확인하고 바로 저장합니다.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        library = self.get_selected_library()
+        self.session_manager.bulk_import_sessions(
+            library, api_id, api_hash, path, concurrency, verify=reply == QMessageBox.Yes
+        )
+
     def load_session_file(self):
         """기존 세션 파일을 불러와서 sessions 폴더로 복사하는 새로운 기능"""
         file_dialog = QFileDialog()
@@ -356,18 +561,18 @@ class MainWindow(QMainWindow):
             # 폴더가 없으면 생성
             os.makedirs(SESSIONS_DIR, exist_ok=True)
             
-            # 파일 복사
-            shutil.copy2(file_path, destination)
+            # 파일 복사 (볼트 모드에서는 암호화해서 저장)
+            vault = session_vault.active_vault()
+            if vault is None or not vault.seal(file_path, destination):
+                shutil.copy2(file_path, destination)
             
-            # 세션 목록 업데이트
-            self.update_session_list()
+            # 폴더 감시는 덮어쓰기를 알아채지 못하므로 바뀐 파일을 카탈로그와 목록에 직접 반영합니다
+            self.session_model.apply_delta(self.catalog.refresh_files([filename]))
             
             self.log(f"📂 세션 파일 '{filename}'을 성공적으로 불러왔습니다.")
             
             # 불러온 파일을 목록에서 자동 선택
-            items = self.session_list_widget.findItems(filename, Qt.MatchExactly)
-            if items:
-                self.session_list_widget.setCurrentItem(items[0])
+            self.select_session_file(filename)
                 
         except Exception as e:
             self.log(f"❌ 세션 파일 불러오기 실패: {e}", is_error=True)
@@ -375,12 +580,11 @@ class MainWindow(QMainWindow):
 
     def delete_session(self):
         """선택된 세션 파일을 안전하게 삭제하는 새로운 기능"""
-        selected = self.session_list_widget.currentItem()
-        if not selected:
+        session_file = self.selected_session_file()
+        if not session_file:
             QMessageBox.warning(self, "선택 오류", "삭제할 세션 파일을 목록에서 선택해주세요.")
             return
             
-        session_file = selected.text()
         session_path = os.path.join(SESSIONS_DIR, session_file)
         
         # 확인 대화상자
@@ -415,12 +619,11 @@ class MainWindow(QMainWindow):
 
     def export_session(self):
         """선택된 세션 파일을 다른 위치로 내보내는 새로운 기능"""
-        selected = self.session_list_widget.currentItem()
-        if not selected:
+        session_file = self.selected_session_file()
+        if not session_file:
             QMessageBox.warning(self, "선택 오류", "내보낼 세션 파일을 목록에서 선택해주세요.")
             return
             
-        session_file = selected.text()
         session_path = os.path.join(SESSIONS_DIR, session_file)
         
         if not os.path.exists(session_path):
@@ -441,7 +644,11 @@ class MainWindow(QMainWindow):
             
         try:
             import shutil
-            shutil.copy2(session_path, save_path)
+            if session_vault.is_sealed(session_path):
+                # 볼트로 암호화된 세션은 다른 곳에서 쓸 수 있도록 복호화해서 내보냅니다
+                write_file_atomic(save_path, session_vault.get_vault().read(session_path))
+            else:
+                shutil.copy2(session_path, save_path)
             
             self.log(f"📤 세션 파일 '{session_file}'을 '{save_path}'로 내보냈습니다.")
             
@@ -449,15 +656,84 @@ class MainWindow(QMainWindow):
             self.log(f"❌ 세션 내보내기 실패: {e}", is_error=True)
             QMessageBox.critical(self, "오류", f"세션 파일을 내보내는 중 오류가 발생했습니다:\n{e}")
 
-    def update_session_list(self):
-        self.session_list_widget.clear()
-        try:
-            files = [f for f in os.listdir(SESSIONS_DIR) if f.endswith(".session")]
-            self.session_list_widget.addItems(sorted(files))
-        except FileNotFoundError:
+    def bulk_export_sessions(self):
+        session_files = self.selected_session_files()
+        scope = f"선택된 {len(session_files)}개" if session_files else "전체"
+        if not session_files:
+            session_files = self.catalog.names()
+        if not session_files:
+            QMessageBox.warning(self, "내보내기 오류", "내보낼 세션 파일이 없습니다.")
+            return
+
+        formats = {"세션 문자열 (JSONL)": EXPORT_FORMAT_JSONL, "압축 파일 (ZIP)": EXPORT_FORMAT_ZIP}
+        choice, ok = QInputDialog.getItem(
+            self, "세션 일괄 내보내기", f"{scope} 세션을 내보낼 형식을 선택하세요:", list(formats), 0, False
+        )
+        if not ok:
+            return
+        export_format = formats[choice]
+        destination, _ = QFileDialog.getSaveFileName(
+            self,
+            "내보낼 파일 선택",
+            f"sessions.{export_format}",
+            "Session strings (*.jsonl)" if export_format == EXPORT_FORMAT_JSONL else "Zip archives (*.zip)"
+        )
+        if not destination:
+            return
+        self.session_manager.bulk_export_sessions(session_files, destination, export_format)
+
+    def populate_session_list(self):
+        """카탈로그 전체로 세션 목록을 처음 채웁니다."""
+        if not os.path.isdir(SESSIONS_DIR):
             os.makedirs(SESSIONS_DIR)
             self.log(f"'{SESSIONS_DIR}' 폴더를 새로 만들었습니다.")
 
+        # 지난 실행의 카탈로그를 먼저 보여주고, 세션 파일을 읽는 전체 갱신은 워커 스레드에서 실행합니다
+        self.session_model.reload()
+        self.session_watcher.refresh_in_background()
+
+    def start_metrics_server(self):
+        """설정에 포트가 있으면 단계별 지연 시간 메트릭(OpenMetrics) 엔드포인트를 엽니다."""
+        port = self.config.get_metrics_port()
+        if not port:
+            return
+        try:
+            self.metrics_server = serve_openmetrics(port)
+            host, bound_port = self.metrics_server.server_address[:2]
+            self.log(f"📈 메트릭 엔드포인트: http://{host}:{bound_port}/metrics")
+        except OSError as e:
+            self.log(f"메트릭 엔드포인트를 열지 못했습니다: {e}", is_error=True)
+
+    def update_session_list(self):
+        """세션 폴더 변경을 즉시 반영합니다 (변경분은 모델에 행 단위로 전달됩니다)."""
+        self.session_watcher.refresh()
+
+    def selected_session_file(self):
+        """목록에서 선택된 세션 파일 이름 (선택이 없으면 None)"""
+        index = self.session_table.currentIndex()
+        if not index.isValid() or not self.session_table.selectionModel().isSelected(index):
+            return None
+        source = self.session_proxy.mapToSource(index)
+        return self.session_model.session_name(source.row())
+
+    def selected_session_files(self):
+        """목록에서 선택된 모든 세션 파일 이름 (화면 순서)"""
+        rows = sorted(index.row() for index in self.session_table.selectionModel().selectedRows())
+        return [
+            self.session_model.session_name(self.session_proxy.mapToSource(self.session_proxy.index(row, 0)).row())
+            for row in rows
+        ]
+
+    def select_session_file(self, session_file):
+        """세션 파일을 목록에서 선택하고 보이도록 스크롤합니다."""
+        row = self.session_model.row_of(session_file)
+        if row < 0:
+            return
+        index = self.session_proxy.mapFromSource(self.session_model.index(row, 0))
+        if index.isValid():
+            self.session_table.selectRow(index.row())
+            self.session_table.scrollTo(index)
+
     def log(self, message, is_error=False):
         color = "#ff4757" if is_error else "white"
         self.log_area.append(f"<span style='color:{color};'>{message}</span>")
@@ -485,7 +761,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         self.save_config()
-        if self.session_manager.thread and self.session_manager.thread.isRunning():
+        self.config.flush()
+        if self.session_manager.is_busy():
             reply = QMessageBox.question(
                 self,
                 "작업 진행 중",
@@ -494,9 +771,22 @@ class MainWindow(QMainWindow):
                 QMessageBox.No,
             )
             if reply == QMessageBox.Yes:
-                self.session_manager.worker.stop()
+                self.session_manager.stop_all()
+                self.auth_code_panel.shutdown()
+                self.session_watcher.stop()
+                self.close_clients()
                 event.accept()
             else:
                 event.ignore()
         else:
+            self.auth_code_panel.shutdown()
+            self.session_watcher.stop()
+            self.close_clients()
             event.accept()
+
+    def close_clients(self):
+        """풀에 남은 연결을 끊습니다 (볼트 모드의 세션은 이때 암호화 파일에 마지막 상태가 기록됩니다)."""
+        try:
+            get_background_loop().run(client_pool.close_all(), timeout=10)
+        except Exception as e:  # pylint: disable=broad-except
+            self.log(f"⚠️ 연결 정리 중 오류: {type(e).__name__}: {e}", is_error=True)
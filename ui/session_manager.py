@@ -1,31 +1,66 @@
 # ui/session_manager.py
 import os
+from datetime import datetime
+from functools import partial
 
 from PyQt5.QtCore import QThread
-from PyQt5.QtWidgets import QInputDialog, QMessageBox
+from PyQt5.QtWidgets import QMessageBox
 
+from core.bulk_check import classify_result
+from core.job_scheduler import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    Job,
+    JobScheduler,
+)
+from core.session_inspector import inspect_session_file
+from ui.bulk_check_worker import BulkCheckWorker
+from ui.bulk_export_worker import BulkExportWorker
+from ui.bulk_import_worker import BulkImportWorker
 from ui.constants import SESSIONS_DIR
 from ui.worker import Worker
 
+# 사용자가 코드 입력을 기다리는 세션 생성은 먼저 실행하고, 오래 걸리는 일괄 작업은 나중에 실행
+JOB_PRIORITIES = {
+    "create": PRIORITY_HIGH,
+    "check": PRIORITY_NORMAL,
+    "string_import": PRIORITY_NORMAL,
+    "bulk_check": PRIORITY_LOW,
+    "bulk_import": PRIORITY_LOW,
+}
+
 
 class SessionManager:
     def __init__(self, main_window):
         self.main_window = main_window
-        self.thread = None
-        self.worker = None
+        self.export_thread = None
+        self.export_worker = None
 
-    def _start_task(self, library, api_id, api_hash, phone, session_name, action, session_string=None):
-        if self.thread and self.thread.isRunning():
-            QMessageBox.warning(self.main_window, "경고", "이미 작업이 진행 중입니다.")
-            return
-
-        self.main_window.set_ui_enabled(False)
-        self.main_window.log(f"'{session_name}'에 대한 '{action}' 작업을 시작합니다...")
+        # 생성/확인/가져오기와 일괄 검사/가져오기는 스케줄러가 동시 실행 수 안에서 여러 개를 함께 실행합니다
+        concurrency, per_api = main_window.config.get_job_concurrency()
+        self.scheduler = JobScheduler(
+            self._launch_job,
+            concurrency,
+            per_api,
+            on_change=self._on_job_changed,
+            cancel_job=self._cancel_job,
+        )
+        self._job_threads = {}
+        # 작업 id -> (상태, 메시지): Worker가 끝나기 전에 보낸 결과
+        self._job_results = {}
 
+    def _start_task(self, library, api_id, api_hash, phone, session_name, action, session_string=None):
         # 파일 이름으로 사용할 수 없는 문자 제거
         sanitized_name = "".join(c for c in session_name if c.isalnum())
         full_path = os.path.join(SESSIONS_DIR, f"{sanitized_name}.session")
 
+        if self.scheduler.find_active(sanitized_name):
+            QMessageBox.warning(self.main_window, "경고", f"'{sanitized_name}'에 대한 작업이 이미 대기 중이거나 진행 중입니다.")
+            return None
+
         if action in ["create", "string_import"] and os.path.exists(full_path):
             reply = QMessageBox.question(
                 self.main_window,
@@ -36,21 +71,58 @@ class SessionManager:
             )
             if reply == QMessageBox.No:
                 self.main_window.log("작업이 사용자에 의해 취소되었습니다.")
-                self.main_window.set_ui_enabled(True)
-                return
+                return None
+
+        job = Job(
+            kind=action,
+            label=sanitized_name,
+            api_id=api_id,
+            resource=sanitized_name,
+            priority=JOB_PRIORITIES.get(action, PRIORITY_NORMAL),
+            payload=(library, api_id, api_hash, phone, session_string),
+        )
+        self.main_window.log(f"'{session_name}'에 대한 '{action}' 작업을 등록했습니다. (작업 #{job.id})")
+        return self.scheduler.submit(job)
 
-        self.thread = QThread()
-        self.worker = Worker(library, api_id, api_hash, phone, sanitized_name, action, session_string)
-        self.worker.moveToThread(self.thread)
+    def _launch_job(self, job):
+        """스케줄러가 실행 차례가 된 작업을 Worker 스레드로 시작합니다."""
+        if job.kind == "bulk_check":
+            self._launch_bulk_check(job)
+            return
+        if job.kind == "bulk_import":
+            self._launch_bulk_import(job)
+            return
 
-        # Worker의 시그널과 SessionManager의 슬롯 연결
-        self.worker.success.connect(self.on_success)
-        self.worker.failure.connect(self.on_failure)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.request_code_from_gui.connect(self.prompt_for_code)
+        library, api_id, api_hash, phone, session_string = job.payload
+        thread = QThread()
+        worker = Worker(library, api_id, api_hash, phone, job.label, job.kind, session_string)
+        worker.moveToThread(thread)
+        job.handle = worker
+        self._job_threads[job.id] = thread
 
-        self.thread.started.connect(self.worker.run)
-        self.thread.start()
+        # Worker의 시그널을 작업 정보와 함께 SessionManager의 슬롯에 연결
+        worker.success.connect(partial(self.on_job_success, job))
+        worker.failure.connect(partial(self.on_job_failure, job))
+        worker.finished.connect(partial(self.on_job_finished, job))
+
+        thread.started.connect(worker.run)
+        thread.start()
+
+    def _cancel_job(self, job):
+        if job.handle:
+            job.handle.stop()
+
+    def _on_job_changed(self, job):
+        self.main_window.job_panel.update_job(job)
+
+    def cancel_job(self, job):
+        if self.scheduler.cancel(job):
+            self.main_window.log(f"작업 #{job.id} ({job.label}) 취소를 요청했습니다.")
+
+    def configure_jobs(self, concurrency, per_api):
+        """작업 동시 실행 수를 변경하고 저장합니다."""
+        self.scheduler.configure(concurrency, per_api)
+        self.main_window.config.save_job_concurrency(concurrency, per_api)
 
     def create_session(self, library, api_id, api_hash, phone_number):
         self._start_task(library, api_id, api_hash, phone_number, phone_number, "create")
@@ -72,26 +144,149 @@ class SessionManager:
             QMessageBox.warning(self.main_window, "파일 오류", f"세션 파일 '{session_file}'이 비어있습니다.")
             return
             
-        # SQLite 파일 형식 확인 (Telethon 세션의 경우)
-        if library == "Telethon":
-            try:
-                with open(session_path, 'rb') as f:
-                    header = f.read(16)
-                    if not header.startswith(b'SQLite format 3'):
-                        QMessageBox.warning(
-                            self.main_window, 
-                            "파일 형식 오류", 
-                            f"'{session_file}'은 올바른 Telethon 세션 파일이 아닙니다.\n\n" +
-                            "Telethon 세션은 SQLite 데이터베이스 형식이어야 합니다."
-                        )
-                        return
-            except Exception as e:
-                self.main_window.log(f"❌ 세션 파일 읽기 오류: {e}", is_error=True)
-                return
-        
-        self.main_window.log(f"📋 세션 파일 기본 검증 통과: {session_file} (크기: {file_size} bytes)")
+        # 세션 DB를 직접 읽어 네트워크 연결 전에 형식/인증 키/라이브러리 확인
+        info = inspect_session_file(session_path)
+        reason = info.rejection_reason()
+        if reason:
+            QMessageBox.warning(self.main_window, "파일 형식 오류", f"'{session_file}'은 사용할 수 없는 세션입니다.\n\n{reason}")
+            return
+        if info.library != library:
+            QMessageBox.warning(
+                self.main_window,
+                "라이브러리 불일치",
+                f"'{session_file}'은 {info.library} 세션 파일입니다.\n\n" +
+                f"라이브러리를 {info.library}(으)로 변경한 뒤 다시 확인해주세요."
+            )
+            return
+
+        self.main_window.log(
+            f"📋 세션 파일 기본 검증 통과: {session_file} (크기: {file_size} bytes, {info.library}, DC {info.dc_id})"
+        )
         self._start_task(library, api_id, api_hash, "", session_name, "check")
 
+    def bulk_check_sessions(self, library, api_id, api_hash, concurrency):
+        """
+        세션 폴더의 모든 세션을 동시에 검사하는 기능
+        결과는 세션마다 로그로 전달되고 reports 폴더에 CSV/JSON으로 저장됩니다.
+        """
+        if self.scheduler.find_active("bulk_check"):
+            QMessageBox.warning(self.main_window, "경고", "일괄 검사가 이미 대기 중이거나 진행 중입니다.")
+            return None
+
+        job = Job(
+            kind="bulk_check",
+            label="전체 세션",
+            api_id=api_id,
+            resource="bulk_check",
+            priority=JOB_PRIORITIES["bulk_check"],
+            payload=(library, api_id, api_hash, concurrency),
+        )
+        self.main_window.log(f"🔎 전체 세션 일괄 검사를 등록했습니다. (작업 #{job.id}, 동시 실행: {concurrency})")
+        return self.scheduler.submit(job)
+
+    def _launch_bulk_check(self, job):
+        library, api_id, api_hash, concurrency = job.payload
+        self.main_window.log(f"🔎 전체 세션 일괄 검사를 시작합니다... (동시 실행: {concurrency})")
+
+        thread = QThread()
+        worker = BulkCheckWorker(
+            library,
+            api_id,
+            api_hash,
+            concurrency,
+            catalog=self.main_window.catalog,
+            processes=self.main_window.config.get_shard_processes(),
+        )
+        worker.moveToThread(thread)
+        job.handle = worker
+        self._job_threads[job.id] = thread
+
+        worker.result.connect(self.on_bulk_result)
+        worker.progress.connect(self.on_bulk_progress)
+        worker.report_saved.connect(partial(self.on_bulk_report_saved, job))
+        worker.failure.connect(partial(self.on_job_failure, job))
+        worker.finished.connect(partial(self.on_bulk_finished, job))
+
+        thread.started.connect(worker.run)
+        thread.start()
+
+    def bulk_import_sessions(self, library, api_id, api_hash, path, concurrency, verify=True):
+        """
+        TXT/CSV/JSONL 파일의 세션 문자열을 한 줄씩 읽어 동시에 가져오는 기능
+        파일 이름은 이름 열, 사용자 ID, 인증 키 해시 순으로 자동으로 정해집니다.
+        """
+        resource = f"bulk_import:{os.path.abspath(path)}"
+        if self.scheduler.find_active(resource):
+            QMessageBox.warning(self.main_window, "경고", f"'{path}' 가져오기가 이미 대기 중이거나 진행 중입니다.")
+            return None
+
+        job = Job(
+            kind="bulk_import",
+            label=os.path.basename(path),
+            api_id=api_id,
+            resource=resource,
+            priority=JOB_PRIORITIES["bulk_import"],
+            payload=(library, api_id, api_hash, path, concurrency, verify),
+        )
+        self.main_window.log(f"📥 세션 문자열 일괄 가져오기를 등록했습니다: {path} (작업 #{job.id})")
+        return self.scheduler.submit(job)
+
+    def _launch_bulk_import(self, job):
+        library, api_id, api_hash, path, concurrency, verify = job.payload
+        self.main_window.log(
+            f"📥 세션 문자열 일괄 가져오기를 시작합니다: {path} (동시 실행: {concurrency}, 검증: {'예' if verify else '아니요'})"
+        )
+
+        thread = QThread()
+        worker = BulkImportWorker(
+            library, api_id, api_hash, path, concurrency, verify, processes=self.main_window.config.get_shard_processes()
+        )
+        worker.moveToThread(thread)
+        job.handle = worker
+        self._job_threads[job.id] = thread
+
+        worker.result.connect(self.on_import_result)
+        worker.progress.connect(self.on_import_progress)
+        worker.summary.connect(partial(self.on_import_summary, job))
+        worker.failure.connect(partial(self.on_job_failure, job))
+        worker.finished.connect(partial(self.on_import_finished, job))
+
+        thread.started.connect(worker.run)
+        thread.start()
+
+    def bulk_export_sessions(self, session_files, destination, export_format):
+        """
+        세션 파일들을 네트워크 연결 없이 JSONL(세션 문자열) 또는 ZIP 파일로 내보내는 기능
+        """
+        if self.export_thread and self.export_thread.isRunning():
+            QMessageBox.warning(self.main_window, "경고", "이미 내보내기가 진행 중입니다.")
+            return
+
+        self.main_window.log(f"📦 세션 {len(session_files)}개 일괄 내보내기를 시작합니다: {destination}")
+
+        self.export_thread = QThread()
+        self.export_worker = BulkExportWorker(session_files, destination, export_format)
+        self.export_worker.moveToThread(self.export_thread)
+
+        self.export_worker.result.connect(self.on_export_result)
+        self.export_worker.progress.connect(self.on_export_progress)
+        self.export_worker.summary.connect(self.on_export_summary)
+        self.export_worker.failure.connect(self.on_failure)
+        self.export_worker.finished.connect(self.on_export_finished)
+
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_thread.start()
+
+    def is_busy(self):
+        """예약된 작업(일괄 검사/가져오기 포함) 또는 일괄 내보내기가 진행 중인지 확인합니다."""
+        return self.scheduler.has_active_jobs() or (self.export_thread is not None and self.export_thread.isRunning())
+
+    def stop_all(self):
+        """진행 중인 모든 작업에 중지를 요청합니다."""
+        self.scheduler.cancel_all()
+        if self.export_worker:
+            self.export_worker.stop()
+
     def import_from_string(self, library, api_id, api_hash, session_string, filename):
         self._start_task(library, api_id, api_hash, "", filename, "string_import", session_string)
 
@@ -132,11 +327,18 @@ class SessionManager:
             import datetime
             stat = os.stat(session_path)
             
+            session_info = inspect_session_file(session_path)
+
             info = {
                 "name": session_file,
                 "size": stat.st_size,
                 "modified": datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-                "path": session_path
+                "path": session_path,
+                "library": session_info.library,
+                "dc_id": session_info.dc_id,
+                "server_address": session_info.server_address,
+                "user_id": session_info.user_id,
+                "has_auth_key": session_info.has_auth_key,
             }
             
             return info
@@ -154,37 +356,60 @@ class SessionManager:
         if not os.path.exists(session_path):
             return False, "파일이 존재하지 않습니다"
             
-        if os.path.getsize(session_path) == 0:
-            return False, "파일이 비어있습니다"
-            
-        # 기본적인 파일 형식 검증 (SQLite 파일인지 확인)
-        try:
-            with open(session_path, 'rb') as f:
-                header = f.read(16)
-                if header.startswith(b'SQLite format 3'):
-                    return True, "유효한 세션 파일입니다"
-                else:
-                    return False, "올바른 세션 파일 형식이 아닙니다"
-                    
-        except Exception as e:
-            return False, f"파일 검증 중 오류: {e}"
+        # 세션 DB를 직접 읽어 형식과 인증 키를 확인 (네트워크 연결 없음)
+        info = inspect_session_file(session_path)
+        reason = info.rejection_reason()
+        if reason:
+            return False, reason
+        return True, f"유효한 {info.library} 세션 파일입니다 (DC {info.dc_id})"
 
-    def prompt_for_code(self, prompt_message):
-        text, ok = QInputDialog.getText(self.main_window, "입력 필요", prompt_message)
-        if ok and text:
-            self.worker.set_gui_input(text)
-        else:
-            self.worker.set_gui_input(None)  # 사용자가 취소한 경우
-            self.worker.stop()
+    def _record_check_result(self, job, ok, message):
+        """세션 확인 작업의 결과를 카탈로그에 기록합니다."""
+        if job.kind != "check":
+            return
+        session_file = f"{job.label}.session"
+        self.main_window.catalog.record_check_result(
+            session_file,
+            classify_result(ok, message),
+            message,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        self.main_window.session_model.refresh_entry(session_file)
 
-    def on_success(self, session_string, message):
+    def _is_only_job(self):
+        """동시에 진행 중인 다른 작업이 없는지 (결과를 대화상자로 보여줄지) 확인합니다."""
+        return self.scheduler.running_count() <= 1 and self.scheduler.pending_count() == 0
+
+    def on_job_success(self, job, session_string, message):
+        self._job_results[job.id] = (JOB_SUCCEEDED, message)
+        self._record_check_result(job, True, message)
+        self.on_success(session_string, message, show_dialog=self._is_only_job())
+
+    def on_job_failure(self, job, error_message):
+        self._job_results[job.id] = (JOB_FAILED, error_message)
+        self._record_check_result(job, False, error_message)
+        self.on_failure(error_message, show_dialog=self._is_only_job() and not job.cancel_requested)
+
+    def on_job_finished(self, job):
+        thread = self._job_threads.pop(job.id, None)
+        if thread:
+            thread.quit()
+            thread.wait()
+        status, message = self._job_results.pop(job.id, (JOB_FAILED, "작업이 결과 없이 종료되었습니다"))
+        self.scheduler.finish(job, status, message)
+        self.main_window.log(f"작업 #{job.id} ({job.label})이 완료되었습니다.")
+
+    def on_success(self, session_string, message, show_dialog=True):
         self.main_window.log(f"✅ 성공: {message}")
-        QMessageBox.information(self.main_window, "성공", message)
+        if show_dialog:
+            QMessageBox.information(self.main_window, "성공", message)
         self.main_window.set_session_string(session_string)
         self.main_window.update_session_list()
 
-    def on_failure(self, error_message):
+    def on_failure(self, error_message, show_dialog=True):
         self.main_window.log(f"❌ 오류: {error_message}", is_error=True)
+        if not show_dialog:
+            return
         
         # 더 자세한 오류 메시지 제공
         if "네트워크 연결 오류" in error_message:
@@ -202,11 +427,65 @@ class SessionManager:
             
         QMessageBox.critical(self.main_window, "오류", detailed_msg)
 
-    def on_finished(self):
-        self.main_window.set_ui_enabled(True)
-        self.main_window.log("작업이 완료되었습니다.")
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
-        self.thread = None
-        self.worker = None
+    def on_bulk_result(self, result):
+        # 결과는 워커가 이미 카탈로그에 기록했으므로 해당 행만 다시 읽습니다
+        self.main_window.session_model.refresh_entry(result.session_file)
+        icons = {"valid": "✅", "invalid": "⚠️", "network_error": "🌐"}
+        icon = icons.get(result.status, "❌")
+        self.main_window.log(
+            f"{icon} {result.session_file} [{result.status}] ({result.latency:.2f}s) {result.message}",
+            is_error=result.status != "valid",
+        )
+
+    def on_bulk_progress(self, done, total):
+        self.main_window.statusBar().showMessage(f"일괄 검사 진행: {done}/{total}")
+
+    def on_bulk_report_saved(self, job, csv_path, json_path):
+        self._job_results[job.id] = (JOB_SUCCEEDED, f"리포트: {csv_path}")
+        self.main_window.log(f"📄 일괄 검사 리포트 저장: {csv_path}, {json_path}")
+
+    def on_bulk_finished(self, job):
+        self.on_job_finished(job)
+        self.main_window.log("일괄 검사가 완료되었습니다.")
+
+    def on_import_result(self, result):
+        # 성공한 항목은 폴더 감시로 목록에 반영되므로 문제가 있는 항목만 기록합니다
+        if result.status != "imported":
+            icon = "⏭️" if result.status == "duplicate" else "❌"
+            self.main_window.log(
+                f"{icon} {result.line_no}행 [{result.status}] {result.session_file or ''} {result.message}",
+                is_error=result.status != "duplicate",
+            )
+
+    def on_import_progress(self, done, percent):
+        self.main_window.statusBar().showMessage(f"일괄 가져오기 진행: {done}개 처리 ({percent}%)")
+
+    def on_import_summary(self, job, counts):
+        message = (
+            f"성공 {counts['imported']}, 중복 {counts['duplicate']}, "
+            f"형식 오류 {counts['invalid']}, 실패 {counts['failed']}"
+        )
+        self._job_results[job.id] = (JOB_SUCCEEDED, message)
+        self.main_window.log(f"📥 일괄 가져오기 결과: {message}")
+
+    def on_import_finished(self, job):
+        self.on_job_finished(job)
+        self.main_window.log("일괄 가져오기가 완료되었습니다.")
+        self.main_window.update_session_list()
+
+    def on_export_result(self, result):
+        if not result.ok:
+            self.main_window.log(f"❌ 내보내기 실패: {result.session_file}: {result.message}", is_error=True)
+
+    def on_export_progress(self, done, total):
+        self.main_window.statusBar().showMessage(f"일괄 내보내기 진행: {done}/{total}")
+
+    def on_export_summary(self, counts):
+        self.main_window.log(f"📦 일괄 내보내기 결과: 성공 {counts['exported']}, 실패 {counts['failed']}")
+
+    def on_export_finished(self):
+        if self.export_thread:
+            self.export_thread.quit()
+            self.export_thread.wait()
+        self.export_thread = None
+        self.export_worker = None
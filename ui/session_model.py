@@ -0,0 +1,247 @@
+# ui/session_model.py
+"""세션 카탈로그를 표 형태로 보여주는 모델/뷰 구성 요소"""
+import logging
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt5.QtGui import QColor
+
+from ui.constants import SESSION_STATUS_LABELS, SESSION_TABLE_HEADERS
+
+logger = logging.getLogger(__name__)
+
+COLUMN_NAME, COLUMN_STATUS, COLUMN_DC, COLUMN_LAST_CHECKED, COLUMN_SIZE = range(5)
+
+# 변경분이 이보다 많으면 행 단위 수정 대신 모델 전체를 다시 읽습니다
+RESET_THRESHOLD = 1000
+
+STATUS_COLORS = {
+    "valid": QColor("#2ed573"),
+    "invalid": QColor("#ffa502"),
+    "network_error": QColor("#70a1ff"),
+    "error": QColor("#ff4757"),
+}
+
+
+def format_size(size):
+    """바이트 수를 읽기 쉬운 문자열로 변환합니다."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class SessionTableModel(QAbstractTableModel):
+    """
+    SessionCatalog 항목을 보관하는 표 모델.
+    뷰가 보이는 행만 data()로 요청하므로 항목 수가 많아도 위젯을 만들지 않습니다.
+    정렬은 프록시가 data()를 비교하는 대신 이 모델이 목록을 직접 정렬하고,
+    카탈로그 변경분은 이진 탐색으로 해당 행만 추가/삭제/갱신합니다.
+    """
+
+    def __init__(self, catalog, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self._entries = []
+        # 세션 파일 이름 -> 행 번호
+        self._rows = {}
+        self._sort_column = COLUMN_NAME
+        self._sort_order = Qt.AscendingOrder
+
+    # --- Qt 모델 인터페이스 ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(SESSION_TABLE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return SESSION_TABLE_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display_text(entry, column)
+        if role == Qt.ToolTipRole:
+            return entry.error or entry.last_check_message or entry.library
+        if role == Qt.ForegroundRole and column == COLUMN_STATUS:
+            return STATUS_COLORS.get("error" if entry.error else entry.last_check_status)
+        if role == Qt.TextAlignmentRole and column in (COLUMN_DC, COLUMN_SIZE):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """목록을 직접 정렬합니다 (선택 등 영구 인덱스는 유지됩니다)."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        names = [self._entries[index.row()].name for index in persistent]
+
+        self._sort_column = column
+        self._sort_order = order
+        self._entries.sort(key=self._sort_key, reverse=order == Qt.DescendingOrder)
+        self._reindex()
+
+        self.changePersistentIndexList(
+            persistent, [self.index(self._rows[name], index.column()) for name, index in zip(names, persistent)]
+        )
+        self.layoutChanged.emit()
+
+    # --- 표시/정렬/검색 ---
+
+    @staticmethod
+    def _display_text(entry, column):
+        if column == COLUMN_NAME:
+            return entry.name[: -len(".session")] if entry.name.endswith(".session") else entry.name
+        if column == COLUMN_STATUS:
+            if entry.error:
+                return SESSION_STATUS_LABELS["error"]
+            return SESSION_STATUS_LABELS.get(entry.last_check_status, "-")
+        if column == COLUMN_DC:
+            return f"DC {entry.dc_id}" if entry.dc_id else "-"
+        if column == COLUMN_LAST_CHECKED:
+            return entry.last_checked_at or "-"
+        if column == COLUMN_SIZE:
+            return format_size(entry.size)
+        return None
+
+    def _sort_key(self, entry):
+        # 이름을 두 번째 키로 두어 같은 값끼리도 순서가 항상 정해지도록 합니다
+        column = self._sort_column
+        if column == COLUMN_STATUS:
+            primary = "error" if entry.error else entry.last_check_status or ""
+        elif column == COLUMN_DC:
+            primary = entry.dc_id or 0
+        elif column == COLUMN_LAST_CHECKED:
+            primary = entry.last_checked_at or ""
+        elif column == COLUMN_SIZE:
+            primary = entry.size
+        else:
+            primary = ""
+        return primary, entry.name
+
+    def row_matches(self, row, text):
+        """행의 표시 문자열 중 하나에 text(소문자)가 포함되는지 확인합니다."""
+        entry = self._entries[row]
+        return any(text in (self._display_text(entry, column) or "").casefold() for column in range(COLUMN_SIZE))
+
+    # --- 카탈로그 연동 ---
+
+    def reload(self):
+        """카탈로그 전체를 다시 읽습니다."""
+        self.beginResetModel()
+        self._entries = self.catalog.entries()
+        if self._sort_column != COLUMN_NAME or self._sort_order != Qt.AscendingOrder:
+            self._entries.sort(key=self._sort_key, reverse=self._sort_order == Qt.DescendingOrder)
+        self._reindex()
+        self.endResetModel()
+
+    def _reindex(self):
+        self._rows = {entry.name: row for row, entry in enumerate(self._entries)}
+
+    def session_name(self, row):
+        """행 번호에 해당하는 세션 파일 이름"""
+        return self._entries[row].name
+
+    def row_of(self, name):
+        """세션 파일 이름의 행 번호 (없으면 -1)"""
+        return self._rows.get(name, -1)
+
+    def _insert_position(self, entry, exclude_row=None):
+        """현재 정렬 순서에서 entry가 들어갈 위치를 이진 탐색으로 찾습니다."""
+        key = self._sort_key(entry)
+        descending = self._sort_order == Qt.DescendingOrder
+        # exclude_row가 있으면 그 행을 뺀 목록 기준의 위치를 반환합니다
+        lo, hi = 0, len(self._entries) - (exclude_row is not None)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = mid + 1 if exclude_row is not None and mid >= exclude_row else mid
+            current = self._sort_key(self._entries[probe])
+            if (current > key) if descending else (current < key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def apply_delta(self, delta):
+        """카탈로그 변경분(CatalogDelta)만큼 행을 추가/삭제/갱신합니다."""
+        if len(delta.added) + len(delta.removed) > RESET_THRESHOLD:
+            self.reload()
+            return
+
+        # 뒤쪽 행부터 지워야 앞쪽 행 번호가 바뀌지 않습니다
+        rows = sorted((self._rows[name] for name in delta.removed if name in self._rows), reverse=True)
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._entries[row]
+            self.endRemoveRows()
+        if rows:
+            self._reindex()
+
+        inserted = False
+        for name in delta.added:
+            entry = self.catalog.get(name)
+            if entry is None or name in self._rows:
+                continue
+            row = self._insert_position(entry)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._entries.insert(row, entry)
+            self.endInsertRows()
+            inserted = True
+        if inserted:
+            self._reindex()
+
+        for name in delta.modified:
+            self.refresh_entry(name)
+
+    def refresh_entry(self, name):
+        """세션 하나의 정보를 카탈로그에서 다시 읽어 해당 행만 갱신합니다."""
+        row = self.row_of(name)
+        if row < 0:
+            return
+        entry = self.catalog.get(name)
+        if entry is None:
+            return
+
+        self._entries[row] = entry
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+        # 정렬 기준 값이 바뀌었으면 행을 제자리로 옮깁니다
+        target = self._insert_position(entry, exclude_row=row)
+        if target == row:
+            return
+        destination = target + 1 if target > row else target
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+        self._entries.insert(target, self._entries.pop(row))
+        self.endMoveRows()
+        self._reindex()
+
+
+class SessionFilterProxyModel(QSortFilterProxyModel):
+    """
+    원본 데이터를 복사하지 않고 검색만 담당하는 프록시 모델.
+    정렬은 원본 모델에 맡기고, 검색은 data() 대신 원본 항목을 직접 비교합니다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_text = ""
+
+    def set_filter_text(self, text):
+        """전화번호/상태/DC/마지막 확인 열에서 대소문자 구분 없이 검색합니다."""
+        self._filter_text = text.strip().casefold()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._filter_text:
+            return True
+        return self.sourceModel().row_matches(source_row, self._filter_text)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
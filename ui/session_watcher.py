@@ -0,0 +1,122 @@
+# ui/session_watcher.py
+"""세션 폴더 변경을 감시하여 카탈로그 변경분을 전달하는 모듈"""
+import logging
+import os
+import sqlite3
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, pyqtSignal
+
+from core.session_catalog import CatalogDelta
+from ui.constants import SESSIONS_WATCH_DEBOUNCE_MS
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogRefreshWorker(QObject):
+    """카탈로그 전체 갱신을 GUI 스레드 밖에서 실행하는 워커 (첫 실행처럼 읽을 세션 파일이 많을 때)"""
+
+    finished = pyqtSignal()
+    # 카탈로그 변경분 (CatalogDelta)
+    result = pyqtSignal(object)
+
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+
+    def run(self):
+        try:
+            self.result.emit(self.catalog.refresh())
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"카탈로그 갱신 오류: {type(e).__name__}: {e}", exc_info=True)
+        finally:
+            self.finished.emit()
+
+
+class SessionFolderWatcher(QObject):
+    """
+    세션 폴더를 QFileSystemWatcher로 감시하고, 짧은 시간 안에 몰린 변경을 한 번으로 묶어
+    카탈로그를 갱신합니다. 변경이 있을 때만 CatalogDelta를 시그널로 전달합니다.
+    """
+
+    # 카탈로그 변경분 (CatalogDelta)
+    changed = pyqtSignal(object)
+
+    def __init__(self, catalog, debounce_ms=SESSIONS_WATCH_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.path = catalog.sessions_dir
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self.refresh)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._watch()
+
+        # 백그라운드 전체 갱신 (진행 중에 요청된 갱신은 끝난 뒤 한 번에 처리)
+        self._thread = None
+        self._worker = None
+        self._pending = False
+
+    def _watch(self):
+        """폴더가 (다시) 만들어졌으면 감시 목록에 추가합니다."""
+        if os.path.isdir(self.path) and self.path not in self._watcher.directories():
+            if self._watcher.addPath(self.path):
+                logger.info(f"세션 폴더 감시 시작: {self.path}")
+            else:
+                logger.warning(f"세션 폴더 감시를 시작하지 못했습니다: {self.path}")
+
+    def _schedule(self, _path=None):
+        # 세션 DB 쓰기는 저널 파일 생성/삭제로 이벤트를 여러 번 발생시키므로 타이머를 다시 시작합니다
+        self._timer.start()
+
+    def refresh(self):
+        """카탈로그를 갱신하고 변경분이 있으면 changed 시그널을 보냅니다."""
+        self._timer.stop()
+        if self._thread is not None:
+            self._pending = True
+            return CatalogDelta()
+        self._watch()
+        delta = self.catalog.refresh()
+        if delta:
+            self.changed.emit(delta)
+        return delta
+
+    def refresh_in_background(self):
+        """카탈로그 전체 갱신을 워커 스레드에서 실행합니다. 변경분은 끝난 뒤 changed 시그널로 전달됩니다."""
+        self._timer.stop()
+        if self._thread is not None:
+            return
+        self._watch()
+
+        self._thread = QThread()
+        self._worker = CatalogRefreshWorker(self.catalog)
+        self._worker.moveToThread(self._thread)
+        self._worker.result.connect(self._on_background_result)
+        self._worker.finished.connect(self._on_background_finished)
+        self._thread.started.connect(self._worker.run)
+        self._thread.start()
+
+    def _on_background_result(self, delta):
+        if delta:
+            self.changed.emit(delta)
+
+    def _on_background_finished(self):
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
+        self._worker = None
+        if self._pending:
+            self._pending = False
+            self.refresh()
+
+    def stop(self):
+        self._timer.stop()
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
+        directories = self._watcher.directories()
+        if directories:
+            self._watcher.removePaths(directories)
@@ -1,12 +1,16 @@
 # ui/worker.py
+import concurrent.futures
+import threading
 import traceback
 import logging
 import sentry_sdk
 
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 
+from adapters.event_loop import get_background_loop
 from adapters.pyrogram_adapter import PyrogramAdapter
 from adapters.telethon_adapter import TelethonAdapter
+from core.auth_code_broker import auth_code_broker
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +27,6 @@ class Worker(QObject):
     finished = pyqtSignal()
     success = pyqtSignal(str, str)
     failure = pyqtSignal(str)
-    # 2FA 뿐만 아니라 일반 코드 입력도 처리할 수 있도록 시그널 확장
-    request_code_from_gui = pyqtSignal(str)
 
     def __init__(self, library, api_id, api_hash, phone_number, session_name, action, session_string=None):
         super().__init__()
@@ -36,8 +38,10 @@ class Worker(QObject):
         self.action = action
         self.session_string = session_string
         self.adapter = None
-        self.gui_input = None
         self._is_running = True
+        # 백그라운드 루프에서 실행 중인 어댑터 작업 (stop()에서 취소)
+        self._future = None
+        self._lock = threading.Lock()
         
         logger.info(f"Worker 초기화: library={library}, action={action}, session={session_name}")
         
@@ -76,6 +80,11 @@ class Worker(QObject):
                         level="info"
                     )
 
+            except concurrent.futures.CancelledError:
+                # stop()으로 취소됨 (어댑터가 연결을 정리한 뒤 취소를 전달)
+                logger.info(f"작업 취소됨: {self.action} {self.session_name}")
+                self.failure.emit("작업이 취소되었습니다.")
+
             except (ValueError, TypeError) as e:
                 # 입력값 관련 구체적 에러 처리
                 error_info = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
@@ -119,47 +128,73 @@ class Worker(QObject):
                 sentry_sdk.capture_exception(e)
 
             finally:
+                # 연결은 공유 루프의 풀에 남아 다음 작업에서 재사용되고, TTL이 지나면 정리됩니다
                 self.finished.emit()
 
     def _handle_creation(self):
         logger.info(f"세션 생성 작업 시작: {self.session_name}")
-        result, message = self.adapter.create_session(self.session_name, self.phone_number, self._get_code_from_gui)
+        result, message = self._run_adapter(self.adapter.create(self.session_name, self.phone_number, self._request_code))
         logger.info(f"세션 생성 결과: {result}, 메시지: {message}")
         if result:
-            session_string = self.adapter.export_session_string(self.session_name)
+            session_string = self._run_adapter(self.adapter.export(self.session_name))
             self.success.emit(session_string, message)
         else:
             self.failure.emit(message)
 
     def _handle_check(self):
         logger.info(f"세션 확인 작업 시작: {self.session_name}")
-        result, message = self.adapter.check_session(self.session_name)
+        result, message = self._run_adapter(self.adapter.check(self.session_name))
         logger.info(f"세션 확인 결과: {result}, 메시지: {message}")
         
         if result:
-            session_string = self.adapter.export_session_string(self.session_name)
+            session_string = self._run_adapter(self.adapter.export(self.session_name))
             self.success.emit(session_string, message)
         else:
             self.failure.emit(message)
 
     def _handle_string_import(self):
         logger.info(f"세션 문자열 가져오기 작업 시작: {self.session_name}")
-        result, message = self.adapter.import_session_from_string(self.session_name, self.session_string)
+        result, message = self._run_adapter(self.adapter.import_string(self.session_name, self.session_string))
         logger.info(f"세션 가져오기 결과: {result}, 메시지: {message}")
         if result:
             self.success.emit(self.session_string, message)
         else:
             self.failure.emit(message)
 
-    def _get_code_from_gui(self, prompt_message):
-        self.gui_input = None  # 이전 값 초기화
-        self.request_code_from_gui.emit(prompt_message)
-        while self.gui_input is None and self._is_running:
-            QThread.msleep(100)  # 0.1초 대기
-        return self.gui_input
-
-    def set_gui_input(self, text):
-        self.gui_input = text
+    def _run_adapter(self, coro):
+        """
+        어댑터 코루틴을 공유 백그라운드 루프에서 실행하고 결과를 기다립니다.
+        stop()이 호출되면 Future를 취소해 어댑터가 연결을 끊고 바로 돌아오게 합니다.
+
+        Raises:
+            concurrent.futures.CancelledError: 작업이 중지된 경우
+        """
+        with self._lock:
+            if not self._is_running:
+                coro.close()
+                raise concurrent.futures.CancelledError()
+            self._future = get_background_loop().submit(coro)
+        try:
+            return self._future.result()
+        finally:
+            with self._lock:
+                self._future = None
+
+    async def _request_code(self, prompt_message, is_password=False):
+        """
+        인증 코드(is_password이면 2단계 인증 비밀번호) 입력을 중개자에 요청하고 기다립니다 (백그라운드 루프에서 실행).
+        입력 패널에서 전화번호별로 표시되며, 입력이 들어오는 즉시 이어서 진행합니다.
+        """
+        if not self._is_running:
+            return None
+        return await auth_code_broker.request(self.phone_number, prompt_message, is_password=is_password, tag=self)
 
     def stop(self):
-        self._is_running = False
+        """작업을 중지합니다. 진행 중인 어댑터 작업을 취소하면 어댑터가 연결을 끊습니다."""
+        with self._lock:
+            self._is_running = False
+            future = self._future
+        # 입력을 기다리던 요청이 있으면 None으로 끝내 로그인을 중단시킵니다
+        auth_code_broker.cancel_tag(self)
+        if future is not None and not future.done():
+            future.cancel()